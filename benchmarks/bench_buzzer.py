@@ -0,0 +1,174 @@
+"""
+Test obciążeniowy serwera przycisków: setki symulowanych urządzeń na localhost.
+
+Każde urządzenie ma własne przesunięcie zegara oraz opóźnienie sieci
+(stałe, po połowie w każdą stronę, plus losowe wahania przy wysyłaniu).
+W każdej rundzie urządzenia naciskają przycisk w znanych, prawdziwych
+chwilach; mierzymy, czy serwer wskazał faktycznie najwcześniejsze
+naciśnięcie i ile trwała decyzja.
+
+Przykład:
+    python benchmarks/bench_buzzer.py --clients 300 --rounds 30 --output wyniki-buzzer.json
+"""
+import time
+import random
+import asyncio
+import logging
+import argparse
+import threading
+from bench_common import summarize, write_results, print_results
+from buzzer import BuzzerServer, BuzzerClient, TEAMS, SYNC_BURST, SYNC_BURST_INTERVAL
+
+
+class SimulatedDevice(BuzzerClient):
+    """
+    Urządzenie zawodnika z przestawionym zegarem i opóźnieniem sieci.
+
+    Args:
+        host (str): Adres serwera.
+        port (int): Port serwera.
+        team (str): 'left' lub 'right'.
+        name (str): Nazwa urządzenia.
+        offset (float): Przesunięcie zegara urządzenia w sekundach.
+        latency (float): Stałe opóźnienie w obie strony (RTT) w sekundach.
+        jitter (float): Maksymalne losowe wahanie opóźnienia w sekundach.
+        rng (random.Random): Generator losowy.
+    """
+    def __init__(self, host, port, team, name, offset, latency, jitter, rng):
+        super().__init__(host, port, team, name, clock=lambda: time.monotonic() + offset)
+        self.offset = offset
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = rng
+        self.result_at = None
+
+    def send(self, message):
+        delay = self.latency / 2 + self.rng.uniform(0, self.jitter)
+        asyncio.get_running_loop().call_later(delay, super().send, message)
+
+    def handle(self, message):
+        asyncio.get_running_loop().call_later(self.latency / 2, self._deliver, message)
+
+    def _deliver(self, message):
+        super().handle(message)
+        if message.get('t') == 'result':
+            self.result_at = time.monotonic()
+
+
+async def _press_at(device, true_time):
+    await asyncio.sleep(max(0.0, true_time - time.monotonic()))
+    # Chwila faktycznego naciśnięcia (pętla zdarzeń może obudzić urządzenie z opóźnieniem)
+    pressed = time.monotonic()
+    device.buzz(pressed + device.offset)
+    return device.name, pressed
+
+
+async def run_load_test(clients, rounds, spread, latency, jitter, skew, seed=0):
+    """
+    Przeprowadza test obciążeniowy.
+
+    Args:
+        clients (int): Liczba symulowanych urządzeń.
+        rounds (int): Liczba rund naciśnięć.
+        spread (float): Rozrzut chwil naciśnięć w rundzie w sekundach.
+        latency (float): Maksymalny RTT sieci urządzenia w sekundach.
+        jitter (float): Maksymalne losowe wahanie opóźnienia w sekundach.
+        skew (float): Maksymalne przesunięcie zegara urządzenia w sekundach.
+        seed (int): Ziarno generatora losowego.
+
+    Returns:
+        dict: Nazwa benchmarku -> statystyki.
+    """
+    rng = random.Random(seed)
+    results = []
+    decided = threading.Event()
+
+    def on_result(presses):
+        results.append((time.monotonic(), presses))
+        decided.set()
+
+    server = BuzzerServer("127.0.0.1", 0, on_result=on_result)
+    server.start()
+    devices = [
+        SimulatedDevice("127.0.0.1", server.port, TEAMS[i % 2], f"d{i}", rng.uniform(-skew, skew),
+                        rng.uniform(0, latency), jitter, random.Random(seed * 100_003 + i))
+        for i in range(clients)
+    ]
+    start = time.perf_counter()
+    readers = await asyncio.gather(*(device.connect() for device in devices))
+    connect_time = time.perf_counter() - start
+    tasks = [asyncio.ensure_future(device.run(reader)) for device, reader in zip(devices, readers)]
+    # Czekamy na serię pomiarów zegara
+    await asyncio.sleep(SYNC_BURST * SYNC_BURST_INTERVAL + 2 * latency + jitter + 0.2)
+
+    decision_latency = []
+    announce_latency = []
+    order_error = []
+    correct = 0
+    within_1ms = 0
+    for _ in range(rounds):
+        decided.clear()
+        for device in devices:
+            device.armed.clear()
+            device.result_at = None
+        server.arm()
+        await asyncio.gather(*(device.armed.wait() for device in devices))
+        base = time.monotonic() + 0.05
+        press_times = dict(await asyncio.gather(*(_press_at(device, base + rng.uniform(0, spread))
+                                                  for device in devices)))
+        while not decided.is_set():
+            await asyncio.sleep(0.001)
+        decided_at, presses = results[-1]
+        first_true = min(press_times.values())
+        winner = presses[0]
+        correct += press_times[winner.name] == first_true
+        within_1ms += press_times[winner.name] - first_true <= 0.001
+        order_error.append(press_times[winner.name] - first_true)
+        decision_latency.append(decided_at - first_true)
+        while any(device.result is None for device in devices):
+            await asyncio.sleep(0.001)
+        announce_latency.append(max(device.result_at for device in devices) - first_true)
+        # Spóźnione naciśnięcia tej rundy nie mogą trafić do następnej
+        await asyncio.sleep(latency + jitter + 0.05)
+
+    connected = server.client_count
+    for device in devices:
+        device.close()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    server.stop()
+    return {
+        'buzzer.connect_all': {'clients': clients, 'connected': connected,
+                               'seconds': round(connect_time, 3)},
+        'buzzer.correct_winner': {'rounds': rounds, 'correct': correct, 'rate': correct / rounds,
+                                  'within_1ms': within_1ms},
+        'buzzer.winner_error': summarize(order_error),
+        'buzzer.decision_after_first_press': summarize(decision_latency),
+        'buzzer.result_on_all_devices': summarize(announce_latency),
+    }
+
+
+def main(argv=None):
+    """Uruchamia test obciążeniowy serwera przycisków."""
+    parser = argparse.ArgumentParser(description="Test obciążeniowy serwera przycisków Familiady")
+    parser.add_argument("--clients", type=int, default=300, help="liczba symulowanych urządzeń")
+    parser.add_argument("--rounds", type=int, default=30, help="liczba rund naciśnięć")
+    parser.add_argument("--spread-ms", type=float, default=100, help="rozrzut chwil naciśnięć w rundzie")
+    parser.add_argument("--latency-ms", type=float, default=20, help="maksymalny RTT sieci urządzenia")
+    parser.add_argument("--jitter-ms", type=float, default=2, help="maksymalne wahanie opóźnienia")
+    parser.add_argument("--skew-ms", type=float, default=500, help="maksymalne przesunięcie zegarów")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench-buzzer.json", help="plik wynikowy JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(run_load_test(args.clients, args.rounds, args.spread_ms / 1000,
+                                        args.latency_ms / 1000, args.jitter_ms / 1000,
+                                        args.skew_ms / 1000, args.seed))
+    print_results(results)
+    write_results(args.output, "buzzer", results)
+
+
+if __name__ == "__main__":
+    main()
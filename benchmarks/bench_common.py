@@ -0,0 +1,124 @@
+"""
+Wspólne narzędzia benchmarków: syntetyczne pytania, pomiar czasu i zapis wyników.
+"""
+import os
+import sys
+import json
+import time
+import random
+import platform
+import statistics
+import subprocess
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from models import Question  # noqa: E402
+
+WORDS = ("dom", "kot", "pies", "szkoła", "wesele", "żółw", "ogród", "samochód", "rower", "las",
+         "jezioro", "góry", "morze", "chleb", "masło", "śledź", "pierogi", "bigos", "zupa", "kawa")
+
+
+def synthetic_questions(count, seed=0):
+    """
+    Tworzy powtarzalny zestaw syntetycznych pytań.
+
+    Args:
+        count (int): Liczba pytań.
+        seed (int): Ziarno generatora losowego.
+
+    Returns:
+        list: Lista obiektów Question (4-8 odpowiedzi każde).
+    """
+    rng = random.Random(seed)
+    questions = []
+    for i in range(count):
+        text = f"Pytanie {i}: " + " ".join(rng.choice(WORDS) for _ in range(5))
+        points = sorted((rng.randint(2, 40) for _ in range(rng.randint(4, 8))), reverse=True)
+        answers = [(f"{rng.choice(WORDS)} {rng.choice(WORDS)}", p) for p in points]
+        questions.append(Question(text, answers))
+    return questions
+
+
+def summarize(samples):
+    """
+    Zwraca statystyki serii pomiarów w milisekundach.
+
+    Args:
+        samples (list): Czasy w sekundach.
+
+    Returns:
+        dict: Liczba pomiarów, minimum, mediana, średnia, p95 i maksimum w ms.
+    """
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        'n': len(ms),
+        'min_ms': ms[0],
+        'median_ms': statistics.median(ms),
+        'mean_ms': statistics.fmean(ms),
+        'p95_ms': ms[min(len(ms) - 1, int(len(ms) * 0.95))],
+        'max_ms': ms[-1],
+    }
+
+
+def measure(func, repeat=20, setup=None):
+    """
+    Mierzy czas wykonania funkcji.
+
+    Args:
+        func (callable): Mierzona funkcja (bez argumentów).
+        repeat (int): Liczba pomiarów.
+        setup (callable): Funkcja wywoływana przed każdym pomiarem, poza pomiarem.
+
+    Returns:
+        dict: Statystyki z summarize().
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SRC_DIR,
+                              capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def write_results(path, suite, results):
+    """
+    Zapisuje wyniki benchmarku w formacie JSON (do porównania przez compare.py).
+
+    Args:
+        path (str): Ścieżka do pliku wynikowego.
+        suite (str): Nazwa zestawu benchmarków.
+        results (dict): Nazwa benchmarku -> statystyki.
+    """
+    document = {
+        'suite': suite,
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'git': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+    print(f"Zapisano wyniki: {path}")
+
+
+def print_results(results):
+    """Wypisuje wyniki w postaci tabeli."""
+    for name, stats in results.items():
+        if 'median_ms' in stats:
+            print(f"{name:<45} mediana {stats['median_ms']:9.3f} ms  p95 {stats['p95_ms']:9.3f} ms")
+        else:
+            print(f"{name:<45} " + "  ".join(f"{k} {v:.3f}" if isinstance(v, float) else f"{k} {v}"
+                                            for k, v in stats.items()))
@@ -0,0 +1,68 @@
+"""
+Benchmarki renderera tablicy punktowej (bez okna - sam PIL).
+
+Przykład:
+    python benchmarks/bench_dot_matrix.py --output wyniki-dot-matrix.json
+"""
+import argparse
+from bench_common import measure, write_results, print_results
+from dot_matrix import DotMatrixRenderer, GlyphAtlas, board_lines
+
+RESOLUTIONS = {'1080p': (1620, 1080), '4k': (3240, 2160)}
+
+
+def bench_resolution(name, size, repeat):
+    """
+    Mierzy budowę atlasu, pełną klatkę, klatkę przyrostową i pas wiersza.
+
+    Args:
+        name (str): Nazwa rozdzielczości.
+        size (tuple): Rozmiar tablicy w pikselach.
+        repeat (int): Liczba pomiarów.
+
+    Returns:
+        dict: Nazwa benchmarku -> statystyki.
+    """
+    results = {}
+    renderer = DotMatrixRenderer()
+    pitch = renderer.pitch_for(size)
+    results[f"{name}.atlas"] = measure(lambda: GlyphAtlas(pitch), repeat=max(1, repeat // 10))
+
+    texts = [f"{i+1}. --------------------" for i in range(6)]
+    renderer.render(board_lines(texts), size)  # atlas dla tej rozdzielczości
+    results[f"{name}.full_frame"] = measure(lambda: renderer.render(board_lines(texts), size),
+                                            repeat=repeat, setup=renderer.clear)
+
+    renderer.render(board_lines(texts), size)
+    answer = "Sałatka jarzynowa - 40 pkt"
+    step = [0]
+
+    def typing_frame():
+        # Odkrywanie odpowiedzi: jeden nowy znak na klatkę
+        step[0] = step[0] % len(answer) + 1
+        texts[0] = "1. " + answer[:step[0]]
+        renderer.render(board_lines(texts), size)
+    results[f"{name}.typing_frame"] = measure(typing_frame, repeat=repeat)
+
+    frame, _ = renderer.render(board_lines(texts), size)
+    box = renderer.row_box(2, size)
+    results[f"{name}.row_strip_rgb"] = measure(lambda: frame.crop(box).convert("RGB"), repeat=repeat)
+    return results
+
+
+def main(argv=None):
+    """Uruchamia benchmarki tablicy punktowej."""
+    parser = argparse.ArgumentParser(description="Benchmarki tablicy punktowej Familiada")
+    parser.add_argument("--repeat", type=int, default=50, help="liczba pomiarów")
+    parser.add_argument("--output", default="bench-dot-matrix.json", help="plik wynikowy JSON")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, size in RESOLUTIONS.items():
+        results.update(bench_resolution(name, size, args.repeat))
+    print_results(results)
+    write_results(args.output, "dot_matrix", results)
+
+
+if __name__ == "__main__":
+    main()
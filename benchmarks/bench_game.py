@@ -0,0 +1,110 @@
+"""
+Benchmarki logiki gry (Game) na syntetycznych bankach pytań.
+
+Przykład:
+    python benchmarks/bench_game.py --sizes 10 1000 100000 --output wyniki-game.json
+"""
+import os
+import random
+import logging
+import argparse
+import tempfile
+from bench_common import synthetic_questions, measure, write_results, print_results
+from game import Game
+
+
+def bench_size(size, repeat, seed=0):
+    """
+    Mierzy operacje Game dla banku o podanej liczbie pytań.
+
+    Args:
+        size (int): Liczba pytań w banku.
+        repeat (int): Liczba pomiarów szybkich operacji.
+        seed (int): Ziarno generatora losowego.
+
+    Returns:
+        dict: Nazwa benchmarku -> statystyki.
+    """
+    rng = random.Random(seed)
+    questions = synthetic_questions(size, seed)
+    # Operacje zależne od rozmiaru banku (zapis, import) mierzymy rzadziej przy dużych bankach
+    slow_repeat = max(3, min(repeat, 200_000 // size))
+    results = {}
+
+    def fresh_game():
+        game = Game()
+        game.questions.extend(questions)
+        return game
+
+    results['bank_extend'] = measure(fresh_game, repeat=slow_repeat)
+    game = fresh_game()
+
+    results['set_current_question'] = measure(
+        lambda: game.set_current_question(rng.randrange(size)), repeat=repeat)
+
+    def reveal_round():
+        game.set_current_question(rng.randrange(size))
+        for idx in range(len(game.current_question.answers)):
+            game.reveal_answer(idx, 'left' if idx % 2 else 'right')
+            game.is_revealed(idx)
+    results['reveal_round'] = measure(reveal_round, repeat=repeat)
+
+    def mistakes_round():
+        game.set_current_question(rng.randrange(size))
+        for _ in range(4):
+            game.add_mistake('left')
+            game.add_mistake('right')
+    results['mistakes_round'] = measure(mistakes_round, repeat=repeat)
+
+    results['search_index_build'] = measure(
+        lambda: game.search_questions("wesele"), repeat=slow_repeat,
+        setup=lambda: setattr(game, '_search_index', None))
+    results['search_query'] = measure(
+        lambda: game.search_questions(rng.choice(("wesel", "żółw", "ogrod", "pies kot", "Pytanie 1"))),
+        repeat=repeat)
+    results['add_question'] = measure(
+        lambda: game.add_question("Nowe pytanie", [("odpowiedź", 30), ("inna", 20)]), repeat=repeat)
+    results['remove_question_middle'] = measure(
+        lambda: game.remove_question(len(game.questions) // 2), repeat=min(repeat, size // 2 or 1))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "pytania.json")
+        save_game = fresh_game()
+        bank_paths = iter(os.path.join(tmp, f"pytania-{i}.db") for i in range(slow_repeat))
+        # Każdy pomiar zapisuje do nowego pliku, więc jest to pełna kopia banku
+        results['save_new_bank'] = measure(
+            lambda: save_game.save_questions(next(bank_paths)), repeat=slow_repeat)
+        bank_path = save_game.questions.path
+
+        def edit_and_save():
+            save_game.add_question("Zmienione pytanie", [("a", 50), ("b", 30)])
+            save_game.save_questions(bank_path)
+        results['save_incremental'] = measure(edit_and_save, repeat=repeat)
+        results['save_json'] = measure(lambda: save_game.save_questions(json_path), repeat=slow_repeat)
+        results['load_bank'] = measure(lambda: Game().load_questions(bank_path), repeat=slow_repeat)
+        results['load_json'] = measure(lambda: Game().load_questions(json_path), repeat=slow_repeat)
+        save_game.questions.close()
+    return results
+
+
+def main(argv=None):
+    """Uruchamia benchmarki logiki gry."""
+    parser = argparse.ArgumentParser(description="Benchmarki logiki gry Familiada")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10_000, 100_000],
+                        help="rozmiary syntetycznych banków pytań")
+    parser.add_argument("--repeat", type=int, default=200, help="liczba pomiarów szybkich operacji")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench-game.json", help="plik wynikowy JSON")
+    args = parser.parse_args(argv)
+
+    logging.getLogger().setLevel(logging.WARNING)
+    results = {}
+    for size in args.sizes:
+        for name, stats in bench_size(size, args.repeat, args.seed).items():
+            results[f"{name}[{size}]"] = stats
+    print_results(results)
+    write_results(args.output, "game", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmarki paczki pytań: otwarcie dużej paczki, wczytanie pytań i wypakowanie logo.
+
+Przykład:
+    python benchmarks/bench_pack.py --intro-mb 300 --output wyniki-pack.json
+"""
+import os
+import shutil
+import argparse
+import tempfile
+from bench_common import synthetic_questions, measure, write_results, print_results
+from question_pack import QuestionPack, build_pack
+
+
+def main(argv=None):
+    """Uruchamia benchmarki paczki pytań."""
+    parser = argparse.ArgumentParser(description="Benchmarki paczki pytań Familiada")
+    parser.add_argument("--questions", type=int, default=5000, help="liczba pytań w paczce")
+    parser.add_argument("--intro-mb", type=int, default=200, help="rozmiar logo intro w MB")
+    parser.add_argument("--repeat", type=int, default=20, help="liczba pomiarów")
+    parser.add_argument("--output", default="bench-pack.json", help="plik wynikowy JSON")
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix="familiada-pack-")
+    try:
+        intro = os.path.join(work_dir, "intro.png")
+        with open(intro, 'wb') as f:
+            for _ in range(args.intro_mb):
+                f.write(os.urandom(1 << 20))
+        pack_path = os.path.join(work_dir, "show.familiada")
+        build_pack(pack_path, synthetic_questions(args.questions), intro, title="Benchmark")
+        extract_dir = os.path.join(work_dir, "cache")
+
+        results = {}
+        results["open"] = measure(lambda: QuestionPack(pack_path, extract_dir).close(), repeat=args.repeat)
+        pack = QuestionPack(pack_path, extract_dir)
+        results["questions"] = measure(pack.questions, repeat=max(1, args.repeat // 4))
+
+        def extract_cold():
+            # Nowy obiekt paczki bez wypakowanego pliku - pełna kopia z mapy
+            QuestionPack(pack_path, extract_dir).extract(pack.intro_image)
+        results["extract_intro_cold"] = measure(extract_cold, repeat=max(1, args.repeat // 10),
+                                                setup=lambda: shutil.rmtree(extract_dir, ignore_errors=True))
+        results["extract_intro_warm"] = measure(
+            lambda: QuestionPack(pack_path, extract_dir).extract(pack.intro_image), repeat=args.repeat)
+        pack.close()
+        print_results(results)
+        write_results(args.output, "pack", results)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+Benchmarki interfejsu: panel kontroli pytań i animacje panelu TV.
+
+Bez zmiennej DISPLAY benchmark uruchamia własny wirtualny serwer X (Xvfb),
+więc działa także na serwerze CI. Mierzony jest czas wywołania, czas
+trwania poszczególnych klatek zegara animacji oraz czas do zakończenia
+animacji.
+
+Przykład:
+    python benchmarks/bench_ui.py --repeat 20 --output wyniki-ui.json
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import logging
+import argparse
+import subprocess
+from bench_common import synthetic_questions, summarize, write_results, print_results
+
+
+def start_virtual_display(size="1920x1080x24"):
+    """
+    Uruchamia Xvfb na wolnym numerze ekranu i ustawia DISPLAY.
+
+    Args:
+        size (str): Rozdzielczość i głębia kolorów ekranu.
+
+    Returns:
+        subprocess.Popen: Proces Xvfb (do zakończenia po benchmarku).
+    """
+    if not shutil.which("Xvfb"):
+        raise RuntimeError("Brak zmiennej DISPLAY i programu Xvfb - zainstaluj pakiet xvfb.")
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen(["Xvfb", "-displayfd", str(write_fd), "-screen", "0", size, "-nolisten", "tcp"],
+                               pass_fds=(write_fd,), stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+    # Xvfb wypisuje numer wybranego ekranu, gdy jest gotowy do połączeń
+    with os.fdopen(read_fd) as f:
+        display = f.readline().strip()
+    if not display:
+        process.kill()
+        raise RuntimeError("Nie udało się uruchomić Xvfb.")
+    os.environ["DISPLAY"] = f":{display}"
+    return process
+
+
+class FrameRecorder:
+    """
+    Rejestruje czas trwania i odstępy klatek zegara animacji panelu TV.
+
+    Args:
+        animator (Animator): Zegar animacji panelu.
+    """
+    def __init__(self, animator):
+        self.animator = animator
+        self.durations = []
+        self.starts = []
+        tick = animator._tick
+
+        def timed_tick():
+            start = time.perf_counter()
+            tick()
+            self.starts.append(start)
+            self.durations.append(time.perf_counter() - start)
+        # Animator planuje kolejne klatki przez self._tick, więc podmiana atrybutu wystarcza
+        animator._tick = timed_tick
+
+    def reset(self):
+        """Czyści zebrane pomiary."""
+        self.durations = []
+        self.starts = []
+
+    def intervals(self):
+        """list: Odstępy między początkami kolejnych klatek w sekundach."""
+        return [b - a for a, b in zip(self.starts, self.starts[1:])]
+
+
+def run_until_idle(root, animator, timeout=30.0):
+    """
+    Obsługuje zdarzenia Tk, dopóki wszystkie animacje się nie zakończą.
+
+    Returns:
+        float: Czas w sekundach do zakończenia animacji.
+    """
+    start = time.perf_counter()
+    while animator.stats()['active']:
+        root.update()
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError("Animacja nie zakończyła się w wyznaczonym czasie.")
+        time.sleep(0.0005)
+    root.update()
+    return time.perf_counter() - start
+
+
+def bench_animation(root, tv_panel, recorder, action, repeat, setup=None, settle=True):
+    """
+    Mierzy animację: czas wywołania, klatki i czas do zakończenia.
+
+    Args:
+        root (tk.Tk): Główne okno.
+        tv_panel (TVPanel): Panel TV.
+        recorder (FrameRecorder): Rejestrator klatek.
+        action (callable): Funkcja uruchamiająca animację.
+        repeat (int): Liczba pomiarów.
+        setup (callable): Funkcja wywoływana przed każdym pomiarem.
+        settle (bool): Czy przed pomiarem czekać na zakończenie animacji z setup.
+
+    Returns:
+        dict: Statystyki 'call', 'complete', 'frame', 'frame_interval' i liczba pominiętych klatek.
+    """
+    calls, completes, frames, intervals = [], [], [], []
+    dropped_before = tv_panel.animator.dropped_frames
+    for _ in range(repeat):
+        run_until_idle(root, tv_panel.animator)
+        if setup:
+            setup()
+        if settle:
+            run_until_idle(root, tv_panel.animator)
+        recorder.reset()
+        start = time.perf_counter()
+        action()
+        calls.append(time.perf_counter() - start)
+        completes.append(run_until_idle(root, tv_panel.animator) + calls[-1])
+        frames.extend(recorder.durations)
+        intervals.extend(recorder.intervals())
+    return {
+        'call': summarize(calls),
+        'complete': summarize(completes),
+        'frame': summarize(frames or [0.0]),
+        'frame_interval': summarize(intervals or [0.0]),
+        'dropped_frames': tv_panel.animator.dropped_frames - dropped_before,
+    }
+
+
+def run_benchmarks(repeat, bank_size, seed=0):
+    """
+    Tworzy okna aplikacji i mierzy operacje interfejsu.
+
+    Args:
+        repeat (int): Liczba pomiarów każdej operacji.
+        bank_size (int): Liczba pytań w syntetycznym banku.
+        seed (int): Ziarno generatora losowego.
+
+    Returns:
+        dict: Nazwa benchmarku -> statystyki.
+    """
+    import tkinter as tk
+    from game import Game
+    from tv_panel import TVPanel
+    from admin_panel import AdminPanel
+
+    rng = random.Random(seed)
+    root = tk.Tk()
+    game = Game()
+    game.questions.extend(synthetic_questions(bank_size, seed))
+    # Panel TV bez subskrypcji zdarzeń - metody animacji są mierzone bezpośrednio
+    tv_panel = TVPanel(root, game, subscribe=False)
+    admin_panel = AdminPanel(root, game, None, theme="light")
+    admin_panel.pack(fill="both", expand=True)
+    root.update()
+    recorder = FrameRecorder(tv_panel.animator)
+    results = {}
+
+    def pick_question():
+        game.set_current_question(rng.randrange(len(game.questions)))
+
+    samples = []
+    for _ in range(repeat):
+        pick_question()
+        start = time.perf_counter()
+        admin_panel.update_question_controls()
+        root.update_idletasks()
+        samples.append(time.perf_counter() - start)
+    results['admin.update_question_controls'] = summarize(samples)
+
+    samples = []
+    for _ in range(repeat):
+        pick_question()
+        admin_panel.update_question_controls()
+        root.update_idletasks()
+        start = time.perf_counter()
+        for idx in range(len(game.current_question.answers)):
+            admin_panel.reveal_answer(idx, 'left')
+        root.update_idletasks()
+        samples.append(time.perf_counter() - start)
+    results['admin.reveal_all_answers'] = summarize(samples)
+
+    for name, stats in bench_animation(root, tv_panel, recorder, tv_panel.animate_answers,
+                                       repeat, setup=pick_question).items():
+        results[f'tv.animate_answers.{name}'] = stats
+
+    def show_question():
+        pick_question()
+        tv_panel.animate_answers()
+
+    def reveal_all():
+        for idx in range(len(game.current_question.answers)):
+            game.reveal_answer(idx, 'left')
+            tv_panel.animate_reveal_answer(idx)
+
+    for name, stats in bench_animation(root, tv_panel, recorder, reveal_all,
+                                       repeat, setup=show_question).items():
+        results[f'tv.animate_reveal_answer.{name}'] = stats
+
+    # Pojedyncze odkrycie w trakcie wypisywania placeholderów (przerwanie animacji wiersza)
+    for name, stats in bench_animation(root, tv_panel, recorder, lambda: tv_panel.animate_reveal_answer(0),
+                                       repeat, setup=show_question, settle=False).items():
+        results[f'tv.animate_reveal_answer_interrupt.{name}'] = stats
+
+    results['tv.animator'] = tv_panel.animator.stats()
+    tv_panel.image_cache.shutdown()
+    root.destroy()
+    return results
+
+
+def main(argv=None):
+    """Uruchamia benchmarki interfejsu."""
+    parser = argparse.ArgumentParser(description="Benchmarki interfejsu Familiada")
+    parser.add_argument("--repeat", type=int, default=20, help="liczba pomiarów każdej operacji")
+    parser.add_argument("--bank-size", type=int, default=1000, help="liczba pytań w syntetycznym banku")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench-ui.json", help="plik wynikowy JSON")
+    args = parser.parse_args(argv)
+
+    logging.getLogger().setLevel(logging.WARNING)
+    xvfb = None
+    if not os.environ.get("DISPLAY"):
+        try:
+            xvfb = start_virtual_display()
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return 1
+    try:
+        results = run_benchmarks(args.repeat, args.bank_size, args.seed)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+    results = {name: stats if isinstance(stats, dict) else {'value': stats} for name, stats in results.items()}
+    print_results(results)
+    write_results(args.output, "ui", results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
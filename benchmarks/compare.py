@@ -0,0 +1,60 @@
+"""
+Porównuje dwa pliki wyników benchmarków (mediany) i oznacza regresje.
+
+Przykład:
+    python benchmarks/compare.py przed.json po.json --threshold 10
+"""
+import sys
+import json
+import argparse
+
+
+def load(path):
+    """Wczytuje plik wyników zapisany przez bench_common.write_results."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(base, new, threshold):
+    """
+    Porównuje mediany benchmarków obecnych w obu plikach.
+
+    Args:
+        base (dict): Wyniki odniesienia.
+        new (dict): Nowe wyniki.
+        threshold (float): Zmiana w procentach, powyżej której wynik jest oznaczany.
+
+    Returns:
+        list: Krotki (nazwa, mediana przed, mediana po, zmiana w %, oznaczenie).
+    """
+    rows = []
+    for name, stats in new['results'].items():
+        before = base['results'].get(name, {}).get('median_ms')
+        after = stats.get('median_ms')
+        if before is None or after is None:
+            continue
+        change = (after - before) / before * 100 if before else 0.0
+        mark = "wolniej" if change > threshold else "szybciej" if change < -threshold else ""
+        rows.append((name, before, after, change, mark))
+    return rows
+
+
+def main(argv=None):
+    """Wypisuje porównanie dwóch plików wyników."""
+    parser = argparse.ArgumentParser(description="Porównanie wyników benchmarków")
+    parser.add_argument("base", help="plik wyników odniesienia")
+    parser.add_argument("new", help="plik nowych wyników")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="próg zmiany mediany w procentach")
+    args = parser.parse_args(argv)
+
+    base, new = load(args.base), load(args.new)
+    print(f"{base.get('git')} -> {new.get('git')}")
+    rows = compare(base, new, args.threshold)
+    for name, before, after, change, mark in rows:
+        print(f"{name:<50} {before:10.3f} -> {after:10.3f} ms  {change:+7.1f}%  {mark}")
+    return 1 if any(mark == "wolniej" for *_, mark in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,37 +1,36 @@
+import queue
+import threading
 import tkinter as tk
 from tkinter import messagebox, simpledialog, filedialog
-from game import Game
+from game import Game, QuestionFileError
+from virtual_list import VirtualList
+from batched_view import BatchedSubscriber
+from events import BuzzerWon, QuestionSelected, GameReset, AnswerRevealed
+from tracing import tracer
+from fonts import fonts
 
 class AdminPanel(tk.Frame):
     """
     Panel Administratora do zarządzania grą Familiada.
 
+    Panel zmienia stan gry, a widoki (panel TV, monitor prowadzącego,
+    pasek wyników) aktualizują się na podstawie zdarzeń Game.events.
+
     Parametry:
         master (tk.Tk): Główne okno aplikacji.
         game (Game): Instancja logiki gry.
-        tv_panel (TVPanel): Panel wyświetlający informacje na ekranie.
         sound_manager (SoundManager): Obiekt do obsługi dźwięków.
     """
-    def __init__(self, master, game, tv_panel, sound_manager, theme=None):
-        # Automatyczne wykrywanie motywu systemowego przy użyciu darkdetect, jeśli theme nie jest podany
-        try:
-            import darkdetect
-            if theme is None:
-                theme = "dark" if darkdetect.isDark() else "light"
-        except ImportError:
-            if theme is None:
-                theme = "light"
-        self.theme = theme
-        if theme == "dark":
-            self.team1_color = "#E57373"
-            self.team2_color = "#64B5F6"
-        else:
-            self.team1_color = "red"
-            self.team2_color = "blue"
-        
+    def __init__(self, master, game, sound_manager, theme=None):
         super().__init__(master)
+        # Motyw systemowy (darkdetect) wykrywany jest w tle, aby nie opóźniać pokazania okna
+        self._detected_theme = None
+        self.set_theme(theme or "light")
+        if theme is None:
+            threading.Thread(target=self._detect_theme, name="theme-detect", daemon=True).start()
+            self.after(50, self._apply_detected_theme)
+
         self.game = game
-        self.tv_panel = tv_panel
         self.sound_manager = sound_manager
         master.title("Panel Administratora - Familiada")
         master.geometry("1200x700")
@@ -39,182 +38,442 @@ class AdminPanel(tk.Frame):
         # Pasek z nazwami drużyn i wynikami
         header_frame = tk.Frame(self)
         header_frame.pack(side="top", fill="x", pady=5)
-        self.team1_label = tk.Label(header_frame, text=self.game.team1_name, font=("Arial", 20, "bold"), fg=self.team1_color)
+        self.team1_label = tk.Label(header_frame, text=self.game.team1_name, font=fonts.get("Arial", 20, "bold"), fg=self.team1_color)
         self.team1_label.pack(side="left", padx=20)
-        self.team2_label = tk.Label(header_frame, text=self.game.team2_name, font=("Arial", 20, "bold"), fg=self.team2_color)
+        self.team2_label = tk.Label(header_frame, text=self.game.team2_name, font=fonts.get("Arial", 20, "bold"), fg=self.team2_color)
         self.team2_label.pack(side="right", padx=20)
 
         # Lewy panel – przyciski sterujące i lista pytań
         self.left_frame = tk.Frame(self)
         self.left_frame.pack(side="left", fill="y", padx=10, pady=10)
 
-        self.start_button = tk.Button(self.left_frame, text="Start", font=("Arial", 16),
+        self.start_button = tk.Button(self.left_frame, text="Start", font=fonts.get("Arial", 16),
                                       command=self.start_game)
         self.start_button.pack(pady=5)
-        self.stop_button = tk.Button(self.left_frame, text="STOP", font=("Arial", 16),
+        self.stop_button = tk.Button(self.left_frame, text="STOP", font=fonts.get("Arial", 16),
                                      command=self.stop_game)
         self.stop_button.pack(pady=5)
-        self.change_names_button = tk.Button(self.left_frame, text="Zmień nazwy drużyn", font=("Arial", 16),
+        self.change_names_button = tk.Button(self.left_frame, text="Zmień nazwy drużyn", font=fonts.get("Arial", 16),
                                              command=self.change_team_names)
         self.change_names_button.pack(pady=5)
 
-        tk.Label(self.left_frame, text="Lista pytań:", font=("Arial", 16)).pack(pady=(10, 0))
-        self.question_listbox = tk.Listbox(self.left_frame, width=60, font=("Arial", 14))
+        tk.Label(self.left_frame, text="Lista pytań:", font=fonts.get("Arial", 16)).pack(pady=(10, 0))
+        # Wyszukiwarka - filtruje listę przy każdym naciśnięciu klawisza
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", lambda *args: self.apply_search())
+        self.search_results = None  # indeksy pytań pasujących do filtra lub None
+        tk.Entry(self.left_frame, textvariable=self.search_var, width=60, font=fonts.get("Arial", 14)).pack(pady=(5, 0))
+        self.question_listbox = VirtualList(self.left_frame, self.question_row_count,
+                                            self.question_row_titles, width=60, font=("Arial", 14))
         self.question_listbox.pack(pady=5)
         self.question_listbox.bind("<<ListboxSelect>>", self.on_question_select)
-        self.update_question_listbox()
 
-        self.add_question_button = tk.Button(self.left_frame, text="Dodaj pytanie", font=("Arial", 14),
+        self.add_question_button = tk.Button(self.left_frame, text="Dodaj pytanie", font=fonts.get("Arial", 14),
                                              command=self.open_add_question_window)
         self.add_question_button.pack(pady=5)
-        self.load_questions_button = tk.Button(self.left_frame, text="Wczytaj pytania", font=("Arial", 14),
+        self.remove_question_button = tk.Button(self.left_frame, text="Usuń pytanie", font=fonts.get("Arial", 14),
+                                                command=self.remove_question)
+        self.remove_question_button.pack(pady=5)
+        self.load_questions_button = tk.Button(self.left_frame, text="Wczytaj pytania", font=fonts.get("Arial", 14),
                                                command=self.load_questions)
         self.load_questions_button.pack(pady=5)
-        self.save_questions_button = tk.Button(self.left_frame, text="Zapisz pytania", font=("Arial", 14),
+        self.save_questions_button = tk.Button(self.left_frame, text="Zapisz pytania", font=fonts.get("Arial", 14),
                                                command=self.save_questions)
         self.save_questions_button.pack(pady=5)
 
         # Prawy panel – szczegóły aktualnego pytania oraz przyciski odkrywania odpowiedzi
         self.right_frame = tk.Frame(self)
         self.right_frame.pack(side="right", fill="both", expand=True, padx=10, pady=10)
+        self.build_question_controls()
         self.update_question_controls()
+        self._subscription = BatchedSubscriber(game.events, self, self.handle_events)
+
+    def handle_events(self, events):
+        """Pokazuje drużynę, która pierwsza nacisnęła przycisk w bieżącej rundzie."""
+        for event in events:
+            if isinstance(event, BuzzerWon):
+                team_name = self.game.team1_name if event.team == 'left' else self.game.team2_name
+                who = f"{team_name} ({event.name})" if event.name else team_name
+                self.buzz_label.config(text=f"Pierwszy przycisk: {who}",
+                                       fg=self.team1_color if event.team == 'left' else self.team2_color)
+                self.answer_team.set(event.team)
+            elif isinstance(event, (QuestionSelected, GameReset)):
+                self.buzz_label.config(text="")
+                self.answer_var.set("")
+            elif isinstance(event, AnswerRevealed):
+                self.suggest_answer(self.answer_var.get())
+
+    def _detect_theme(self):
+        # Wykonywane w wątku tła
+        try:
+            import darkdetect
+            self._detected_theme = "dark" if darkdetect.isDark() else "light"
+        except Exception:
+            self._detected_theme = "light"
+
+    def _apply_detected_theme(self):
+        if self._detected_theme is None:
+            self.after(50, self._apply_detected_theme)
+        elif self._detected_theme != self.theme:
+            self.set_theme(self._detected_theme)
+
+    def set_theme(self, theme):
+        """
+        Ustawia motyw kolorystyczny panelu.
+
+        Args:
+            theme (str): "dark" lub "light".
+        """
+        self.theme = theme
+        if theme == "dark":
+            self.team1_color = "#E57373"
+            self.team2_color = "#64B5F6"
+            self.suggestion_color = "#6D5F00"
+        else:
+            self.team1_color = "red"
+            self.team2_color = "blue"
+            self.suggestion_color = "#FFF176"
+        if hasattr(self, "team1_label"):
+            self.team1_label.config(fg=self.team1_color)
+            self.team2_label.config(fg=self.team2_color)
 
     def start_game(self):
         """Rozpoczyna grę, uruchamia intro na panelu TV."""
-        self.tv_panel.start_intro()
+        self.game.start_intro()
+        if self.sound_manager:
+            self.sound_manager.play("start")
 
     def stop_game(self):
         """Resetuje stan gry po potwierdzeniu od użytkownika."""
         if messagebox.askyesno("STOP", "Czy na pewno chcesz zresetować punkty i pytania?"):
             self.game.reset_game()
-            self.tv_panel.reset_screen()
+            if self.sound_manager:
+                self.sound_manager.stop_music()
             self.update_question_listbox()
             self.update_question_controls()
-            self.tv_panel.update_error_panels()
 
     def change_team_names(self):
         """Pozwala zmienić nazwy drużyn."""
         new_left = simpledialog.askstring("Zmiana nazwy", "Podaj nazwę dla drużyny LEWEJ:", initialvalue=self.game.team1_name)
         new_right = simpledialog.askstring("Zmiana nazwy", "Podaj nazwę dla drużyny PRAWEJ:", initialvalue=self.game.team2_name)
-        if new_left:
-            self.game.team1_name = new_left
-        if new_right:
-            self.game.team2_name = new_right
-        self.tv_panel.update_score_labels()
+        self.game.set_team_names(new_left, new_right)
         self.team1_label.config(text=f"{self.game.team1_name}: {self.game.team1_score}", fg=self.team1_color)
         self.team2_label.config(text=f"{self.game.team2_name}: {self.game.team2_score}", fg=self.team2_color)
         self.update_question_controls()
 
+    def question_row_count(self):
+        """Zwraca liczbę wierszy listy pytań z uwzględnieniem filtra."""
+        if self.search_results is not None:
+            return len(self.search_results)
+        return len(self.game.questions)
+
+    def question_row_titles(self, start, stop):
+        """Zwraca etykiety wierszy listy pytań z podanego zakresu."""
+        if self.search_results is not None:
+            indices = self.search_results[start:stop]
+            titles = self.game.questions.titles_at(indices)
+        else:
+            indices = range(start, stop)
+            titles = self.game.questions.titles(start, stop)
+        return [f"{idx+1}. {title}" for idx, title in zip(indices, titles)]
+
+    def selected_question_index(self):
+        """Zwraca indeks w banku pytania zaznaczonego na liście lub None."""
+        selection = self.question_listbox.curselection()
+        if not selection:
+            return None
+        if self.search_results is not None:
+            return self.search_results[selection[0]]
+        return selection[0]
+
+    def apply_search(self):
+        """Filtruje listę pytań według tekstu z wyszukiwarki."""
+        query = self.search_var.get()
+        self.search_results = self.game.search_questions(query) if query.strip() else None
+        self.question_listbox.selection_clear()
+        self.question_listbox.reload()
+
     def update_question_listbox(self):
-        """Aktualizuje listę pytań wyświetlaną w panelu administratora."""
-        self.question_listbox.delete(0, tk.END)
-        for idx, q in enumerate(self.game.questions):
-            self.question_listbox.insert(tk.END, f"{idx+1}. {q['question']}")
+        """Odświeża całą listę pytań, np. po wczytaniu nowego banku."""
+        self.apply_search()
+
+    def on_question_added(self):
+        """Dopisuje do listy pytanie dodane na końcu banku."""
+        if self.search_results is not None:
+            self.apply_search()
+        else:
+            self.question_listbox.row_inserted(len(self.game.questions) - 1)
 
     def on_question_select(self, event):
         """Obsługuje wybór pytania z listy."""
-        selection = self.question_listbox.curselection()
-        if selection:
-            index = selection[0]
-            self.game.set_current_question(index)
-            self.tv_panel.animate_answers()
+        index = self.selected_question_index()
+        if index is not None:
+            trace = tracer.begin("question")
+            self.game.set_current_question(index, trace)
             self.update_question_controls()
             # Odtworzenie dźwięku po wybraniu pytania
             if self.sound_manager:
-                self.sound_manager.play("question_intro")
+                self.sound_manager.play("question_intro", trace)
 
-    def update_question_controls(self):
-        """Aktualizuje panel kontroli pytań na podstawie aktualnie wybranego pytania."""
-        for widget in self.right_frame.winfo_children():
-            widget.destroy()
-        if self.game.current_question is None:
-            tk.Label(self.right_frame, text="Wybierz pytanie z listy", font=("Arial", 20)).pack()
-            return
-        tk.Label(self.right_frame, text=self.game.current_question['question'],
-                font=("Arial", 20)).pack(pady=10)
-
-        answers_frame = tk.Frame(self.right_frame)
-        answers_frame.pack(pady=10)
-        for idx, ans in enumerate(self.game.current_question['answers']):
-            revealed = ans['revealed']
-            row_frame = tk.Frame(answers_frame)
-            row_frame.grid(row=idx, column=0, pady=5, sticky="w")
-            text = f"{idx+1}. {ans['answer']} - {ans['points']} pkt"
-            tk.Label(row_frame, text=text, font=("Arial", 16), anchor="w").grid(row=0, column=0, padx=5)
-            btn_left = tk.Button(row_frame, text="Odkryj", font=("Arial", 14),
-                                 command=lambda i=idx: self.reveal_answer(i, 'left'))
-            btn_left.grid(row=0, column=1, padx=5)
-            btn_right = tk.Button(row_frame, text="Odkryj", font=("Arial", 14),
-                                  command=lambda i=idx: self.reveal_answer(i, 'right'))
-            btn_right.grid(row=0, column=2, padx=5)
-            if revealed:
-                btn_left.config(state="disabled")
-                btn_right.config(state="disabled")
+    def build_question_controls(self):
+        """Tworzy stałe widżety panelu kontroli pytań."""
+        self.no_question_label = tk.Label(self.right_frame, text="Wybierz pytanie z listy", font=fonts.get("Arial", 20))
+        self.controls_frame = tk.Frame(self.right_frame)
+        self.question_label = tk.Label(self.controls_frame, text="", font=fonts.get("Arial", 20))
+        self.question_label.pack(pady=10)
+        self.buzz_label = tk.Label(self.controls_frame, text="", font=fonts.get("Arial", 16, "bold"))
+        self.buzz_label.pack()
+
+        # Wypowiedź zawodnika - podpowiedź pasującej odpowiedzi, Enter ją odkrywa
+        match_frame = tk.Frame(self.controls_frame)
+        match_frame.pack(pady=(10, 0))
+        tk.Label(match_frame, text="Odpowiedź zawodnika:", font=fonts.get("Arial", 14)).grid(row=0, column=0, padx=5)
+        self.answer_var = tk.StringVar()
+        self.answer_var.trace_add("write", lambda *args: self.suggest_answer(self.answer_var.get()))
+        self.answer_entry = tk.Entry(match_frame, textvariable=self.answer_var, width=30, font=fonts.get("Arial", 14))
+        self.answer_entry.grid(row=0, column=1, padx=5)
+        self.answer_entry.bind("<Return>", lambda event: self.confirm_suggestion())
+        self.answer_entry.bind("<Escape>", lambda event: self.answer_var.set(""))
+        self.answer_team = tk.StringVar(value='left')
+        tk.Radiobutton(match_frame, text="Lewa", variable=self.answer_team, value='left',
+                       font=fonts.get("Arial", 14)).grid(row=0, column=2)
+        tk.Radiobutton(match_frame, text="Prawa", variable=self.answer_team, value='right',
+                       font=fonts.get("Arial", 14)).grid(row=0, column=3)
+        self.suggestion_label = tk.Label(self.controls_frame, text="", font=fonts.get("Arial", 14))
+        self.suggestion_label.pack()
+        self.suggested_index = None
+
+        self.answers_frame = tk.Frame(self.controls_frame)
+        self.answers_frame.pack(pady=10)
+        self.answer_rows = []  # pula wierszy odpowiedzi, używana ponownie dla kolejnych pytań
+        self.answer_row_state = []  # ostatnio wyświetlony stan (tekst, odkryta) każdego wiersza
 
         # Przyciski do rejestrowania błędów (dodają żółte X)
-        error_frame = tk.Frame(self.right_frame)
+        error_frame = tk.Frame(self.controls_frame)
         error_frame.pack(pady=10)
-        btn_error_left = tk.Button(error_frame, text="Błąd", font=("Arial", 14),
+        btn_error_left = tk.Button(error_frame, text="Błąd", font=fonts.get("Arial", 14),
                                    command=lambda: self.add_error('left'))
         btn_error_left.grid(row=0, column=0, padx=10)
-        btn_error_right = tk.Button(error_frame, text="Błąd", font=("Arial", 14),
+        btn_error_right = tk.Button(error_frame, text="Błąd", font=fonts.get("Arial", 14),
                                     command=lambda: self.add_error('right'))
         btn_error_right.grid(row=0, column=1, padx=10)
 
         # Przyciski "Błąd narada" – pokazują duże czerwone X
-        consult_frame = tk.Frame(self.right_frame)
+        consult_frame = tk.Frame(self.controls_frame)
         consult_frame.pack(pady=10)
-        btn_consult_left = tk.Button(consult_frame, text="Błąd narada", font=("Arial", 14),
-                                     command=lambda: self.tv_panel.show_big_x('left'))
+        btn_consult_left = tk.Button(consult_frame, text="Błąd narada", font=fonts.get("Arial", 14),
+                                     command=lambda: self.consultation_mistake('left'))
         btn_consult_left.grid(row=0, column=0, padx=10)
-        btn_consult_right = tk.Button(consult_frame, text="Błąd narada", font=("Arial", 14),
-                                      command=lambda: self.tv_panel.show_big_x('right'))
+        btn_consult_right = tk.Button(consult_frame, text="Błąd narada", font=fonts.get("Arial", 14),
+                                      command=lambda: self.consultation_mistake('right'))
         btn_consult_right.grid(row=0, column=1, padx=10)
+        self.controls_visible = None
+
+    def _create_answer_row(self, idx):
+        """Tworzy wiersz odpowiedzi w puli (etykieta i dwa przyciski 'Odkryj')."""
+        row_frame = tk.Frame(self.answers_frame)
+        label = tk.Label(row_frame, text="", font=fonts.get("Arial", 16), anchor="w")
+        label.grid(row=0, column=0, padx=5)
+        self._answer_label_bg = label.cget("bg")
+        btn_left = tk.Button(row_frame, text="Odkryj", font=fonts.get("Arial", 14),
+                             command=lambda: self.reveal_answer(idx, 'left'))
+        btn_left.grid(row=0, column=1, padx=5)
+        btn_right = tk.Button(row_frame, text="Odkryj", font=fonts.get("Arial", 14),
+                              command=lambda: self.reveal_answer(idx, 'right'))
+        btn_right.grid(row=0, column=2, padx=5)
+        self.answer_rows.append((row_frame, label, btn_left, btn_right))
+        self.answer_row_state.append(None)
+
+    def update_answer_row(self, idx):
+        """
+        Aktualizuje jeden wiersz odpowiedzi, zmieniając tylko to, co się zmieniło.
+
+        Args:
+            idx (int): Indeks odpowiedzi.
+        """
+        ans = self.game.current_question.answers[idx]
+        state = (f"{idx+1}. {ans.text} - {ans.points} pkt", self.game.is_revealed(idx))
+        previous = self.answer_row_state[idx]
+        if state == previous:
+            return
+        row_frame, label, btn_left, btn_right = self.answer_rows[idx]
+        if previous is None:
+            row_frame.grid(row=idx, column=0, pady=5, sticky="w")
+        if previous is None or previous[0] != state[0]:
+            label.config(text=state[0])
+        if previous is None or previous[1] != state[1]:
+            button_state = "disabled" if state[1] else "normal"
+            btn_left.config(state=button_state)
+            btn_right.config(state=button_state)
+        self.answer_row_state[idx] = state
+
+    def update_question_controls(self):
+        """Aktualizuje panel kontroli pytań na podstawie aktualnie wybranego pytania."""
+        has_question = self.game.current_question is not None
+        if has_question != self.controls_visible:
+            if has_question:
+                self.no_question_label.pack_forget()
+                self.controls_frame.pack(fill="both", expand=True)
+            else:
+                self.controls_frame.pack_forget()
+                self.no_question_label.pack()
+            self.controls_visible = has_question
+        if not has_question:
+            return
+        question_text = self.game.current_question.text
+        if self.question_label.cget("text") != question_text:
+            self.question_label.config(text=question_text)
+
+        answers_count = len(self.game.current_question.answers)
+        while len(self.answer_rows) < answers_count:
+            self._create_answer_row(len(self.answer_rows))
+        for idx in range(answers_count):
+            self.update_answer_row(idx)
+        # Nadmiarowe wiersze z puli są ukrywane, a nie niszczone
+        for idx in range(answers_count, len(self.answer_rows)):
+            if self.answer_row_state[idx] is not None:
+                self.answer_rows[idx][0].grid_remove()
+                self.answer_row_state[idx] = None
+
+    def suggest_answer(self, text):
+        """
+        Wyróżnia odpowiedź najlepiej pasującą do wypowiedzi zawodnika.
+
+        Wywoływane przy każdej zmianie pola odpowiedzi; może je też wywołać
+        moduł rozpoznawania mowy z transkrypcją wypowiedzi.
+
+        Args:
+            text (str): Wypowiedź zawodnika.
+        """
+        matches = self.game.match_answer(text, limit=1) if text.strip() else []
+        index = matches[0][0] if matches else None
+        if index != self.suggested_index:
+            if self.suggested_index is not None and self.suggested_index < len(self.answer_rows):
+                self.answer_rows[self.suggested_index][1].config(bg=self._answer_label_bg)
+            if index is not None:
+                self.answer_rows[index][1].config(bg=self.suggestion_color)
+            self.suggested_index = index
+        if matches:
+            answer = self.game.current_question.answers[index]
+            self.suggestion_label.config(text=f"Enter: {index+1}. {answer.text} ({matches[0][1]:.0%})")
+        else:
+            self.suggestion_label.config(text="Brak pasującej odpowiedzi" if text.strip() else "")
+
+    def confirm_suggestion(self):
+        """Odkrywa wyróżnioną odpowiedź dla wybranej drużyny."""
+        if self.suggested_index is None:
+            self.bell()
+            return
+        self.reveal_answer(self.suggested_index, self.answer_team.get())
+        self.answer_var.set("")
 
     def reveal_answer(self, index, team):
         """Odkrywa odpowiedź i aktualizuje punkty."""
-        self.game.reveal_answer(index, team)
-        self.update_question_controls()
-        self.tv_panel.animate_reveal_answer(index)
-        if self.sound_manager and self.sound_manager.sounds.get("reveal"):
-            self.sound_manager.play("reveal")
+        trace = tracer.begin("reveal")
+        self.game.reveal_answer(index, team, trace)
+        self.update_answer_row(index)
+        if self.sound_manager:
+            self.sound_manager.play("reveal", trace)
 
     def add_error(self, team):
         """Rejestruje błąd dla danej drużyny i aktualizuje panel błędów."""
         if self.game.current_question is None:
             messagebox.showinfo("Informacja", "Wybierz pytanie z listy!")
             return
-        success = self.game.add_mistake(team)
+        trace = tracer.begin("mistake")
+        success = self.game.add_mistake(team, trace)
         if success:
-            if self.sound_manager and self.sound_manager.sounds.get("error"):
-                self.sound_manager.play("error")
+            if self.sound_manager:
+                self.sound_manager.play("error", trace)
         else:
             messagebox.showinfo("Informacja", f"Osiągnięto maksymalną liczbę błędów dla drużyny {team.upper()}.")
-        self.tv_panel.update_error_panels()
+
+    def consultation_mistake(self, team):
+        """Pokazuje duże X błędu podczas narady i odtwarza dźwięk błędu."""
+        self.game.consultation_mistake(team)
+        if self.sound_manager:
+            self.sound_manager.play("error")
 
     def open_add_question_window(self):
         """Otwiera okno do dodawania nowego pytania."""
         AddQuestionWindow(self, self.game)
 
+    def remove_question(self):
+        """Usuwa zaznaczone pytanie po potwierdzeniu od użytkownika."""
+        index = self.selected_question_index()
+        if index is None:
+            messagebox.showinfo("Informacja", "Wybierz pytanie z listy!")
+            return
+        if messagebox.askyesno("Usuń pytanie", "Czy na pewno chcesz usunąć wybrane pytanie?"):
+            was_current = self.game.current_question_index == index
+            try:
+                self.game.remove_question(index)
+            except QuestionFileError as e:
+                messagebox.showerror("Błąd", str(e))
+                return
+            if self.search_results is not None:
+                self.apply_search()
+            else:
+                self.question_listbox.row_removed(index)
+            if was_current:
+                self.update_question_controls()
+
     def load_questions(self):
-        """Wczytuje pytania z pliku JSON."""
+        """Wczytuje pytania z banku pytań, paczki pytań lub z pliku JSON."""
         file_path = filedialog.askopenfilename(
             title="Wybierz plik z pytaniami",
-            filetypes=[("JSON files", "*.json")]
+            filetypes=[("Question banks", "*.db"), ("Question packs", "*.familiada"), ("JSON files", "*.json")]
         )
         if file_path:
-            self.game.load_questions(file_path)
+            pack = self.game.pack
+            try:
+                self.game.load_questions(file_path)
+            except QuestionFileError as e:
+                messagebox.showerror("Błąd", str(e))
+                return
+            if self.game.pack is not pack and self.sound_manager:
+                # Dźwięki z nowej paczki (lub z assets, gdy paczka ich nie zawiera)
+                self.sound_manager.register_defaults()
+                self.sound_manager.load_sounds()
             self.update_question_listbox()
 
     def save_questions(self):
-        """Zapisuje pytania do pliku JSON."""
+        """Zapisuje pytania do banku pytań lub do pliku JSON."""
         file_path = filedialog.asksaveasfilename(
             title="Zapisz pytania",
-            defaultextension=".json",
-            filetypes=[("JSON files", "*.json")]
+            defaultextension=".db",
+            filetypes=[("Question banks", "*.db"), ("JSON files", "*.json")]
         )
         if file_path:
-            self.game.save_questions(file_path)
+            results = queue.Queue()
+            try:
+                self.game.save_questions_async(file_path, results.put)
+            except QuestionFileError as e:
+                messagebox.showerror("Błąd", str(e))
+                return
+            self._set_bank_buttons_state("disabled")
+            self.after(50, self._finish_save, results)
+
+    def _set_bank_buttons_state(self, state):
+        """Blokuje lub odblokowuje przyciski zmieniające bank pytań (na czas zapisu)."""
+        for button in (self.add_question_button, self.remove_question_button,
+                       self.load_questions_button, self.save_questions_button):
+            button.config(state=state)
+
+    def _finish_save(self, results):
+        """Czeka na zakończenie zapisu w tle, przełącza grę na zapisany bank i informuje o błędzie."""
+        try:
+            error = results.get_nowait()
+        except queue.Empty:
+            self.after(50, self._finish_save, results)
+            return
+        try:
+            self.game.finish_save()
+        except QuestionFileError as e:
+            error = error or e
+        self._set_bank_buttons_state("normal")
+        if error is not None:
+            messagebox.showerror("Błąd", str(error))
 
 class AddQuestionWindow(tk.Toplevel):
     """
@@ -226,8 +485,8 @@ class AddQuestionWindow(tk.Toplevel):
         self.game = game
         self.title("Dodaj nowe pytanie")
         self.geometry("500x500")
-        tk.Label(self, text="Pytanie:", font=("Arial", 16)).pack(pady=5)
-        self.question_entry = tk.Entry(self, width=60, font=("Arial", 14))
+        tk.Label(self, text="Pytanie:", font=fonts.get("Arial", 16)).pack(pady=5)
+        self.question_entry = tk.Entry(self, width=60, font=fonts.get("Arial", 14))
         self.question_entry.pack(pady=5)
 
         self.answers_entries = []
@@ -235,17 +494,17 @@ class AddQuestionWindow(tk.Toplevel):
         for i in range(5):
             frame = tk.Frame(self)
             frame.pack(pady=3)
-            tk.Label(frame, text=f"Odpowiedź {i+1}:", font=("Arial", 14)).pack(side="left")
-            ans_entry = tk.Entry(frame, width=30, font=("Arial", 14))
+            tk.Label(frame, text=f"Odpowiedź {i+1}:", font=fonts.get("Arial", 14)).pack(side="left")
+            ans_entry = tk.Entry(frame, width=30, font=fonts.get("Arial", 14))
             ans_entry.pack(side="left", padx=5)
-            tk.Label(frame, text="Pkt:", font=("Arial", 14)).pack(side="left")
-            pts_entry = tk.Entry(frame, width=5, font=("Arial", 14))
+            tk.Label(frame, text="Pkt:", font=fonts.get("Arial", 14)).pack(side="left")
+            pts_entry = tk.Entry(frame, width=5, font=fonts.get("Arial", 14))
             pts_entry.pack(side="left", padx=5)
             self.answers_entries.append(ans_entry)
             self.points_entries.append(pts_entry)
 
         self.add_btn = tk.Button(
-            self, text="Dodaj pytanie", font=("Arial", 16),
+            self, text="Dodaj pytanie", font=fonts.get("Arial", 16),
             command=self.add_question
         )
         self.add_btn.pack(pady=10)
@@ -269,8 +528,12 @@ class AddQuestionWindow(tk.Toplevel):
         if not answers:
             messagebox.showerror("Błąd", "Dodaj przynajmniej jedną odpowiedź")
             return
-        self.game.add_question(question_text, answers)
-        self.parent.update_question_listbox()
+        try:
+            self.game.add_question(question_text, answers)
+        except QuestionFileError as e:
+            messagebox.showerror("Błąd", str(e), parent=self)
+            return
+        self.parent.on_question_added()
         self.destroy()
 
 if __name__ == "__main__":
@@ -293,13 +556,13 @@ if __name__ == "__main__":
     ])
 
     from tv_panel import TVPanel
-    tv_panel = TVPanel(root, game, None)
+    tv_panel = TVPanel(root, game)
     try:
         from sound_manager import SoundManager
         sound_manager = SoundManager()
     except ImportError:
         sound_manager = None
 
-    admin_panel = AdminPanel(root, game, tv_panel, sound_manager)
+    admin_panel = AdminPanel(root, game, sound_manager)
     admin_panel.pack(fill="both", expand=True)
     root.mainloop()
@@ -0,0 +1,198 @@
+import json
+import logging
+from utils import fold_words
+
+# Minimalna ocena, od której odpowiedź jest proponowana operatorowi
+MIN_SCORE = 0.5
+# Wspólny początek słów, od którego traktujemy je jako odmiany (np. "morze" i "morzem")
+MIN_STEM = 4
+# Końcówki fleksyjne (po fold_words) - słowa o wspólnym temacie są odmianami tylko wtedy,
+# gdy różnią się taką końcówką ("samochód"/"samochodem", ale nie "samolot"/"samochód")
+ENDINGS = frozenset((
+    "", "a", "e", "i", "o", "u", "y", "em", "om", "ow", "mi", "ie", "ia", "iu", "ej", "ym", "im",
+    "ach", "ami", "owi", "ego", "emu", "ych", "ich", "ymi", "imi", "iem", "owie",
+))
+# Literówka nie zmienia długości słowa o więcej niż tyle liter; przy większej różnicy
+# podobieństwo bigramów jest obniżane (np. "kość" i "kościół" mają wspólne prawie
+# wszystkie bigramy krótszego słowa)
+MAX_TYPO_LENGTH_DIFF = 2
+# Liczba ostatnio wybranych pytań, których klucze odpowiedzi są pamiętane
+KEY_CACHE_SIZE = 1024
+
+
+def _bigrams(word):
+    padded = f" {word} "
+    return frozenset(padded[i:i + 2] for i in range(len(padded) - 1))
+
+
+def _is_inflection(a, b, stem):
+    """Czy słowa o wspólnym początku długości stem różnią się tylko końcówką fleksyjną."""
+    # Wspólny początek może zawierać początek końcówki ("morz-e" i "morz-em")
+    for cut in range(stem, max(MIN_STEM, stem - 2) - 1, -1):
+        if a[cut:] in ENDINGS and b[cut:] in ENDINGS:
+            return True
+    return False
+
+
+def _word_similarity(a, a_bigrams, b, b_bigrams):
+    """Podobieństwo dwóch słów (0.0-1.0): odmiana przez końcówkę albo literówki."""
+    if a == b:
+        return 1.0
+    stem = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        stem += 1
+    longest = max(len(a), len(b))
+    if stem >= MIN_STEM and _is_inflection(a, b, stem):
+        return 0.8 + 0.2 * stem / longest
+    score = 2 * len(a_bigrams & b_bigrams) / (len(a_bigrams) + len(b_bigrams))
+    if longest - min(len(a), len(b)) > MAX_TYPO_LENGTH_DIFF:
+        score *= min(len(a), len(b)) / longest
+    return score
+
+
+def load_synonyms(file_path):
+    """
+    Wczytuje grupy synonimów z pliku JSON (lista list, np. [["auto", "samochód"]]).
+
+    Args:
+        file_path (str): Ścieżka do pliku.
+
+    Returns:
+        list: Lista grup synonimów (pusta, gdy pliku nie da się wczytać).
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            groups = json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning("Nie udało się wczytać synonimów z %s: %s", file_path, e)
+        return []
+    return [group for group in groups if isinstance(group, list)]
+
+
+class AnswerMatcher:
+    """
+    Dopasowuje odpowiedź zawodnika (wpisaną lub z transkrypcji mowy) do
+    odpowiedzi bieżącego pytania.
+
+    Klucze odpowiedzi (tekst po fold_words, warianty rozdzielone "/" w treści
+    odpowiedzi oraz synonimy) są przygotowywane przy wyborze pytania
+    (prepare), więc rank() tylko je przegląda. Klucze ostatnich
+    KEY_CACHE_SIZE pytań są pamiętane - symulator meczów wybiera wciąż te
+    same pytania i nie przelicza ich co rundę. Ranking jednej wypowiedzi to
+    kilkadziesiąt operacji na małych zbiorach bigramów.
+
+    Args:
+        synonyms (list): Grupy synonimów, np. [["auto", "samochód", "wóz"]].
+    """
+    def __init__(self, synonyms=()):
+        self._synonyms = {}  # słowo lub fraza po fold_words -> pozostałe elementy grupy
+        self._question = None
+        self._keys = []  # dla każdej odpowiedzi: lista kluczy [(słowo, bigramy, waga)]
+        self._phrases = []  # dla każdej odpowiedzi: zbiór pełnych kluczy
+        self._cache = {}  # krotka tekstów odpowiedzi -> (klucze, frazy), od najdawniej użytych
+        self.set_synonyms(synonyms)
+
+    def set_synonyms(self, groups):
+        """
+        Ustawia grupy synonimów.
+
+        Args:
+            groups (list): Lista grup synonimów.
+        """
+        self._synonyms = {}
+        for group in groups:
+            folded = [fold_words(str(item)) for item in group]
+            for item in folded:
+                self._synonyms.setdefault(item, []).extend(other for other in folded if other != item)
+        self._cache.clear()
+        self._keys, self._phrases = self._keys_for(self._question)
+
+    def _variants(self, answer_text):
+        phrases = {fold_words(part) for part in answer_text.split("/")}
+        for phrase in list(phrases):
+            phrases.update(self._synonyms.get(phrase, ()))
+            words = phrase.split()
+            for i, word in enumerate(words):
+                for synonym in self._synonyms.get(word, ()):
+                    phrases.add(" ".join(words[:i] + [synonym] + words[i + 1:]))
+        phrases.discard("")
+        return phrases
+
+    def prepare(self, question):
+        """
+        Ustawia pytanie, do którego odpowiedzi będą dopasowywane wypowiedzi,
+        i przygotowuje klucze jego odpowiedzi.
+
+        Args:
+            question (Question): Pytanie (None czyści dopasowanie).
+        """
+        self._question = question
+        self._keys, self._phrases = self._keys_for(question)
+
+    def _keys_for(self, question):
+        if question is None:
+            return [], []
+        texts = tuple(answer.text for answer in question.answers)
+        cached = self._cache.pop(texts, None)
+        if cached is None:
+            cached = self._build_keys(texts)
+            if len(self._cache) >= KEY_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+        self._cache[texts] = cached
+        return cached
+
+    def _build_keys(self, texts):
+        keys = []
+        phrases_list = []
+        for text in texts:
+            phrases = self._variants(text)
+            phrases_list.append(phrases)
+            keys.append([
+                [(word, _bigrams(word), len(word)) for word in phrase.split()]
+                for phrase in phrases
+            ])
+        return keys, phrases_list
+
+    def rank(self, text, exclude_mask=0, limit=None):
+        """
+        Ocenia dopasowanie wypowiedzi do odpowiedzi pytania.
+
+        Ocena klucza to średnia (ważona długością słów) podobieństwa każdego
+        słowa klucza do najlepiej pasującego słowa wypowiedzi, więc dodatkowe
+        słowa ("chyba", "no to") nie obniżają oceny.
+
+        Args:
+            text (str): Wypowiedź zawodnika.
+            exclude_mask (int): Maska bitowa odpowiedzi pomijanych (np. odkrytych).
+            limit (int): Maksymalna liczba wyników.
+
+        Returns:
+            list: Krotki (indeks odpowiedzi, ocena 0.0-1.0) malejąco po ocenie,
+                tylko z oceną co najmniej MIN_SCORE.
+        """
+        phrase = fold_words(text)
+        if not phrase:
+            return []
+        words = [(word, _bigrams(word)) for word in phrase.split()]
+        results = []
+        for index, keys in enumerate(self._keys):
+            if exclude_mask >> index & 1:
+                continue
+            if phrase in self._phrases[index]:
+                results.append((index, 1.0))
+                continue
+            best = 0.0
+            for key in keys:
+                total = weight = 0.0
+                for key_word, key_bigrams, key_weight in key:
+                    total += key_weight * max(_word_similarity(key_word, key_bigrams, word, bigrams)
+                                              for word, bigrams in words)
+                    weight += key_weight
+                if total > best * weight:
+                    best = total / weight
+            if best >= MIN_SCORE:
+                results.append((index, best))
+        results.sort(key=lambda item: -item[1])
+        return results[:limit] if limit else results
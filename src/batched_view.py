@@ -0,0 +1,56 @@
+import tkinter as tk
+
+
+class BatchedSubscriber:
+    """
+    Zbiera zdarzenia i przekazuje je widokowi paczką, raz na obieg pętli Tk.
+
+    Kilka zmian stanu w jednej akcji operatora (np. odkrycie odpowiedzi
+    i zmiana wyniku) powoduje więc jedno przerysowanie widoku zamiast kilku.
+    Subskrypcja kończy się sama, gdy widżet zostanie zniszczony (<Destroy>).
+
+    Args:
+        bus (EventBus): Szyna zdarzeń gry.
+        widget (tk.Misc): Widżet, którego pętla zdarzeń wywołuje handler.
+        handler (callable): Funkcja przyjmująca listę zdarzeń.
+    """
+    def __init__(self, bus, widget, handler):
+        self.bus = bus
+        self.widget = widget
+        self.handler = handler
+        self._pending = []
+        self._after_id = None
+        bus.subscribe(self._on_event)
+        # add="+" nie zastępuje własnych powiązań <Destroy> widżetu
+        widget.bind("<Destroy>", self._on_destroy, add="+")
+
+    def _on_destroy(self, event):
+        # Zdarzenie <Destroy> okna przychodzi też dla każdego z jego dzieci
+        if event.widget is self.widget:
+            self.close()
+
+    def _on_event(self, event):
+        self._pending.append(event)
+        if self._after_id is None:
+            try:
+                self._after_id = self.widget.after_idle(self.flush)
+            except tk.TclError:
+                self.close()
+
+    def flush(self):
+        """Przekazuje widokowi zebrane zdarzenia."""
+        self._after_id = None
+        events, self._pending = self._pending, []
+        if events:
+            self.handler(events)
+
+    def close(self):
+        """Kończy subskrypcję."""
+        self.bus.unsubscribe(self._on_event)
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        self._pending = []
@@ -0,0 +1,422 @@
+"""
+Serwer przycisków (buzzerów) dla urządzeń zawodników.
+
+Zawodnicy łączą się przez TCP (np. telefony w sieci Wi-Fi studia) i wysyłają
+linie JSON:
+    {"t": "hello", "team": "left", "name": "Jan"}  - przedstawienie się,
+    {"t": "pong", "id": ..., "c": ...}              - odpowiedź na pomiar zegara,
+    {"t": "buzz", "c": ...}                         - naciśnięcie (czas zegara klienta).
+Serwer wysyła:
+    {"t": "ping", "id": ...}                         - pomiar przesunięcia zegara,
+    {"t": "armed"}                                   - przyciski aktywne,
+    {"t": "result", "team": ..., "name": ...}        - kto był pierwszy.
+
+Kolejność naciśnięć ustalana jest według czasu serwera (time.monotonic):
+czas naciśnięcia z zegara klienta jest przeliczany z użyciem przesunięcia
+zegara oszacowanego z pomiaru o najmniejszym RTT, jak w NTP. Czas wysłania
+pingu zna tylko serwer (klient odsyła jego numer), więc klient nie może
+zawyżyć zmierzonego RTT, odsyłając stary czas, i w ten sposób poszerzyć
+sobie okna, o które może cofnąć naciśnięcie.
+"""
+import json
+import time
+import queue
+import socket
+import asyncio
+import logging
+import threading
+from collections import deque
+from events import QuestionSelected
+
+DEFAULT_PORT = 8766
+# Pomiary zegara: kilka szybkich na początku, potem co SYNC_INTERVAL sekund
+SYNC_BURST = 5
+SYNC_BURST_INTERVAL = 0.05
+SYNC_INTERVAL = 1.0
+SYNC_SAMPLES = 8
+# Naciśnięcie może być najwyżej tyle sekund starsze od odbioru (ochrona przed złym zegarem)
+MAX_PRESS_AGE = 1.0
+# Granice okna oczekiwania na wcześniejsze naciśnięcia, które jeszcze są w drodze
+MIN_DECISION_WINDOW = 0.002
+MAX_DECISION_WINDOW = 0.15
+DECISION_MARGIN = 0.003
+# Odpowiedź na ping po tylu sekundach (lub na nieznany ping) jest ignorowana - ogranicza
+# zmierzone RTT, a więc i to, o ile klient może cofnąć czas naciśnięcia
+PING_TIMEOUT = MAX_DECISION_WINDOW
+TEAMS = ('left', 'right')
+
+
+def encode(message):
+    """Koduje wiadomość jako zwartą linię JSON."""
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class ClockEstimator:
+    """
+    Szacuje przesunięcie zegara klienta względem zegara serwera.
+
+    Z ostatnich pomiarów wybierany jest ten o najmniejszym czasie obiegu
+    (RTT), bo jest najmniej zaburzony kolejkowaniem w sieci.
+    """
+    def __init__(self, samples=SYNC_SAMPLES):
+        self._samples = deque(maxlen=samples)  # (rtt, przesunięcie)
+
+    def add(self, sent, client_time, received):
+        """
+        Dodaje pomiar.
+
+        Args:
+            sent (float): Czas serwera wysłania pingu.
+            client_time (float): Czas zegara klienta w chwili odpowiedzi.
+            received (float): Czas serwera odbioru odpowiedzi.
+        """
+        rtt = received - sent
+        self._samples.append((rtt, client_time - (sent + rtt / 2)))
+
+    @property
+    def synced(self):
+        """bool: True, jeśli jest przynajmniej jeden pomiar."""
+        return bool(self._samples)
+
+    @property
+    def offset(self):
+        """float: Przesunięcie zegara klienta (zegar klienta - zegar serwera) w sekundach."""
+        return min(self._samples)[1]
+
+    @property
+    def one_way(self):
+        """float: Typowe (medianowe) opóźnienie w jedną stronę z ostatnich pomiarów."""
+        if not self._samples:
+            return MAX_DECISION_WINDOW
+        rtts = sorted(rtt for rtt, _ in self._samples)
+        return rtts[len(rtts) // 2] / 2
+
+    @property
+    def max_one_way(self):
+        """float: Największe oszacowane opóźnienie w jedną stronę z ostatnich pomiarów."""
+        return max(rtt for rtt, _ in self._samples) / 2 if self._samples else MAX_DECISION_WINDOW
+
+    def to_server_time(self, client_time, received):
+        """
+        Przelicza czas klienta na czas serwera.
+
+        Args:
+            client_time (float): Czas naciśnięcia według zegara klienta.
+            received (float): Czas serwera odbioru naciśnięcia.
+
+        Returns:
+            float: Szacowany czas naciśnięcia według zegara serwera.
+        """
+        if not self._samples or client_time is None:
+            return received - (min(self._samples)[0] / 2 if self._samples else 0.0)
+        estimate = client_time - self.offset
+        # Naciśnięcie nie mogło nastąpić po odbiorze ani wcześniej, niż pozwala zmierzone
+        # opóźnienie sieci - klient z przestawionym zegarem nie wygra w ten sposób
+        earliest = received - min(MAX_PRESS_AGE, 2 * self.max_one_way + DECISION_MARGIN)
+        return min(received, max(estimate, earliest))
+
+
+class Press:
+    """Naciśnięcie przycisku przez zawodnika."""
+    __slots__ = ('team', 'name', 'press_time', 'received')
+
+    def __init__(self, team, name, press_time, received):
+        self.team = team
+        self.name = name
+        self.press_time = press_time
+        self.received = received
+
+    def __repr__(self):
+        return f"Press({self.team!r}, {self.name!r}, {self.press_time:.6f})"
+
+
+class BuzzerServer:
+    """
+    Serwer asyncio przyjmujący połączenia wielu urządzeń zawodników.
+
+    Po uzbrojeniu (arm) serwer zbiera naciśnięcia. Po pierwszym odebranym
+    naciśnięciu czeka tylko tyle, ile mogą jeszcze iść przez sieć
+    naciśnięcia wcześniejsze (na podstawie zmierzonych opóźnień klientów),
+    po czym ogłasza zwycięzcę.
+
+    Args:
+        host (str): Adres nasłuchiwania.
+        port (int): Port nasłuchiwania (0 - dowolny wolny).
+        on_result (callable): Funkcja wywoływana w wątku serwera z listą
+            naciśnięć Press posortowaną od najwcześniejszego.
+    """
+    def __init__(self, host="0.0.0.0", port=DEFAULT_PORT, on_result=None):
+        self.host = host
+        self.port = port
+        self.on_result = on_result
+        self.armed = False
+        self._clients = {}  # writer -> {'team', 'name', 'clock'}
+        self._presses = []
+        self._decision = None
+        self._loop = None
+        self._server = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="buzzer", daemon=True)
+
+    def start(self):
+        """Uruchamia serwer i czeka, aż zacznie nasłuchiwać."""
+        self._thread.start()
+        self._ready.wait()
+        if self._server is None:
+            raise OSError(f"Nie udało się uruchomić serwera przycisków na {self.host}:{self.port}")
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle_client, self.host, self.port, backlog=1024))
+            self.port = self._server.sockets[0].getsockname()[1]
+            logging.info("Serwer przycisków nasłuchuje na %s:%d", self.host, self.port)
+        except OSError as e:
+            logging.error("Błąd serwera przycisków: %s", e)
+            self._loop.close()
+            self._loop = None
+            return
+        finally:
+            self._ready.set()
+        self._loop.run_forever()
+
+    @property
+    def client_count(self):
+        """int: Liczba połączonych urządzeń."""
+        return len(self._clients)
+
+    async def _handle_client(self, reader, writer):
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client = {'team': None, 'name': None, 'clock': ClockEstimator(),
+                  'pings': {}, 'next_ping': 0}  # pings: numer pingu -> czas wysłania
+        self._clients[writer] = client
+        sync_task = asyncio.ensure_future(self._sync_clock(writer, client))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                received = time.monotonic()
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                kind = message.get('t')
+                if kind == 'pong':
+                    self._on_pong(client, message, received)
+                elif kind == 'buzz':
+                    self._on_buzz(client, message.get('c'), received)
+                elif kind == 'hello' and message.get('team') in TEAMS:
+                    client['team'] = message['team']
+                    client['name'] = str(message.get('name') or "")
+                    if self.armed:
+                        writer.write(encode({'t': 'armed'}))
+        except (ConnectionError, KeyError, TypeError, ValueError, AttributeError):
+            pass
+        finally:
+            sync_task.cancel()
+            self._clients.pop(writer, None)
+            writer.close()
+
+    @staticmethod
+    def _send_ping(writer, client):
+        now = time.monotonic()
+        pings = client['pings']
+        for ping_id in [i for i, sent in pings.items() if now - sent > PING_TIMEOUT]:
+            del pings[ping_id]
+        ping_id = client['next_ping']
+        client['next_ping'] += 1
+        pings[ping_id] = now
+        writer.write(encode({'t': 'ping', 'id': ping_id}))
+
+    async def _sync_clock(self, writer, client):
+        for i in range(SYNC_BURST):
+            self._send_ping(writer, client)
+            await asyncio.sleep(SYNC_BURST_INTERVAL)
+        while True:
+            await asyncio.sleep(SYNC_INTERVAL)
+            self._send_ping(writer, client)
+
+    @staticmethod
+    def _on_pong(client, message, received):
+        # Każdy ping liczy się raz; nieznany, powtórzony lub spóźniony jest pomijany
+        sent = client['pings'].pop(message.get('id'), None)
+        if sent is None or received - sent > PING_TIMEOUT:
+            return
+        client['clock'].add(sent, float(message['c']), received)
+
+    def _on_buzz(self, client, client_time, received):
+        if not self.armed or client['team'] is None:
+            return
+        press = Press(client['team'], client['name'], client['clock'].to_server_time(client_time, received), received)
+        self._presses.append(press)
+        if self._decision is None:
+            # Czekamy, aż mogłyby dotrzeć naciśnięcia wcześniejsze od tego; mediana
+            # zamiast maksimum, by pojedynczy zator sieci nie wydłużał każdej decyzji
+            one_way = max((c['clock'].one_way for c in self._clients.values() if c['team']), default=0.0)
+            window = press.press_time + one_way + DECISION_MARGIN - received
+            window = min(MAX_DECISION_WINDOW, max(MIN_DECISION_WINDOW, window))
+            self._decision = self._loop.call_later(window, self._decide)
+
+    def _decide(self):
+        self._decision = None
+        self.armed = False
+        presses = sorted(self._presses, key=lambda p: p.press_time)
+        self._presses = []
+        winner = presses[0]
+        data = encode({'t': 'result', 'team': winner.team, 'name': winner.name})
+        for writer in list(self._clients):
+            writer.write(data)
+        if self.on_result:
+            self.on_result(presses)
+
+    def _arm(self):
+        if self._decision is not None:
+            self._decision.cancel()
+            self._decision = None
+        self._presses = []
+        self.armed = True
+        data = encode({'t': 'armed'})
+        for writer in list(self._clients):
+            writer.write(data)
+
+    def arm(self):
+        """Aktywuje przyciski na nową rundę (bezpieczne z dowolnego wątku)."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._arm)
+
+    def stop(self):
+        """Zatrzymuje serwer i rozłącza urządzenia."""
+        if self._loop is None or self._server is None:
+            return
+
+        async def shutdown():
+            self._server.close()
+            for writer in list(self._clients):
+                writer.close()
+            await asyncio.sleep(0)
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=2)
+        except Exception as e:
+            logging.warning("Błąd przy zatrzymywaniu serwera przycisków: %s", e)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=2)
+
+
+class GameBuzzer:
+    """
+    Łączy serwer przycisków z grą.
+
+    Wybór pytania uzbraja przyciski, a zwycięzca jest przekazywany do
+    Game.set_buzz_winner w wątku Tk, skąd zdarzenie trafia do widoków.
+
+    Args:
+        game (Game): Silnik gry.
+        widget (tk.Misc): Widżet, którego pętla zdarzeń odbiera wyniki.
+        host (str): Adres nasłuchiwania.
+        port (int): Port nasłuchiwania.
+    """
+    POLL_MS = 5
+
+    def __init__(self, game, widget, host="0.0.0.0", port=DEFAULT_PORT):
+        self.game = game
+        self.widget = widget
+        self._results = queue.Queue()
+        self.server = BuzzerServer(host, port, on_result=self._results.put)
+        game.events.subscribe(self._on_game_event)
+
+    def start(self):
+        """Uruchamia serwer i odbieranie wyników."""
+        self.server.start()
+        self._poll()
+
+    def _on_game_event(self, event):
+        if isinstance(event, QuestionSelected) and event.index is not None:
+            self.server.arm()
+
+    def _poll(self):
+        try:
+            while True:
+                presses = self._results.get_nowait()
+                winner = presses[0]
+                self.game.set_buzz_winner(winner.team, winner.name)
+        except queue.Empty:
+            pass
+        self.widget.after(self.POLL_MS, self._poll)
+
+    def stop(self):
+        """Zatrzymuje serwer przycisków."""
+        self.game.events.unsubscribe(self._on_game_event)
+        self.server.stop()
+
+
+class BuzzerClient:
+    """
+    Prosty klient przycisku (do testów i symulacji urządzeń zawodników).
+
+    Args:
+        host (str): Adres serwera.
+        port (int): Port serwera.
+        team (str): 'left' lub 'right'.
+        name (str): Imię zawodnika.
+        clock (callable): Zegar klienta (domyślnie time.monotonic).
+    """
+    def __init__(self, host, port, team, name="", clock=time.monotonic):
+        self.host = host
+        self.port = port
+        self.team = team
+        self.name = name
+        self.clock = clock
+        self.armed = asyncio.Event()
+        self.result = None
+        self._writer = None
+
+    async def connect(self):
+        """Łączy się z serwerem i przedstawia zawodnika."""
+        reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.send({'t': 'hello', 'team': self.team, 'name': self.name})
+        return reader
+
+    def send(self, message):
+        """Wysyła wiadomość do serwera."""
+        self._writer.write(encode(message))
+
+    async def run(self, reader):
+        """Odpowiada na pomiary zegara i zapisuje wyniki, aż do rozłączenia."""
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            self.handle(json.loads(line))
+
+    def handle(self, message):
+        """Obsługuje wiadomość od serwera."""
+        kind = message.get('t')
+        if kind == 'ping':
+            self.send({'t': 'pong', 'id': message['id'], 'c': self.clock()})
+        elif kind == 'armed':
+            self.result = None
+            self.armed.set()
+        elif kind == 'result':
+            self.result = message
+            self.armed.clear()
+
+    def buzz(self, press_time=None):
+        """
+        Wysyła naciśnięcie.
+
+        Args:
+            press_time (float): Czas naciśnięcia według zegara klienta (domyślnie teraz).
+        """
+        self.send({'t': 'buzz', 'c': self.clock() if press_time is None else press_time})
+
+    def close(self):
+        """Zamyka połączenie."""
+        if self._writer is not None:
+            self._writer.close()
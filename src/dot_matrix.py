@@ -0,0 +1,433 @@
+"""
+Tablica odpowiedzi w stylu wyświetlacza punktowego (jak w studiu Familiady).
+
+Znaki są rysowane z wbudowanej czcionki 5x7 punktów (z polskimi literami
+złożonymi ze znaku bazowego i znaku diakrytycznego), więc tryb nie wymaga
+instalowania czcionki "familiada". Renderer (PIL) buduje atlas kafelków
+znaków dla danej wielkości punktu, składa z nich klatki tablicy i trzyma je
+w pamięci podręcznej według stanu tablicy i rozdzielczości. Zmiana stanu
+kopiuje poprzednią klatkę i nakłada tylko zmienione komórki.
+"""
+import re
+import tkinter as tk
+from collections import OrderedDict
+from PIL import Image, ImageDraw, ImageTk
+
+# Rozmiar tablicy w znakach (jak tablica w studiu)
+BOARD_COLUMNS = 30
+BOARD_ROWS = 10
+# Komórka znaku: 5x9 punktów (wiersz nad i pod literą na znaki diakrytyczne)
+# plus kolumna i wiersz odstępu
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 9
+CELL_WIDTH = GLYPH_WIDTH + 1
+CELL_HEIGHT = GLYPH_HEIGHT + 1
+# Paleta: tło, zgaszony punkt, zapalony punkt
+PALETTE = (0, 0, 0, 40, 34, 10, 255, 214, 0)
+BACKGROUND, DOT_OFF, DOT_ON = 0, 1, 2
+# Układ wiersza odpowiedzi jak na tablicy w studiu: numer (" 1. "), tekst odpowiedzi
+# dopełniony lub przycięty do szerokości, odstęp, punkty wyrównane do prawej i margines
+NUMBER_COLUMNS = 4
+POINTS_COLUMNS = 3
+RIGHT_MARGIN = 1
+# "N. tekst odpowiedzi - P pkt" (punkty opcjonalne, np. w placeholderach "N. -----")
+_ANSWER_PATTERN = re.compile(r"^(\d+)\.\s+(.*?)(?:\s+-\s+(\d+)\s*pkt)?$", re.IGNORECASE | re.DOTALL)
+
+# Czcionka 5x7: wiersze od góry, "1" - zapalony punkt
+FONT_5X7 = {
+    'A': ("01110", "10001", "10001", "11111", "10001", "10001", "10001"),
+    'B': ("11110", "10001", "10001", "11110", "10001", "10001", "11110"),
+    'C': ("01110", "10001", "10000", "10000", "10000", "10001", "01110"),
+    'D': ("11100", "10010", "10001", "10001", "10001", "10010", "11100"),
+    'E': ("11111", "10000", "10000", "11110", "10000", "10000", "11111"),
+    'F': ("11111", "10000", "10000", "11110", "10000", "10000", "10000"),
+    'G': ("01110", "10001", "10000", "10111", "10001", "10001", "01111"),
+    'H': ("10001", "10001", "10001", "11111", "10001", "10001", "10001"),
+    'I': ("01110", "00100", "00100", "00100", "00100", "00100", "01110"),
+    'J': ("00111", "00010", "00010", "00010", "00010", "10010", "01100"),
+    'K': ("10001", "10010", "10100", "11000", "10100", "10010", "10001"),
+    'L': ("10000", "10000", "10000", "10000", "10000", "10000", "11111"),
+    'M': ("10001", "11011", "10101", "10101", "10001", "10001", "10001"),
+    'N': ("10001", "10001", "11001", "10101", "10011", "10001", "10001"),
+    'O': ("01110", "10001", "10001", "10001", "10001", "10001", "01110"),
+    'P': ("11110", "10001", "10001", "11110", "10000", "10000", "10000"),
+    'Q': ("01110", "10001", "10001", "10001", "10101", "10010", "01101"),
+    'R': ("11110", "10001", "10001", "11110", "10100", "10010", "10001"),
+    'S': ("01111", "10000", "10000", "01110", "00001", "00001", "11110"),
+    'T': ("11111", "00100", "00100", "00100", "00100", "00100", "00100"),
+    'U': ("10001", "10001", "10001", "10001", "10001", "10001", "01110"),
+    'V': ("10001", "10001", "10001", "10001", "10001", "01010", "00100"),
+    'W': ("10001", "10001", "10001", "10101", "10101", "10101", "01010"),
+    'X': ("10001", "10001", "01010", "00100", "01010", "10001", "10001"),
+    'Y': ("10001", "10001", "10001", "01010", "00100", "00100", "00100"),
+    'Z': ("11111", "00001", "00010", "00100", "01000", "10000", "11111"),
+    'Ł': ("01000", "01000", "01100", "11000", "01000", "01000", "01111"),
+    '0': ("01110", "10001", "10011", "10101", "11001", "10001", "01110"),
+    '1': ("00100", "01100", "00100", "00100", "00100", "00100", "01110"),
+    '2': ("01110", "10001", "00001", "00010", "00100", "01000", "11111"),
+    '3': ("11111", "00010", "00100", "00010", "00001", "10001", "01110"),
+    '4': ("00010", "00110", "01010", "10010", "11111", "00010", "00010"),
+    '5': ("11111", "10000", "11110", "00001", "00001", "10001", "01110"),
+    '6': ("00110", "01000", "10000", "11110", "10001", "10001", "01110"),
+    '7': ("11111", "00001", "00010", "00100", "01000", "01000", "01000"),
+    '8': ("01110", "10001", "10001", "01110", "10001", "10001", "01110"),
+    '9': ("01110", "10001", "10001", "01111", "00001", "00010", "01100"),
+    ' ': ("00000",) * 7,
+    '.': ("00000", "00000", "00000", "00000", "00000", "01100", "01100"),
+    ',': ("00000", "00000", "00000", "00000", "01100", "00100", "01000"),
+    '-': ("00000", "00000", "00000", "11111", "00000", "00000", "00000"),
+    ':': ("00000", "01100", "01100", "00000", "01100", "01100", "00000"),
+    '!': ("00100", "00100", "00100", "00100", "00100", "00000", "00100"),
+    '?': ("01110", "10001", "00001", "00010", "00100", "00000", "00100"),
+    '/': ("00000", "00001", "00010", "00100", "01000", "10000", "00000"),
+    '(': ("00010", "00100", "01000", "01000", "01000", "00100", "00010"),
+    ')': ("01000", "00100", "00010", "00010", "00010", "00100", "01000"),
+    "'": ("01100", "00100", "01000", "00000", "00000", "00000", "00000"),
+    '"': ("01010", "01010", "01010", "00000", "00000", "00000", "00000"),
+    '%': ("11000", "11001", "00010", "00100", "01000", "10011", "00011"),
+    '+': ("00000", "00100", "00100", "11111", "00100", "00100", "00000"),
+    '=': ("00000", "00000", "11111", "00000", "11111", "00000", "00000"),
+}
+# Znak wyświetlany zamiast znaków spoza czcionki
+UNKNOWN_GLYPH = ("11111", "10001", "10001", "10001", "10001", "10001", "11111")
+# Polskie litery: (znak bazowy, wiersz nad literą, wiersz pod literą)
+DIACRITICS = {
+    'Ą': ('A', "00000", "00011"),
+    'Ć': ('C', "00010", "00000"),
+    'Ę': ('E', "00000", "00011"),
+    'Ń': ('N', "00010", "00000"),
+    'Ó': ('O', "00010", "00000"),
+    'Ś': ('S', "00010", "00000"),
+    'Ź': ('Z', "00010", "00000"),
+    'Ż': ('Z', "00100", "00000"),
+}
+
+
+def glyph_rows(char):
+    """
+    Zwraca wzór znaku w komórce 5x9.
+
+    Args:
+        char (str): Znak (małe litery są zamieniane na wielkie).
+
+    Returns:
+        tuple: 9 napisów po 5 znaków "0"/"1", od góry.
+    """
+    char = char.upper()
+    if char in DIACRITICS:
+        base, above, below = DIACRITICS[char]
+        return (above,) + FONT_5X7[base] + (below,)
+    return ("00000",) + FONT_5X7.get(char, UNKNOWN_GLYPH) + ("00000",)
+
+
+def answer_line(text, columns=BOARD_COLUMNS, visible=None):
+    """
+    Układa wiersz odpowiedzi na tablicy.
+
+    Wiersz "N. tekst - P pkt" dostaje stałe kolumny: numer, tekst odpowiedzi
+    (przycinany, gdy jest za długi - punkty nigdy nie są obcinane) i punkty
+    wyrównane do prawej. Inne teksty są wyrównywane do lewej za numerem.
+
+    Args:
+        text (str): Pełny tekst wiersza.
+        columns (int): Liczba kolumn tablicy.
+        visible (int): Liczba pierwszych znaków text wypisanych do tej pory
+            (animacja odkrywania); znaki pojawiają się od razu w docelowych
+            kolumnach. None - cały tekst.
+
+    Returns:
+        str: Napis o długości columns (wielkie litery).
+    """
+    if visible is None:
+        visible = len(text)
+    match = _ANSWER_PATTERN.match(text)
+    if match is None:
+        return (" " * NUMBER_COLUMNS + text[:visible].upper()).ljust(columns)[:columns]
+
+    def shown(group):
+        # Wypisana część grupy dopasowania
+        return match.group(group)[:max(0, visible - match.start(group))]
+
+    width = columns - NUMBER_COLUMNS - 1 - POINTS_COLUMNS - RIGHT_MARGIN
+    number = f"{shown(1)}{'.' if visible > match.end(1) else ''}"
+    line = number.rjust(NUMBER_COLUMNS - 1) + " " + shown(2)[:width].upper().ljust(width) + " "
+    if match.group(3) is not None:
+        # Cyfry pojawiają się w kolumnach, które zajmą pełne punkty
+        points = match.group(3)[-POINTS_COLUMNS:]
+        line += (" " * (POINTS_COLUMNS - len(points)) + shown(3)).ljust(POINTS_COLUMNS)
+    return line.ljust(columns)[:columns]
+
+
+def board_lines(texts, rows=BOARD_ROWS, columns=BOARD_COLUMNS, visible=None):
+    """
+    Rozmieszcza wiersze odpowiedzi na tablicy.
+
+    Args:
+        texts (list): Teksty kolejnych wierszy odpowiedzi.
+        rows (int): Liczba wierszy tablicy.
+        columns (int): Liczba kolumn tablicy.
+        visible (list): Dla każdego wiersza liczba wypisanych znaków lub None
+            (zob. answer_line); domyślnie całe teksty.
+
+    Returns:
+        tuple: rows napisów o długości columns (wielkie litery).
+    """
+    slots = min(rows, max(6, len(texts)))
+    top = (rows - slots) // 2
+    lines = [" " * columns] * rows
+    for i, text in enumerate(texts[:rows - top]):
+        lines[top + i] = answer_line(text, columns, visible[i] if visible else None)
+    return tuple(lines)
+
+
+class GlyphAtlas:
+    """
+    Kafelki wszystkich znaków czcionki dla danej wielkości punktu.
+
+    Args:
+        pitch (int): Odstęp między środkami punktów w pikselach.
+    """
+    def __init__(self, pitch):
+        self.pitch = pitch
+        self.cell_size = (CELL_WIDTH * pitch, CELL_HEIGHT * pitch)
+        self._tiles = {}
+        # Wzory punktów zapalonych i zgaszonych
+        margin = max(1, pitch // 8)
+        self._dots = {}
+        for color in (DOT_OFF, DOT_ON):
+            dot = Image.new("P", (pitch, pitch), BACKGROUND)
+            dot.putpalette(PALETTE)
+            ImageDraw.Draw(dot).ellipse((margin, margin, pitch - margin - 1, pitch - margin - 1), fill=color)
+            self._dots[color] = dot
+        for char in list(FONT_5X7) + list(DIACRITICS):
+            self.tile(char)
+
+    def tile(self, char):
+        """
+        Zwraca kafelek komórki znaku (budowany raz na znak).
+
+        Args:
+            char (str): Znak.
+
+        Returns:
+            PIL.Image.Image: Obraz komórki w trybie "P".
+        """
+        char = char.upper()
+        tile = self._tiles.get(char)
+        if tile is None:
+            pitch = self.pitch
+            tile = Image.new("P", self.cell_size, BACKGROUND)
+            tile.putpalette(PALETTE)
+            rows = glyph_rows(char)
+            for y in range(CELL_HEIGHT):
+                for x in range(CELL_WIDTH):
+                    lit = y < GLYPH_HEIGHT and x < GLYPH_WIDTH and rows[y][x] == "1"
+                    tile.paste(self._dots[DOT_ON if lit else DOT_OFF], (x * pitch, y * pitch))
+            self._tiles[char] = tile
+        return tile
+
+
+class DotMatrixRenderer:
+    """
+    Renderer klatek tablicy punktowej poza ekranem.
+
+    Args:
+        columns (int): Liczba kolumn tablicy.
+        rows (int): Liczba wierszy tablicy.
+        max_frames (int): Maksymalna liczba klatek w pamięci podręcznej.
+    """
+    def __init__(self, columns=BOARD_COLUMNS, rows=BOARD_ROWS, max_frames=8):
+        self.columns = columns
+        self.rows = rows
+        self.max_frames = max_frames
+        self._frames = OrderedDict()  # (linie, szerokość, wysokość) -> obraz
+        self._atlases = OrderedDict()  # wielkość punktu -> GlyphAtlas
+        self._last = None  # (klucz, obraz) ostatnio zwróconej klatki
+
+    def pitch_for(self, size):
+        """Zwraca największą wielkość punktu, przy której tablica mieści się w size."""
+        w, h = size
+        return max(2, min(w // (self.columns * CELL_WIDTH + 1), h // (self.rows * CELL_HEIGHT + 1)))
+
+    def _atlas(self, pitch):
+        atlas = self._atlases.get(pitch)
+        if atlas is None:
+            atlas = self._atlases[pitch] = GlyphAtlas(pitch)
+            while len(self._atlases) > 2:
+                self._atlases.popitem(last=False)
+        else:
+            self._atlases.move_to_end(pitch)
+        return atlas
+
+    def render(self, lines, size):
+        """
+        Zwraca klatkę tablicy.
+
+        Args:
+            lines (tuple): Napisy kolejnych wierszy tablicy (z board_lines).
+            size (tuple): Rozmiar klatki (szerokość, wysokość) w pikselach.
+
+        Returns:
+            tuple: (obraz PIL w trybie "P", zbiór indeksów zmienionych wierszy
+                względem poprzednio zwróconej klatki lub None, gdy zmieniło się wszystko).
+        """
+        key = (lines, size[0], size[1])
+        previous = self._last
+        frame = self._frames.get(key)
+        if frame is not None:
+            self._frames.move_to_end(key)
+        else:
+            pitch = self.pitch_for(size)
+            atlas = self._atlas(pitch)
+            cell_w, cell_h = atlas.cell_size
+            origin = ((size[0] - cell_w * self.columns + pitch) // 2,
+                      (size[1] - cell_h * self.rows + pitch) // 2)
+            if previous is not None and previous[0][1:] == key[1:]:
+                # Ta sama rozdzielczość: kopiujemy poprzednią klatkę i nakładamy zmienione komórki
+                frame = previous[1].copy()
+                old_lines = previous[0][0]
+            else:
+                frame = Image.new("P", size, BACKGROUND)
+                frame.putpalette(PALETTE)
+                old_lines = None
+            for row, line in enumerate(lines):
+                old = old_lines[row] if old_lines is not None else None
+                if old == line:
+                    continue
+                y = origin[1] + row * cell_h
+                for column, char in enumerate(line):
+                    if old is None or old[column] != char:
+                        frame.paste(atlas.tile(char), (origin[0] + column * cell_w, y))
+            self._frames[key] = frame
+            while len(self._frames) > self.max_frames:
+                self._frames.popitem(last=False)
+        self._last = (key, frame)
+        if previous is None or previous[0][1:] != key[1:]:
+            return frame, None
+        return frame, {row for row, (a, b) in enumerate(zip(previous[0][0], lines)) if a != b}
+
+    def clear(self):
+        """Usuwa klatki z pamięci podręcznej (atlasy znaków pozostają)."""
+        self._frames.clear()
+        self._last = None
+
+    def row_box(self, row, size):
+        """
+        Zwraca prostokąt pasa wiersza tablicy w klatce.
+
+        Args:
+            row (int): Indeks wiersza tablicy.
+            size (tuple): Rozmiar klatki.
+
+        Returns:
+            tuple: (lewo, góra, prawo, dół) w pikselach.
+        """
+        pitch = self.pitch_for(size)
+        cell_h = CELL_HEIGHT * pitch
+        top = (size[1] - cell_h * self.rows + pitch) // 2 + row * cell_h
+        return 0, top, size[0], top + cell_h
+
+
+class DotMatrixBoard(tk.Canvas):
+    """
+    Tablica odpowiedzi panelu TV w trybie wyświetlacza punktowego.
+
+    Ma ten sam interfejs co AnswerBoard. Zmiany tekstu są zbierane i
+    rysowane raz na obieg pętli Tk; na ekran trafiają tylko pasy wierszy
+    tablicy, które się zmieniły (osobny PhotoImage na wiersz).
+
+    Args:
+        master (tk.Misc): Widżet nadrzędny.
+        font_size (int): Ignorowany - wielkość znaków wynika z rozmiaru tablicy.
+    """
+    def __init__(self, master, font_size=None):
+        super().__init__(master, bg="black", highlightthickness=0)
+        self.renderer = DotMatrixRenderer()
+        self.texts = []  # pełne teksty wierszy (docelowe, gdy wiersz dopasowano przez fit_row)
+        self.visible = []  # liczba wypisanych znaków tekstu wiersza lub None (cały)
+        self._fitted = []  # czy tekst wiersza pochodzi z fit_row
+        self.row_count = 0
+        self._size = None
+        self._photos = []  # PhotoImage pasa każdego wiersza tablicy
+        self._items = []
+        self._redraw_pending = False
+        self.bind("<Configure>", lambda event: self.layout())
+
+    def show_rows(self, count):
+        """Czyści tablicę i pokazuje count pustych wierszy."""
+        self.texts = [""] * count
+        self.visible = [None] * count
+        self._fitted = [False] * count
+        self.row_count = count
+        self._schedule_redraw()
+
+    def hide(self):
+        """Ukrywa tablicę."""
+        self.grid_remove()
+        self.row_count = 0
+
+    def set_text(self, row, text):
+        """
+        Ustawia tekst wiersza (rysowany przy najbliższym obiegu pętli Tk).
+
+        Początek tekstu przekazanego wcześniej do fit_row jest rysowany w
+        docelowym układzie wiersza, więc punkty pojawiają się od razu
+        w swojej kolumnie.
+        """
+        if row >= len(self.texts):
+            return
+        if self._fitted[row] and self.texts[row].startswith(text):
+            state = (self.texts[row], len(text))
+        else:
+            self._fitted[row] = False
+            state = (text, None)
+        if (self.texts[row], self.visible[row]) != state:
+            self.texts[row], self.visible[row] = state
+            self._schedule_redraw()
+
+    def set_font_size(self, size):
+        """Nic nie robi - wielkość znaków wynika z rozmiaru tablicy."""
+
+    def fit_row(self, row, text):
+        """
+        Ustala docelowy tekst wiersza, którego początek wypisuje potem set_text.
+
+        Args:
+            row (int): Indeks wiersza.
+            text (str): Docelowy tekst wiersza.
+        """
+        if row < len(self.texts):
+            self.texts[row] = text
+            self.visible[row] = 0
+            self._fitted[row] = True
+            self._schedule_redraw()
+
+    def layout(self):
+        """Dopasowuje klatki do nowego rozmiaru płótna."""
+        size = (self.winfo_width(), self.winfo_height())
+        if size != self._size and size[0] > 1 and size[1] > 1:
+            self._size = size
+            self.delete("all")
+            self._photos = []
+            self._items = []
+            for row in range(self.renderer.rows):
+                left, top, right, bottom = self.renderer.row_box(row, size)
+                photo = ImageTk.PhotoImage("RGB", (right - left, bottom - top))
+                self._photos.append(photo)
+                self._items.append(self.create_image(left, top, image=photo, anchor="nw"))
+            self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._redraw)
+
+    def _redraw(self):
+        self._redraw_pending = False
+        if self._size is None:
+            return
+        frame, dirty = self.renderer.render(board_lines(self.texts, visible=self.visible), self._size)
+        rows = range(self.renderer.rows) if dirty is None else sorted(dirty)
+        for row in rows:
+            strip = frame.crop(self.renderer.row_box(row, self._size)).convert("RGB")
+            self._photos[row].paste(strip)
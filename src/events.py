@@ -0,0 +1,127 @@
+import logging
+
+
+class GameEvent:
+    """
+    Zdarzenie zmiany stanu gry.
+
+    Args:
+        trace (Trace): Ślad akcji operatora, która wywołała zdarzenie (opcjonalnie).
+    """
+    __slots__ = ('trace',)
+
+    def __init__(self, trace=None):
+        self.trace = trace
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class QuestionSelected(GameEvent):
+    """Wybrano pytanie rundy (index None oznacza brak bieżącego pytania)."""
+    __slots__ = ('index',)
+
+    def __init__(self, index, trace=None):
+        super().__init__(trace)
+        self.index = index
+
+
+class AnswerRevealed(GameEvent):
+    """Odkryto odpowiedź; team otrzymał points punktów."""
+    __slots__ = ('index', 'team', 'points')
+
+    def __init__(self, index, team, points, trace=None):
+        super().__init__(trace)
+        self.index = index
+        self.team = team
+        self.points = points
+
+
+class MistakeAdded(GameEvent):
+    """Drużyna team popełniła błąd; count to jej liczba błędów w rundzie."""
+    __slots__ = ('team', 'count')
+
+    def __init__(self, team, count, trace=None):
+        super().__init__(trace)
+        self.team = team
+        self.count = count
+
+
+class ConsultationMistake(GameEvent):
+    """Błąd drużyny team podczas narady (duże X)."""
+    __slots__ = ('team',)
+
+    def __init__(self, team, trace=None):
+        super().__init__(trace)
+        self.team = team
+
+
+class BuzzerWon(GameEvent):
+    """Zawodnik name z drużyny team pierwszy nacisnął przycisk."""
+    __slots__ = ('team', 'name')
+
+    def __init__(self, team, name="", trace=None):
+        super().__init__(trace)
+        self.team = team
+        self.name = name
+
+
+class TeamNamesChanged(GameEvent):
+    """Zmieniono nazwy drużyn."""
+    __slots__ = ()
+
+
+class IntroStarted(GameEvent):
+    """Rozpoczęto intro programu."""
+    __slots__ = ()
+
+
+class GameReset(GameEvent):
+    """Wyzerowano punkty, błędy i bieżące pytanie."""
+    __slots__ = ()
+
+
+class EventBus:
+    """
+    Prosta szyna zdarzeń: Game publikuje zdarzenia, widoki je subskrybują.
+
+    Subskrybenci są wywoływani synchronicznie, w kolejności subskrypcji,
+    w wątku publikującym zdarzenie. Bez subskrybentów (np. w symulatorze
+    meczów) publikacja sprowadza się do przejścia po pustej liście.
+    """
+    def __init__(self):
+        self._handlers = []
+
+    def subscribe(self, handler):
+        """
+        Dodaje subskrybenta.
+
+        Args:
+            handler (callable): Funkcja przyjmująca GameEvent.
+
+        Returns:
+            callable: Funkcja anulująca subskrypcję.
+        """
+        self._handlers.append(handler)
+        return lambda: self.unsubscribe(handler)
+
+    def unsubscribe(self, handler):
+        """Usuwa subskrybenta (brak błędu, jeśli go nie ma)."""
+        try:
+            self._handlers.remove(handler)
+        except ValueError:
+            pass
+
+    def publish(self, event):
+        """
+        Przekazuje zdarzenie wszystkim subskrybentom.
+
+        Args:
+            event (GameEvent): Zdarzenie.
+        """
+        for handler in list(self._handlers):
+            try:
+                handler(event)
+            except Exception:
+                logging.exception("Błąd subskrybenta zdarzenia %s", event)
@@ -0,0 +1,124 @@
+import tkinter.font as tkfont
+from collections import OrderedDict
+
+
+class FontCache:
+    """
+    Wspólna pamięć podręczna czcionek Tk i pomiarów tekstu.
+
+    Każda kombinacja (rodzina, rozmiar, grubość) to jeden obiekt
+    tkinter.font.Font współdzielony przez wszystkie widżety, więc Tk nie
+    rozwiązuje czcionki ponownie przy tworzeniu każdego widżetu. Pomiary
+    szerokości tekstu są zapamiętywane (LRU), dzięki czemu ponowne
+    dopasowanie rozmiaru po zmianie okna to zwykle kilka odczytów ze słownika.
+
+    Obiekty Font powstają przy pierwszym użyciu, więc główne okno Tk musi
+    już istnieć. Czcionek z pamięci podręcznej nie należy modyfikować
+    (configure) - są współdzielone.
+
+    Args:
+        max_measurements (int): Maksymalna liczba zapamiętanych pomiarów tekstu.
+    """
+    def __init__(self, max_measurements=4096):
+        self.max_measurements = max_measurements
+        self._fonts = {}  # (rodzina, rozmiar, grubość) -> Font
+        self._linespace = {}  # (rodzina, rozmiar, grubość) -> wysokość linii w px
+        self._widths = OrderedDict()  # (rodzina, rozmiar, grubość, tekst) -> szerokość w px
+
+    def get(self, family, size, weight="normal"):
+        """
+        Zwraca współdzieloną czcionkę.
+
+        Args:
+            family (str): Rodzina czcionki.
+            size (int): Rozmiar w punktach.
+            weight (str): "normal" lub "bold".
+
+        Returns:
+            tkinter.font.Font: Czcionka.
+        """
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = tkfont.Font(family=family, size=size, weight=weight)
+        return font
+
+    def measure(self, text, family, size, weight="normal"):
+        """
+        Zwraca szerokość tekstu w pikselach.
+
+        Args:
+            text (str): Tekst.
+            family (str): Rodzina czcionki.
+            size (int): Rozmiar w punktach.
+            weight (str): "normal" lub "bold".
+
+        Returns:
+            int: Szerokość w pikselach.
+        """
+        key = (family, size, weight, text)
+        width = self._widths.get(key)
+        if width is None:
+            width = self._widths[key] = self.get(family, size, weight).measure(text)
+            if len(self._widths) > self.max_measurements:
+                self._widths.popitem(last=False)
+        else:
+            self._widths.move_to_end(key)
+        return width
+
+    def linespace(self, family, size, weight="normal"):
+        """
+        Zwraca wysokość linii czcionki w pikselach.
+
+        Args:
+            family (str): Rodzina czcionki.
+            size (int): Rozmiar w punktach.
+            weight (str): "normal" lub "bold".
+
+        Returns:
+            int: Wysokość linii w pikselach.
+        """
+        key = (family, size, weight)
+        height = self._linespace.get(key)
+        if height is None:
+            height = self._linespace[key] = self.get(family, size, weight).metrics("linespace")
+        return height
+
+    def fit_size(self, text, family, max_width, max_size, min_size=8, weight="normal", max_height=None):
+        """
+        Zwraca największy rozmiar czcionki, przy którym tekst mieści się w obszarze.
+
+        Szerokość tekstu rośnie prawie liniowo z rozmiarem czcionki, więc
+        rozmiar jest szacowany z jednego pomiaru przy max_size i poprawiany
+        kolejnymi pomiarami (zwykle jednym lub dwoma).
+
+        Args:
+            text (str): Tekst.
+            family (str): Rodzina czcionki.
+            max_width (float): Dostępna szerokość w pikselach.
+            max_size (int): Największy dopuszczalny rozmiar.
+            min_size (int): Najmniejszy rozmiar (zwracany, gdy nawet on się nie mieści).
+            weight (str): "normal" lub "bold".
+            max_height (float): Dostępna wysokość linii w pikselach (opcjonalnie).
+
+        Returns:
+            int: Rozmiar czcionki.
+        """
+        size = max(min_size, int(max_size))
+        if max_height is not None:
+            height = self.linespace(family, size, weight)
+            if height > max_height:
+                size = max(min_size, int(size * max_height / height))
+                while size > min_size and self.linespace(family, size, weight) > max_height:
+                    size -= 1
+        width = self.measure(text, family, size, weight)
+        if width <= max_width or size <= min_size:
+            return size
+        size = max(min_size, int(size * max_width / width))
+        while size > min_size and self.measure(text, family, size, weight) > max_width:
+            size -= 1
+        return size
+
+
+# Wspólna pamięć podręczna czcionek aplikacji
+fonts = FontCache()
@@ -1,26 +1,67 @@
-import json
 import os
 import logging
-from tkinter import messagebox
+import threading
+from question_bank import QuestionBank, Autosaver, open_bank
+from question_pack import QuestionPack, is_pack_file
+from utils import set_resource_pack
+from search_index import SearchIndex
+from answer_matcher import AnswerMatcher
+from models import Question
+from events import (EventBus, QuestionSelected, AnswerRevealed, MistakeAdded, ConsultationMistake,
+                    BuzzerWon, TeamNamesChanged, IntroStarted, GameReset)
 
 # Konfiguracja loggera
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+class QuestionFileError(Exception):
+    """Błąd wczytywania lub zapisywania pliku z pytaniami (komunikat dla użytkownika)."""
+
+
 class Game:
     """
     Klasa zarządzająca logiką gry Familiada.
+
+    Game nie zależy od interfejsu graficznego - błędy zgłasza wyjątkami
+    QuestionFileError, które panel administratora pokazuje użytkownikowi,
+    a każdą zmianę stanu rundy publikuje jako zdarzenie w self.events,
+    które subskrybują widoki (panel TV, monitor prowadzącego, pasek wyników).
     """
     def __init__(self):
-        self.questions = []  # lista pytań
+        self.events = EventBus()
+        self.questions = QuestionBank()  # indeksowany bank pytań
+        self._search_index = None  # budowany przy pierwszym wyszukiwaniu
+        self._autosaver = None
+        self.saving = False  # trwa zapis w tle (save_questions_async) - bank nie może się zmieniać
+        self._adopt_path = None  # plik nowego banku do przejęcia po zapisie w tle
+        self.matcher = AnswerMatcher()  # dopasowanie wypowiedzi do odpowiedzi bieżącego pytania
         self.current_question = None
         self.current_question_index = None
+        self.revealed_mask = 0  # bit i ustawiony = odpowiedź i odkryta w bieżącej rundzie
+        self.buzz_winner = None  # drużyna, która pierwsza nacisnęła przycisk w rundzie
         self.team1_mistakes = 0  # błędy drużyny lewej
         self.team2_mistakes = 0  # błędy drużyny prawej
         self.team1_score = 0
         self.team2_score = 0
         self.team1_name = "Drużyna Lewa"
         self.team2_name = "Drużyna Prawa"
-        self.intro_image_path = None  # Ścieżka do pliku z logo
+        self.pack = None  # otwarta paczka pytań (QuestionPack)
+        self._intro_image_path = None  # Ścieżka do pliku z logo wybranego ręcznie
+
+    @property
+    def intro_image_path(self):
+        """
+        str: Ścieżka do logo intro - wybranego ręcznie albo z paczki pytań (lub None).
+
+        Logo z paczki jest dostępne, gdy wątek tła skończy je wypakowywać;
+        wcześniej (tylko przy pierwszym otwarciu paczki) intro pokazuje napis.
+        """
+        if self._intro_image_path is None and self.pack is not None and self.pack.intro_image:
+            return self.pack.extract(self.pack.intro_image, wait=False)
+        return self._intro_image_path
+
+    @intro_image_path.setter
+    def intro_image_path(self, path):
+        self._intro_image_path = path
 
     def add_question(self, question_text, answers):
         """
@@ -29,86 +70,383 @@ class Game:
         Args:
             question_text (str): Tekst pytania.
             answers (list): Lista krotek (odpowiedź, punkty).
+
+        Raises:
+            QuestionFileError: Gdy trwa zapis pytań w tle.
+        """
+        self._check_not_saving()
+        self.questions.append(Question(question_text, answers))
+        if self._search_index is not None:
+            self._search_index.add(question_text, [ans for ans, _ in answers])
+
+    def search_questions(self, query, limit=None):
+        """
+        Wyszukuje pytania po tekście pytania i odpowiedzi.
+
+        Args:
+            query (str): Zapytanie (wielkość liter i polskie znaki są ignorowane).
+            limit (int): Maksymalna liczba wyników.
+
+        Returns:
+            list: Indeksy pasujących pytań w banku.
+        """
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+            self._search_index.build(self.questions.search_rows())
+        return self._search_index.search(query, limit)
+
+    def remove_question(self, index):
+        """
+        Usuwa pytanie z banku.
+
+        Args:
+            index (int): Indeks pytania.
+
+        Raises:
+            QuestionFileError: Gdy trwa zapis pytań w tle.
         """
-        question = {'question': question_text, 'answers': []}
-        for ans, pts in answers:
-            question['answers'].append({
-                'answer': ans,
-                'points': pts,
-                'revealed': False
-            })
-        self.questions.append(question)
+        self._check_not_saving()
+        del self.questions[index]
+        self._search_index = None
+        if self.current_question_index == index:
+            self.current_question = None
+            self.current_question_index = None
+            self.events.publish(QuestionSelected(None))
+        elif self.current_question_index is not None and self.current_question_index > index:
+            self.current_question_index -= 1
 
     def load_questions(self, file_path):
         """
-        Ładuje pytania z pliku JSON.
+        Ładuje pytania z banku SQLite, paczki pytań lub importuje je z pliku JSON.
 
         Args:
             file_path (str): Ścieżka do pliku z pytaniami.
+
+        Raises:
+            QuestionFileError: Gdy pliku nie ma, nie da się go wczytać albo
+                trwa zapis pytań w tle.
         """
+        self._check_not_saving()
+        if is_pack_file(file_path):
+            self.open_pack(file_path)
+            return
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.questions = json.load(f)
-            logging.info("Pytania wczytane.")
-        except FileNotFoundError:
-            messagebox.showerror("Błąd", "Plik z pytaniami nie istnieje.")
+            bank = open_bank(file_path)
+        except FileNotFoundError as e:
             logging.error("Nie znaleziono pliku z pytaniami: %s", file_path)
+            raise QuestionFileError("Plik z pytaniami nie istnieje.") from e
         except Exception as e:
-            messagebox.showerror("Błąd", "Wystąpił błąd podczas wczytywania pytań.")
             logging.error("Błąd przy ładowaniu pytań: %s", e)
+            raise QuestionFileError("Wystąpił błąd podczas wczytywania pytań.") from e
+        self.questions.close()
+        self.questions = bank
+        self._search_index = None
+        # Logo i dźwięki poprzedniej paczki nie dotyczą nowych pytań
+        self._set_pack(None)
+        logging.info("Pytania wczytane.")
 
-    def save_questions(self, file_path):
+    def open_pack(self, file_path):
+        """
+        Otwiera paczkę pytań: wczytuje jej pytania, a jej logo i dźwięki
+        stają się zasobami gry (resource_path, intro_image_path).
+
+        Zasoby paczki są wypakowywane dopiero przy pierwszym użyciu; logo
+        intro jest przygotowywane od razu w wątku tła.
+
+        Args:
+            file_path (str): Ścieżka do pliku paczki.
+
+        Raises:
+            QuestionFileError: Gdy paczki nie ma, nie da się jej wczytać albo
+                trwa zapis pytań w tle.
+        """
+        self._check_not_saving()
+        try:
+            pack = QuestionPack(file_path)
+        except FileNotFoundError as e:
+            logging.error("Nie znaleziono paczki pytań: %s", file_path)
+            raise QuestionFileError("Plik z pytaniami nie istnieje.") from e
+        except Exception as e:
+            logging.error("Błąd przy otwieraniu paczki pytań: %s", e)
+            raise QuestionFileError("Wystąpił błąd podczas wczytywania paczki pytań.") from e
+        bank = QuestionBank()
+        try:
+            bank.extend(pack.questions())
+            bank.commit()
+        except Exception as e:
+            bank.close()
+            pack.close()
+            logging.error("Błąd przy wczytywaniu pytań z paczki: %s", e)
+            raise QuestionFileError("Wystąpił błąd podczas wczytywania paczki pytań.") from e
+        self.questions.close()
+        self.questions = bank
+        self._search_index = None
+        self._set_pack(pack)
+        if pack.intro_image:
+            threading.Thread(target=self._extract_intro, args=(pack,),
+                             name="pack-intro", daemon=True).start()
+        logging.info("Wczytano paczkę pytań: %s", pack.title)
+
+    def _set_pack(self, pack):
+        """Ustawia aktywną paczkę zasobów, zamykając poprzednią."""
+        old = self.pack
+        self.pack = pack
+        set_resource_pack(pack)
+        if old is not None and old is not pack:
+            old.close()
+
+    @staticmethod
+    def _extract_intro(pack):
+        # Wykonywane w wątku tła; paczka mogła zostać w międzyczasie zamknięta
+        try:
+            pack.extract(pack.intro_image)
+        except Exception as e:
+            logging.error("Nie udało się wypakować logo z paczki %s: %s", pack.path, e)
+
+    def _check_not_saving(self):
+        if self.saving:
+            raise QuestionFileError("Trwa zapisywanie pytań - poczekaj na jego zakończenie.")
+
+    def _write_questions(self, file_path):
         """
-        Zapisuje pytania do pliku JSON.
+        Zapisuje pytania, zgłaszając błędy wyjątkami.
+
+        Zapis do pliku z rozszerzeniem .json eksportuje pytania w starym
+        formacie. Zapis do pliku aktualnego banku zapisuje tylko zmiany.
+        Każdy inny plik staje się kopią banku, którą gra powinna potem
+        przejąć (_adopt_bank). Wszystkie zapisy są atomowe.
 
         Args:
             file_path (str): Ścieżka do pliku, gdzie zapisać pytania.
+
+        Returns:
+            bool: True, jeśli powstał nowy bank do przejęcia.
         """
+        bank = self.questions
+        if file_path.lower().endswith('.json'):
+            bank.export_json(file_path)
+        elif os.path.abspath(file_path) == os.path.abspath(bank.path):
+            bank.commit()
+        else:
+            bank.save_as(file_path)
+            return True
+        return False
+
+    def _save(self, file_path):
+        """Zapisuje pytania, zamieniając błędy na QuestionFileError; zwraca wynik _write_questions."""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.questions, f, ensure_ascii=False, indent=4)
-            logging.info("Pytania zapisane.")
+            adopt = self._write_questions(file_path)
         except Exception as e:
-            messagebox.showerror("Błąd", "Wystąpił błąd podczas zapisywania pytań.")
             logging.error("Błąd przy zapisywaniu pytań: %s", e)
+            raise QuestionFileError("Wystąpił błąd podczas zapisywania pytań.") from e
+        logging.info("Pytania zapisane.")
+        return adopt
+
+    def _adopt_bank(self, file_path):
+        """
+        Przełącza grę na bank zapisany w file_path, zamykając poprzedni.
+
+        Kolejne pytania dodawane przez add_question trafiają do nowego banku.
+
+        Args:
+            file_path (str): Ścieżka do pliku zapisanego przez save_as.
+
+        Raises:
+            QuestionFileError: Gdy nowego banku nie da się otworzyć.
+        """
+        old = self.questions
+        with old.lock:
+            try:
+                self.questions = QuestionBank(file_path)
+            except Exception as e:
+                logging.error("Błąd przy otwieraniu zapisanego banku: %s", e)
+                raise QuestionFileError("Pytania zapisano, ale nie udało się otworzyć nowego banku.") from e
+            # Zmiany poprzedniego banku zapisał save_as; autozapis pominie go, bo nie ma zmian
+            old.close()
+
+    def save_questions(self, file_path):
+        """
+        Zapisuje pytania do pliku JSON lub do banku SQLite.
+
+        Args:
+            file_path (str): Ścieżka do pliku, gdzie zapisać pytania.
+
+        Raises:
+            QuestionFileError: Gdy zapis się nie powiódł albo trwa zapis w tle.
+        """
+        self._check_not_saving()
+        if self._save(file_path):
+            self._adopt_bank(file_path)
+
+    def save_questions_async(self, file_path, on_done=None):
+        """
+        Zapisuje pytania w wątku tła, nie blokując interfejsu.
+
+        Do zakończenia zapisu bank nie może się zmieniać - load_questions,
+        add_question i remove_question zgłaszają wtedy QuestionFileError.
+        Po wywołaniu on_done należy w wątku interfejsu wywołać finish_save(),
+        które przełącza grę na nowy bank (zapis pod nową nazwą) i odblokowuje
+        zmiany.
+
+        Args:
+            file_path (str): Ścieżka do pliku, gdzie zapisać pytania.
+            on_done (callable): Funkcja wywoływana w wątku tła z wyjątkiem
+                QuestionFileError lub None, gdy zapis się powiódł.
+
+        Raises:
+            QuestionFileError: Gdy trwa już inny zapis w tle.
+        """
+        self._check_not_saving()
+        self.saving = True
+        def run():
+            error = None
+            try:
+                if self._save(file_path):
+                    self._adopt_path = file_path
+            except QuestionFileError as e:
+                error = e
+            if on_done:
+                on_done(error)
+        threading.Thread(target=run, name="save-questions", daemon=True).start()
+
+    def finish_save(self):
+        """
+        Kończy zapis rozpoczęty przez save_questions_async (w wątku interfejsu, po on_done).
+
+        Raises:
+            QuestionFileError: Gdy nowego banku nie da się otworzyć.
+        """
+        file_path, self._adopt_path = self._adopt_path, None
+        self.saving = False
+        if file_path is not None:
+            self._adopt_bank(file_path)
+
+    def start_autosave(self, interval=30.0):
+        """
+        Uruchamia okresowy zapis zmian banku w wątku tła.
+
+        Args:
+            interval (float): Odstęp między zapisami w sekundach.
+        """
+        if self._autosaver is None:
+            self._autosaver = Autosaver(lambda: self.questions, interval)
+            self._autosaver.start()
+
+    def stop_autosave(self):
+        """Zatrzymuje autozapis, zapisując ostatnie zmiany."""
+        if self._autosaver is not None:
+            self._autosaver.stop()
+            self._autosaver = None
+
+    def set_team_names(self, left=None, right=None):
+        """
+        Zmienia nazwy drużyn.
+
+        Args:
+            left (str): Nowa nazwa drużyny lewej lub None, aby jej nie zmieniać.
+            right (str): Nowa nazwa drużyny prawej lub None, aby jej nie zmieniać.
+        """
+        if left:
+            self.team1_name = left
+        if right:
+            self.team2_name = right
+        self.events.publish(TeamNamesChanged())
+
+    def start_intro(self):
+        """Ogłasza rozpoczęcie intro programu."""
+        self.events.publish(IntroStarted())
 
-    def set_current_question(self, index):
+    def consultation_mistake(self, team):
+        """
+        Ogłasza błąd drużyny podczas narady (nie jest liczony do błędów rundy).
+
+        Args:
+            team (str): 'left' lub 'right'.
+        """
+        self.events.publish(ConsultationMistake(team))
+
+    def set_buzz_winner(self, team, name=""):
+        """
+        Zapisuje drużynę, która pierwsza nacisnęła przycisk w bieżącej rundzie.
+
+        Args:
+            team (str): 'left' lub 'right'.
+            name (str): Imię zawodnika.
+        """
+        self.buzz_winner = team
+        self.events.publish(BuzzerWon(team, name))
+
+    def set_current_question(self, index, trace=None):
         """
         Ustawia aktualne pytanie na podstawie indeksu.
 
         Args:
             index (int): Indeks pytania.
+            trace (Trace): Ślad akcji operatora przekazywany w zdarzeniu.
         """
         self.current_question_index = index
         self.current_question = self.questions[index]
+        self.revealed_mask = 0
+        self.buzz_winner = None
         self.team1_mistakes = 0
         self.team2_mistakes = 0
-        for ans in self.current_question['answers']:
-            ans['revealed'] = False
+        self.matcher.prepare(self.current_question)
+        self.events.publish(QuestionSelected(index, trace))
+
+    def match_answer(self, text, limit=None):
+        """
+        Dopasowuje wypowiedź zawodnika do nieodkrytych odpowiedzi bieżącego pytania.
+
+        Args:
+            text (str): Wypowiedź (wpisana przez operatora lub z transkrypcji mowy).
+            limit (int): Maksymalna liczba wyników.
+
+        Returns:
+            list: Krotki (indeks odpowiedzi, ocena 0.0-1.0), od najlepiej pasującej.
+        """
+        if self.current_question is None:
+            return []
+        return self.matcher.rank(text, self.revealed_mask, limit)
+
+    def is_revealed(self, answer_index):
+        """
+        Sprawdza, czy odpowiedź bieżącego pytania została odkryta.
+
+        Args:
+            answer_index (int): Indeks odpowiedzi.
+
+        Returns:
+            bool: True, jeśli odpowiedź jest odkryta.
+        """
+        return bool(self.revealed_mask >> answer_index & 1)
 
-    def reveal_answer(self, answer_index, team):
+    def reveal_answer(self, answer_index, team, trace=None):
         """
         Odkrywa odpowiedź i przyznaje punkty odpowiedniej drużynie.
 
         Args:
             answer_index (int): Indeks odpowiedzi.
             team (str): 'left' lub 'right' określające drużynę.
+            trace (Trace): Ślad akcji operatora przekazywany w zdarzeniu.
         """
-        if self.current_question is not None and 0 <= answer_index < len(self.current_question['answers']):
-            if not self.current_question['answers'][answer_index]['revealed']:
-                self.current_question['answers'][answer_index]['revealed'] = True
-                pts = self.current_question['answers'][answer_index]['points']
+        if self.current_question is not None and 0 <= answer_index < len(self.current_question.answers):
+            bit = 1 << answer_index
+            if not self.revealed_mask & bit:
+                self.revealed_mask |= bit
+                pts = self.current_question.answers[answer_index].points
                 if team == 'left':
                     self.team1_score += pts
                 elif team == 'right':
                     self.team2_score += pts
+                self.events.publish(AnswerRevealed(answer_index, team, pts, trace))
 
-    def add_mistake(self, team):
+    def add_mistake(self, team, trace=None):
         """
         Rejestruje błąd dla danej drużyny.
 
         Args:
             team (str): 'left' lub 'right'.
+            trace (Trace): Ślad akcji operatora przekazywany w zdarzeniu.
 
         Returns:
             bool: True, jeśli błąd został dodany, False, jeśli osiągnięto limit.
@@ -120,11 +458,16 @@ class Game:
                 self.team1_mistakes += 1
             else:
                 return False
+            count = self.team1_mistakes
         elif team == 'right':
             if self.team2_mistakes < 3:
                 self.team2_mistakes += 1
             else:
                 return False
+            count = self.team2_mistakes
+        else:
+            return True
+        self.events.publish(MistakeAdded(team, count, trace))
         return True
 
     def reset_game(self):
@@ -135,3 +478,6 @@ class Game:
         self.team2_mistakes = 0
         self.current_question = None
         self.current_question_index = None
+        self.revealed_mask = 0
+        self.buzz_winner = None
+        self.events.publish(GameReset())
@@ -0,0 +1,183 @@
+import os
+import queue
+import logging
+import importlib.util
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ImageCache:
+    """
+    Pamięć podręczna obrazów dekodowanych w tle.
+
+    Dekodowanie i skalowanie obrazu odbywa się w wątku roboczym, a gotowe
+    obrazy PhotoImage tworzone są w wątku Tk (wymaga tego tkinter). Zdekodowane
+    oryginały oraz przeskalowane warianty są trzymane w LRU, więc ponowne
+    wyświetlenie tego samego obrazu w tym samym rozmiarze nie czyta pliku.
+
+    Args:
+        widget (tk.Misc): Widżet, którego pętla zdarzeń odbiera wyniki.
+        max_variants (int): Maksymalna liczba przeskalowanych wariantów w pamięci.
+        max_sources (int): Maksymalna liczba zdekodowanych oryginałów w pamięci.
+    """
+    POLL_MS = 15
+
+    def __init__(self, widget, max_variants=8, max_sources=2):
+        self.widget = widget
+        self.max_variants = max_variants
+        self.max_sources = max_sources
+        self._variants = OrderedDict()  # (ścieżka, mtime, w, h) -> PhotoImage
+        self._sources = OrderedDict()  # (ścieżka, mtime) -> (zdekodowany obraz PIL, czy zmniejszony przez draft)
+        self._pending = {}  # klucz -> lista (on_ready, on_error)
+        self._results = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-cache")
+        self._polling = False
+
+    @staticmethod
+    def available():
+        """bool: True, jeśli biblioteka PIL jest zainstalowana (bez jej importowania)."""
+        return importlib.util.find_spec("PIL") is not None
+
+    def _key(self, path, size):
+        return (os.path.abspath(path), os.path.getmtime(path), size[0], size[1])
+
+    def get(self, path, size):
+        """
+        Zwraca gotowy wariant obrazu bez dekodowania.
+
+        Args:
+            path (str): Ścieżka do pliku obrazu.
+            size (tuple): Docelowy rozmiar (szerokość, wysokość).
+
+        Returns:
+            ImageTk.PhotoImage: Obraz z pamięci podręcznej lub None.
+        """
+        try:
+            key = self._key(path, size)
+        except OSError:
+            return None
+        photo = self._variants.get(key)
+        if photo is not None:
+            self._variants.move_to_end(key)
+        return photo
+
+    def request(self, path, size, on_ready=None, on_error=None):
+        """
+        Zleca przygotowanie obrazu w danym rozmiarze.
+
+        Jeśli wariant jest już w pamięci, on_ready jest wywoływane od razu.
+        W przeciwnym razie obraz jest dekodowany w tle, a on_ready zostanie
+        wywołane w wątku Tk, gdy będzie gotowy.
+
+        Args:
+            path (str): Ścieżka do pliku obrazu.
+            size (tuple): Docelowy rozmiar (szerokość, wysokość).
+            on_ready (callable): Funkcja przyjmująca gotowy PhotoImage.
+            on_error (callable): Funkcja przyjmująca wyjątek.
+        """
+        try:
+            key = self._key(path, size)
+        except OSError as e:
+            if on_error:
+                on_error(e)
+            return
+        photo = self._variants.get(key)
+        if photo is not None:
+            self._variants.move_to_end(key)
+            if on_ready:
+                on_ready(photo)
+            return
+        callbacks = self._pending.get(key)
+        if callbacks is not None:
+            callbacks.append((on_ready, on_error))
+            return
+        self._pending[key] = [(on_ready, on_error)]
+        self._executor.submit(self._decode, key)
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.POLL_MS, self._poll)
+
+    def prefetch(self, path, size):
+        """
+        Przygotowuje wariant obrazu w tle, bez wyświetlania go.
+
+        Args:
+            path (str): Ścieżka do pliku obrazu.
+            size (tuple): Docelowy rozmiar (szerokość, wysokość).
+        """
+        self.request(path, size)
+
+    def _load_source(self, path, mtime, size):
+        # Wykonywane w wątku roboczym; PIL importujemy dopiero tutaj, aby nie spowalniać startu
+        from PIL import Image
+        source_key = (path, mtime)
+        cached = self._sources.get(source_key)
+        if cached is not None:
+            image, reduced = cached
+            # Oryginał zmniejszony przez draft nadaje się tylko dla rozmiarów nie większych
+            # od niego - większy wariant (np. pełny ekran) wymaga ponownego dekodowania
+            if not reduced or (image.width >= size[0] and image.height >= size[1]):
+                self._sources.move_to_end(source_key)
+                return image
+        image = Image.open(path)
+        full_size = image.size
+        # Dla JPEG dekoder może od razu zmniejszyć obraz, co znacznie przyspiesza odczyt;
+        # draft wybiera skalę, przy której obraz jest nie mniejszy niż size
+        image.draft("RGB", size)
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        self._sources[source_key] = (image, image.size != full_size)
+        self._sources.move_to_end(source_key)
+        while len(self._sources) > self.max_sources:
+            self._sources.popitem(last=False)
+        return image
+
+    def _decode(self, key):
+        # Wykonywane w wątku roboczym
+        path, mtime, w, h = key
+        try:
+            from PIL import Image
+            image = self._load_source(path, mtime, (w, h))
+            if image.size != (w, h):
+                image = image.resize((w, h), Image.LANCZOS)
+            self._results.put((key, image, None))
+        except Exception as e:
+            self._results.put((key, None, e))
+
+    def _poll(self):
+        while True:
+            try:
+                key, image, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            callbacks = self._pending.pop(key, [])
+            photo = None
+            if error is None:
+                try:
+                    from PIL import ImageTk
+                    photo = ImageTk.PhotoImage(image)
+                except Exception as e:
+                    error = e
+            if photo is not None:
+                self._variants[key] = photo
+                while len(self._variants) > self.max_variants:
+                    self._variants.popitem(last=False)
+            else:
+                logging.error("Błąd przy ładowaniu obrazu %s: %s", key[0], error)
+            for on_ready, on_error in callbacks:
+                if photo is not None and on_ready:
+                    on_ready(photo)
+                elif photo is None and on_error:
+                    on_error(error)
+        if self._pending:
+            self.widget.after(self.POLL_MS, self._poll)
+        else:
+            self._polling = False
+
+    def clear(self):
+        """Usuwa wszystkie obrazy z pamięci podręcznej."""
+        self._variants.clear()
+        self._sources.clear()
+
+    def shutdown(self):
+        """Zatrzymuje wątek roboczy."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
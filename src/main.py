@@ -1,38 +1,171 @@
-import tkinter as tk
-from game import Game
-from tv_panel import TVPanel
-from admin_panel import AdminPanel
+import time
+_PROCESS_START = time.perf_counter()
 
-try:
-    from sound_manager import SoundManager
-except ImportError:
-    SoundManager = None
+import os
+import logging
+import argparse
+import threading
+from startup_profiler import StartupProfiler
 
-def main():
+def parse_args(argv=None):
+    """Parsuje argumenty wiersza poleceń."""
+    parser = argparse.ArgumentParser(description="Familiada")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="wypisz czasy importów i inicjalizacji poszczególnych faz startu")
+    parser.add_argument("--low-latency", action="store_true",
+                        help="tryb niskich opóźnień dźwięku (mniejszy bufor, zarezerwowane kanały)")
+    parser.add_argument("--sound-latency-estimate", action="store_true",
+                        help="zbieraj szacunek opóźnienia efektów dźwiękowych (czas wywołania + bufor miksera, "
+                             "bez opóźnień sterownika i urządzenia) - widoczny w nakładce F12 i w --trace-file")
+    parser.add_argument("--remote-tv", metavar="[ADRES:]PORT",
+                        help="zamiast okna TV wysyłaj stan gry do zdalnych ekranów (remote_display.py)")
+    parser.add_argument("--buzzer", metavar="[ADRES:]PORT",
+                        help="uruchom serwer przycisków dla urządzeń zawodników")
+    parser.add_argument("--dot-matrix", action="store_true",
+                        help="tablica odpowiedzi w stylu wyświetlacza punktowego (nie wymaga czcionki)")
+    parser.add_argument("--host-monitor", action="store_true",
+                        help="otwórz monitor prowadzącego z pełną listą odpowiedzi")
+    parser.add_argument("--scoreboard", action="store_true",
+                        help="otwórz pasek wyników")
+    parser.add_argument("--pack", metavar="PLIK",
+                        help="otwórz paczkę pytań (.familiada) z pytaniami, logo intro i dźwiękami")
+    parser.add_argument("--synonyms", metavar="PLIK",
+                        help="plik JSON z grupami synonimów odpowiedzi (domyślnie synonyms.json z paczki lub assets)")
+    parser.add_argument("--trace-file", metavar="PLIK",
+                        help="po zamknięciu zapisz histogramy opóźnień akcji operatora do pliku JSON")
+    return parser.parse_args(argv)
+
+def load_sound_manager(profiler, panels, low_latency, done, estimate_latency=False):
+    """
+    Importuje pygame i tworzy SoundManager w wątku tła, po pokazaniu okna.
+
+    Args:
+        profiler (StartupProfiler): Profiler startu.
+        panels (list): Panele, którym należy przekazać gotowy SoundManager.
+        low_latency (bool): Czy włączyć tryb niskich opóźnień dźwięku.
+        done (threading.Event): Ustawiane po zakończeniu ładowania.
+        estimate_latency (bool): Czy zbierać szacunki opóźnienia efektów.
+    """
+    try:
+        with profiler.phase("import sound_manager (pygame)"):
+            from sound_manager import SoundManager
+        with profiler.phase("SoundManager()"):
+            sound_manager = SoundManager(low_latency=low_latency, estimate_latency=estimate_latency)
+        for panel in panels:
+            panel.sound_manager = sound_manager
+    except ImportError:
+        pass
+    finally:
+        done.set()
+
+def main(argv=None):
     """Główny punkt wejścia do aplikacji Familiada."""
-    root = tk.Tk()
-    game = Game()
-    # Przykładowe pytania
-    game.add_question("Podaj popularne imiona w Polsce", [
-        ("Jan", 35),
-        ("Anna", 30),
-        ("Piotr", 20),
-        ("Katarzyna", 10),
-        ("Andrzej", 5)
-    ])
-    game.add_question("Wymień przysmaki na weselu", [
-        ("Sałatka jarzynowa", 40),
-        ("Rolada", 30),
-        ("Pasztet", 20),
-        ("Śledzie", 10)
-    ])
-
-    sound_manager = SoundManager() if SoundManager is not None else None
-    tv_panel = TVPanel(root, game, sound_manager)
-    admin_panel = AdminPanel(root, game, tv_panel, sound_manager)
-
-    admin_panel.pack(fill="both", expand=True)
+    args = parse_args(argv)
+    profiler = StartupProfiler(enabled=args.profile_startup, start=_PROCESS_START)
+    with profiler.phase("import tkinter"):
+        import tkinter as tk
+    with profiler.phase("import game"):
+        from game import Game, QuestionFileError
+        from answer_matcher import load_synonyms
+        from utils import resource_path
+    with profiler.phase("import tv_panel"):
+        from tv_panel import TVPanel
+    with profiler.phase("import admin_panel"):
+        from admin_panel import AdminPanel
+
+    with profiler.phase("tk.Tk()"):
+        root = tk.Tk()
+    with profiler.phase("Game() i przykładowe pytania"):
+        game = Game()
+        if args.pack:
+            # Dźwięki (SoundManager) i synonimy są rozwiązywane dalej przez resource_path, już z paczki
+            try:
+                game.open_pack(args.pack)
+            except QuestionFileError as e:
+                print(f"Nie udało się otworzyć paczki {args.pack}: {e}")
+        if len(game.questions) == 0:
+            # Przykładowe pytania
+            game.add_question("Podaj popularne imiona w Polsce", [
+                ("Jan", 35),
+                ("Anna", 30),
+                ("Piotr", 20),
+                ("Katarzyna", 10),
+                ("Andrzej", 5)
+            ])
+            game.add_question("Wymień przysmaki na weselu", [
+                ("Sałatka jarzynowa", 40),
+                ("Rolada", 30),
+                ("Pasztet", 20),
+                ("Śledzie", 10)
+            ])
+        synonyms_path = args.synonyms or resource_path("synonyms.json")
+        if args.synonyms or os.path.exists(synonyms_path):
+            game.matcher.set_synonyms(load_synonyms(synonyms_path))
+
+    # Dźwięki (pygame) ładowane są w tle dopiero po pokazaniu okna administratora
+    remote_tv = None
+    if args.remote_tv:
+        from remote_display import RemoteTVServer, parse_address
+        host, port = parse_address(args.remote_tv)
+        remote_tv = RemoteTVServer(game, root, host, port)
+        try:
+            remote_tv.start()
+        except OSError as e:
+            logging.error("%s - program działa bez zdalnego ekranu TV", e)
+            remote_tv = None
+    else:
+        with profiler.phase("TVPanel()"):
+            TVPanel(root, game, dot_matrix=args.dot_matrix)
+    if args.host_monitor or args.scoreboard:
+        from views import HostMonitor, ScoreboardStrip
+        if args.host_monitor:
+            HostMonitor(root, game)
+        if args.scoreboard:
+            ScoreboardStrip(root, game)
+    with profiler.phase("AdminPanel()"):
+        admin_panel = AdminPanel(root, game, None)
+        admin_panel.pack(fill="both", expand=True)
+
+    sounds_loaded = threading.Event()
+
+    def on_window_shown():
+        profiler.mark("okna widoczne")
+        threading.Thread(target=load_sound_manager, name="sound-startup", daemon=True,
+                         args=(profiler, [admin_panel], args.low_latency, sounds_loaded,
+                               args.sound_latency_estimate)).start()
+        if profiler.enabled:
+            report_when_loaded()
+
+    def report_when_loaded():
+        if sounds_loaded.is_set():
+            profiler.report()
+        else:
+            root.after(50, report_when_loaded)
+
+    buzzer = None
+    if args.buzzer:
+        from buzzer import GameBuzzer, DEFAULT_PORT as BUZZER_PORT
+        from remote_display import parse_address
+        host, port = parse_address(args.buzzer, default_port=BUZZER_PORT)
+        buzzer = GameBuzzer(game, root, host, port)
+        try:
+            buzzer.start()
+        except OSError as e:
+            logging.error("%s - program działa bez przycisków zawodników", e)
+            buzzer.stop()
+            buzzer = None
+
+    root.after_idle(on_window_shown)
+    game.start_autosave()
     root.mainloop()
+    game.stop_autosave()
+    if remote_tv is not None:
+        remote_tv.stop()
+    if buzzer is not None:
+        buzzer.stop()
+    if args.trace_file:
+        from tracing import tracer
+        tracer.dump(args.trace_file)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,73 @@
+class Answer:
+    """
+    Odpowiedź na pytanie wraz z liczbą punktów.
+
+    Args:
+        text (str): Tekst odpowiedzi.
+        points (int): Liczba punktów za odpowiedź.
+    """
+    __slots__ = ('text', 'points')
+
+    def __init__(self, text, points):
+        self.text = text
+        self.points = int(points)
+
+    def __repr__(self):
+        return f"Answer({self.text!r}, {self.points})"
+
+    def __eq__(self, other):
+        return isinstance(other, Answer) and (self.text, self.points) == (other.text, other.points)
+
+
+class Question:
+    """
+    Pytanie z banku pytań.
+
+    Obiekt jest współdzielony przez bank i rundę, dlatego nie przechowuje
+    stanu odkrycia odpowiedzi - ten znajduje się w Game.revealed_mask.
+
+    Args:
+        text (str): Tekst pytania.
+        answers (iterable): Odpowiedzi (Answer lub krotki (tekst, punkty)).
+    """
+    __slots__ = ('text', 'answers', 'total_points')
+
+    def __init__(self, text, answers):
+        self.text = text
+        self.answers = tuple(ans if isinstance(ans, Answer) else Answer(*ans) for ans in answers)
+        self.total_points = sum(ans.points for ans in self.answers)
+
+    def __repr__(self):
+        return f"Question({self.text!r}, {list(self.answers)!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, Question) and (self.text, self.answers) == (other.text, other.answers)
+
+    def __len__(self):
+        return len(self.answers)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Tworzy pytanie ze słownika w formacie plików JSON.
+
+        Args:
+            data (dict): Słownik {'question', 'answers': [{'answer', 'points'}]}.
+
+        Returns:
+            Question: Nowe pytanie.
+        """
+        return cls(data['question'], [(ans['answer'], ans['points']) for ans in data['answers']])
+
+    def to_dict(self):
+        """
+        Zwraca pytanie jako słownik w formacie plików JSON.
+
+        Returns:
+            dict: Słownik {'question', 'answers': [{'answer', 'points', 'revealed'}]}.
+        """
+        return {
+            'question': self.text,
+            'answers': [{'answer': ans.text, 'points': ans.points, 'revealed': False}
+                        for ans in self.answers]
+        }
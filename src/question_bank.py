@@ -0,0 +1,385 @@
+import json
+import os
+import sqlite3
+import logging
+import tempfile
+import threading
+from models import Question
+
+SQLITE_HEADER = b"SQLite format 3\x00"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    pos INTEGER NOT NULL UNIQUE,
+    question TEXT NOT NULL,
+    answers TEXT NOT NULL
+);
+"""
+
+
+def is_bank_file(file_path):
+    """
+    Sprawdza, czy plik jest bankiem pytań (bazą SQLite).
+
+    Args:
+        file_path (str): Ścieżka do pliku.
+
+    Returns:
+        bool: True, jeśli plik zaczyna się nagłówkiem SQLite.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def _temp_path_for(file_path):
+    """Tworzy pusty plik tymczasowy w katalogu pliku docelowego (dla os.replace)."""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".familiada-", suffix=".tmp", dir=directory)
+    os.close(fd)
+    return tmp_path
+
+
+class QuestionBank:
+    """
+    Indeksowany bank pytań zapisany w pliku SQLite.
+
+    Otwarcie banku nie wczytuje pytań - pojedyncze pytanie jest odczytywane
+    z bazy dopiero przy dostępie przez indeks. Bank zachowuje się jak lista
+    obiektów Question.
+
+    Zmiany trafiają do otwartej transakcji i są oznaczane jako niezapisane;
+    commit() zapisuje na dysku tylko zmienione strony bazy, atomowo.
+    Wszystkie operacje są chronione blokadą, więc zapis może działać
+    w wątku tła.
+
+    Args:
+        path (str): Ścieżka do pliku banku lub ":memory:" dla banku w pamięci.
+    """
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        row = self._conn.execute("SELECT MAX(pos) FROM questions").fetchone()
+        self._count = 0 if row[0] is None else row[0] + 1
+        self._dirty = set()  # indeksy pytań zmienionych od ostatniego zapisu
+
+    @property
+    def lock(self):
+        """threading.RLock: Blokada banku - do operacji złożonych z kilku kroków."""
+        return self._lock
+
+    @property
+    def in_memory(self):
+        """bool: True, jeśli bank nie jest powiązany z plikiem."""
+        return self.path == ":memory:"
+
+    @property
+    def dirty(self):
+        """bool: True, jeśli bank ma zmiany niezapisane od ostatniego commit()."""
+        return bool(self._dirty)
+
+    def __len__(self):
+        return self._count
+
+    def _normalize_index(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Indeks pytania poza zakresem")
+        return index
+
+    def __getitem__(self, index):
+        """
+        Materializuje pytanie o podanym indeksie.
+
+        Args:
+            index (int): Indeks pytania.
+
+        Returns:
+            Question: Pytanie z odpowiedziami.
+        """
+        with self._lock:
+            index = self._normalize_index(index)
+            row = self._conn.execute(
+                "SELECT question, answers FROM questions WHERE pos = ?", (index,)
+            ).fetchone()
+        return self._materialize(row[0], row[1])
+
+    def __iter__(self):
+        for text, answers in self._rows():
+            yield self._materialize(text, answers)
+
+    def _rows(self):
+        """Zwraca surowe wiersze (tekst, odpowiedzi JSON) całego banku."""
+        with self._lock:
+            return self._conn.execute("SELECT question, answers FROM questions ORDER BY pos").fetchall()
+
+    @staticmethod
+    def _materialize(text, answers_json):
+        return Question(text, json.loads(answers_json))
+
+    @staticmethod
+    def _serialize(question):
+        answers = [[ans.text, ans.points] for ans in question.answers]
+        return question.text, json.dumps(answers, ensure_ascii=False)
+
+    def title(self, index):
+        """
+        Zwraca sam tekst pytania bez wczytywania odpowiedzi.
+
+        Args:
+            index (int): Indeks pytania.
+
+        Returns:
+            str: Tekst pytania.
+        """
+        with self._lock:
+            index = self._normalize_index(index)
+            row = self._conn.execute("SELECT question FROM questions WHERE pos = ?", (index,)).fetchone()
+        return row[0]
+
+    def titles(self, start=0, stop=None):
+        """
+        Zwraca teksty pytań z podanego zakresu indeksów.
+
+        Args:
+            start (int): Pierwszy indeks (włącznie).
+            stop (int): Ostatni indeks (wyłącznie), domyślnie koniec banku.
+
+        Returns:
+            list: Lista tekstów pytań.
+        """
+        with self._lock:
+            if stop is None:
+                stop = self._count
+            cursor = self._conn.execute(
+                "SELECT question FROM questions WHERE pos >= ? AND pos < ? ORDER BY pos", (start, stop)
+            )
+            return [row[0] for row in cursor]
+
+    def titles_at(self, indices):
+        """
+        Zwraca teksty pytań o podanych indeksach.
+
+        Args:
+            indices (list): Indeksy pytań.
+
+        Returns:
+            list: Teksty pytań w kolejności indeksów.
+        """
+        if not indices:
+            return []
+        placeholders = ",".join("?" * len(indices))
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT pos, question FROM questions WHERE pos IN ({placeholders})", list(indices)
+            )
+            found = dict(cursor.fetchall())
+        return [found[i] for i in indices]
+
+    def search_rows(self):
+        """
+        Zwraca teksty pytań i odpowiedzi do zbudowania indeksu wyszukiwania.
+
+        Yields:
+            tuple: (tekst pytania, lista tekstów odpowiedzi) w kolejności indeksów.
+        """
+        for text, answers in self._rows():
+            yield text, [ans for ans, _ in json.loads(answers)]
+
+    def append(self, question):
+        """
+        Dodaje pytanie na końcu banku.
+
+        Args:
+            question (Question): Pytanie.
+        """
+        text, answers = self._serialize(question)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO questions (pos, question, answers) VALUES (?, ?, ?)",
+                (self._count, text, answers)
+            )
+            self._dirty.add(self._count)
+            self._count += 1
+
+    def extend(self, questions):
+        """
+        Dodaje wiele pytań naraz.
+
+        Args:
+            questions (iterable): Obiekty Question.
+        """
+        with self._lock:
+            rows = []
+            for offset, question in enumerate(questions):
+                text, answers = self._serialize(question)
+                rows.append((self._count + offset, text, answers))
+            self._conn.executemany(
+                "INSERT INTO questions (pos, question, answers) VALUES (?, ?, ?)", rows
+            )
+            self._dirty.update(range(self._count, self._count + len(rows)))
+            self._count += len(rows)
+
+    def __delitem__(self, index):
+        """
+        Usuwa pytanie i przesuwa indeksy kolejnych pytań.
+
+        Args:
+            index (int): Indeks pytania.
+        """
+        with self._lock:
+            index = self._normalize_index(index)
+            self._conn.execute("DELETE FROM questions WHERE pos = ?", (index,))
+            # Przesunięcie w dwóch krokach, aby nie naruszyć unikalności pos
+            self._conn.execute("UPDATE questions SET pos = -pos WHERE pos > ?", (index,))
+            self._conn.execute("UPDATE questions SET pos = -pos - 1 WHERE pos < 0")
+            self._dirty.add(index)
+            self._count -= 1
+
+    def commit(self):
+        """
+        Zapisuje niezapisane zmiany w pliku banku.
+
+        SQLite zapisuje tylko zmienione strony bazy, a transakcja gwarantuje,
+        że przerwany zapis nie uszkodzi pliku.
+
+        Returns:
+            int: Liczba zmienionych pozycji (dodanych lub usuniętych pytań).
+        """
+        with self._lock:
+            changed = len(self._dirty)
+            self._conn.commit()
+            self._dirty.clear()
+        return changed
+
+    def import_json(self, file_path):
+        """
+        Importuje pytania z pliku JSON w starym formacie (lista słowników).
+
+        Args:
+            file_path (str): Ścieżka do pliku JSON.
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            self.extend(Question.from_dict(data) for data in json.load(f))
+
+    def export_json(self, file_path):
+        """
+        Eksportuje cały bank do pliku JSON w starym formacie.
+
+        Plik jest zapisywany do pliku tymczasowego i podmieniany atomowo,
+        więc przerwany zapis nie uszkadza poprzedniej wersji.
+
+        Args:
+            file_path (str): Ścieżka do pliku docelowego.
+        """
+        questions = [question.to_dict() for question in self]
+        tmp_path = _temp_path_for(file_path)
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(questions, f, ensure_ascii=False, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def save_as(self, file_path):
+        """
+        Kopiuje bank do nowego pliku SQLite (atomowo, przez plik tymczasowy).
+
+        Args:
+            file_path (str): Ścieżka do pliku docelowego.
+        """
+        tmp_path = _temp_path_for(file_path)
+        try:
+            target = sqlite3.connect(tmp_path)
+            try:
+                with self._lock:
+                    self._conn.commit()
+                    self._dirty.clear()
+                    self._conn.backup(target)
+            finally:
+                target.close()
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def close(self):
+        """Zapisuje niezapisane zmiany i zamyka połączenie z bazą."""
+        with self._lock:
+            if not self.in_memory:
+                self._conn.commit()
+            self._conn.close()
+
+
+def open_bank(file_path):
+    """
+    Otwiera bank pytań z pliku SQLite lub importuje stary plik JSON.
+
+    Args:
+        file_path (str): Ścieżka do pliku banku albo pliku JSON.
+
+    Returns:
+        QuestionBank: Otwarty bank pytań.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(file_path)
+    if is_bank_file(file_path):
+        return QuestionBank(file_path)
+    bank = QuestionBank()
+    try:
+        bank.import_json(file_path)
+        bank.commit()
+    except Exception:
+        bank.close()
+        raise
+    logging.info("Zaimportowano pytania z pliku JSON: %s", file_path)
+    return bank
+
+
+class Autosaver:
+    """
+    Okresowo zapisuje zmiany banku pytań w wątku tła.
+
+    Args:
+        get_bank (callable): Funkcja zwracająca aktualny bank (Game może go podmienić).
+        interval (float): Odstęp między zapisami w sekundach.
+    """
+    def __init__(self, get_bank, interval=30.0):
+        self.get_bank = get_bank
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+
+    def start(self):
+        """Uruchamia wątek autozapisu."""
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.save_now()
+
+    def save_now(self):
+        """Zapisuje zmiany banku powiązanego z plikiem, jeśli jakieś są."""
+        bank = self.get_bank()
+        if bank.in_memory or not bank.dirty:
+            return
+        try:
+            changed = bank.commit()
+            logging.info("Autozapis: zapisano %d zmienionych pytań.", changed)
+        except sqlite3.Error as e:
+            logging.error("Błąd autozapisu pytań: %s", e)
+
+    def stop(self):
+        """Zatrzymuje wątek autozapisu i zapisuje ostatnie zmiany."""
+        self._stop.set()
+        self.save_now()
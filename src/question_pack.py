@@ -0,0 +1,307 @@
+"""
+Paczka pytań: jeden plik z pytaniami, logo intro i dźwiękami programu.
+
+Paczka to archiwum ZIP (rozszerzenie .familiada) z plikiem manifest.json,
+pytaniami w formacie JSON oraz zasobami w katalogu assets/ (te same nazwy
+co w dołączonym folderze assets, np. assets/intro.mp3). Obrazy i dźwięki
+są zapisywane bez kompresji, więc po otwarciu paczki są po prostu
+fragmentami pliku zmapowanego w pamięci (mmap). Otwarcie paczki czyta
+tylko katalog archiwum i manifest - nawet paczka z intro zajmującym setki
+MB otwiera się od razu, a zasób jest kopiowany na dysk (pygame i PIL
+potrzebują ścieżek) dopiero przy pierwszym użyciu.
+
+Przykład:
+    python question_pack.py show.familiada --questions pytania.db --intro logo.png \\
+        --asset ../assets/intro.mp3 --title "Odcinek 12"
+"""
+import os
+import sys
+import json
+import mmap
+import struct
+import shutil
+import hashlib
+import logging
+import argparse
+import threading
+import zipfile
+from models import Question
+from question_bank import open_bank, _temp_path_for
+
+PACK_EXTENSION = ".familiada"
+PACK_FORMAT = 1
+MANIFEST = "manifest.json"
+QUESTIONS = "questions.json"
+ASSETS_DIR = "assets/"
+ZIP_HEADER = b"PK\x03\x04"
+
+# Katalog, do którego kopiowane są używane zasoby paczek
+DEFAULT_EXTRACT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "familiada", "packs")
+
+# Lokalny nagłówek pliku w archiwum ZIP: stała część i położenie długości nazwy
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_NAME_LENGTHS = 26
+
+
+def is_pack_file(file_path):
+    """
+    Sprawdza, czy plik jest paczką pytań (archiwum ZIP).
+
+    Args:
+        file_path (str): Ścieżka do pliku.
+
+    Returns:
+        bool: True, jeśli plik zaczyna się nagłówkiem ZIP.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(len(ZIP_HEADER)) == ZIP_HEADER
+    except OSError:
+        return False
+
+
+class QuestionPack:
+    """
+    Otwarta paczka pytań z leniwym dostępem do zawartości.
+
+    Plik paczki jest mapowany w pamięci. Zasoby zapisane bez kompresji są
+    udostępniane jako memoryview fragmentu mapy (bez kopiowania), a
+    extract() kopiuje zasób do katalogu pamięci podręcznej tylko raz - przy
+    kolejnych uruchomieniach z tą samą paczką używany jest gotowy plik.
+
+    Args:
+        path (str): Ścieżka do pliku paczki.
+        extract_dir (str): Katalog pamięci podręcznej wypakowanych zasobów.
+
+    Raises:
+        ValueError: Gdy plik nie jest poprawną paczką pytań.
+    """
+    def __init__(self, path, extract_dir=DEFAULT_EXTRACT_DIR):
+        self.path = os.path.abspath(path)
+        self._lock = threading.Lock()
+        self._member_locks = {}  # nazwa zasobu w paczce -> blokada jego wypakowania
+        self._extracted = {}  # nazwa zasobu w paczce -> ścieżka na dysku
+        self._file = open(self.path, 'rb')
+        try:
+            stat = os.fstat(self._file.fileno())
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            # ZipFile czyta tylko katalog centralny na końcu pliku
+            self._zip = zipfile.ZipFile(self._file)
+            self._members = {info.filename: info for info in self._zip.infolist()}
+            if MANIFEST not in self._members:
+                raise ValueError("Brak manifestu paczki")
+            self.manifest = json.loads(self.read(MANIFEST))
+            if self.manifest.get("format") != PACK_FORMAT:
+                raise ValueError(f"Nieobsługiwany format paczki: {self.manifest.get('format')}")
+        except BaseException:
+            self.close()
+            raise
+        key = f"{self.path}|{stat.st_mtime_ns}|{stat.st_size}"
+        self.extract_dir = os.path.join(extract_dir, hashlib.sha1(key.encode("utf-8")).hexdigest()[:16])
+
+    @property
+    def title(self):
+        """str: Nazwa paczki z manifestu."""
+        return self.manifest.get("title") or os.path.basename(self.path)
+
+    @property
+    def intro_image(self):
+        """str: Nazwa logo intro w paczce lub None."""
+        return self.manifest.get("intro_image")
+
+    def __contains__(self, name):
+        return name in self._members
+
+    def member_view(self, name):
+        """
+        Zwraca zawartość elementu paczki.
+
+        Element zapisany bez kompresji jest zwracany jako widok fragmentu
+        mapy pliku (bez kopiowania i bez czytania pliku przed pierwszym
+        dostępem do stron). Element skompresowany jest rozpakowywany.
+
+        Args:
+            name (str): Nazwa elementu w paczce.
+
+        Returns:
+            memoryview: Zawartość elementu.
+
+        Raises:
+            KeyError: Gdy paczka nie zawiera elementu.
+        """
+        info = self._members[name]
+        if info.compress_type != zipfile.ZIP_STORED:
+            return memoryview(self._zip.read(info))
+        offset = info.header_offset
+        if self._map[offset:offset + len(ZIP_HEADER)] != ZIP_HEADER:
+            raise ValueError(f"Uszkodzony nagłówek elementu paczki: {name}")
+        name_length, extra_length = struct.unpack_from("<HH", self._map, offset + _LOCAL_NAME_LENGTHS)
+        start = offset + _LOCAL_HEADER_SIZE + name_length + extra_length
+        return memoryview(self._map)[start:start + info.file_size]
+
+    def read(self, name):
+        """
+        Zwraca zawartość elementu paczki jako bytes.
+
+        Args:
+            name (str): Nazwa elementu w paczce.
+
+        Returns:
+            bytes: Zawartość elementu.
+        """
+        with self.member_view(name) as view:
+            return view.tobytes()
+
+    def _member_lock(self, name):
+        with self._lock:
+            lock = self._member_locks.get(name)
+            if lock is None:
+                lock = self._member_locks[name] = threading.Lock()
+            return lock
+
+    def extract(self, name, wait=True):
+        """
+        Zwraca ścieżkę pliku z zawartością elementu, kopiując go przy pierwszym użyciu.
+
+        Metoda jest bezpieczna wątkowo. Każdy element ma własną blokadę,
+        więc kopiowanie dużego logo nie wstrzymuje wypakowania dźwięku.
+        Kopiowanie może trwać długo - wywołuj z wait=True tylko poza wątkiem Tk.
+
+        Args:
+            name (str): Nazwa elementu w paczce.
+            wait (bool): False zwraca tylko ścieżkę już wypakowanego elementu
+                (albo None), bez kopiowania i bez czekania - dla wątku Tk.
+
+        Returns:
+            str: Ścieżka do pliku na dysku lub None (tylko przy wait=False).
+
+        Raises:
+            KeyError: Gdy paczka nie zawiera elementu.
+        """
+        if not wait:
+            return self._extracted.get(name)
+        with self._member_lock(name):
+            path = self._extracted.get(name)
+            if path is not None:
+                return path
+            info = self._members[name]
+            # Nazwy z archiwum nie mogą wyjść poza katalog paczki
+            parts = [part for part in name.split("/") if part not in ("", ".", "..")]
+            path = os.path.join(self.extract_dir, *parts)
+            if not (os.path.exists(path) and os.path.getsize(path) == info.file_size):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = _temp_path_for(path)
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        if info.compress_type == zipfile.ZIP_STORED:
+                            with self.member_view(name) as view:
+                                f.write(view)
+                        else:
+                            with self._zip.open(info) as source:
+                                shutil.copyfileobj(source, f)
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+            self._extracted[name] = path
+            return path
+
+    def resource_path(self, filename):
+        """
+        Zwraca ścieżkę zasobu programu (np. "intro.mp3") z paczki.
+
+        Args:
+            filename (str): Nazwa pliku w folderze assets.
+
+        Returns:
+            str: Ścieżka do wypakowanego zasobu lub None, gdy paczka go nie zawiera.
+        """
+        name = ASSETS_DIR + filename
+        if name not in self._members:
+            return None
+        return self.extract(name)
+
+    def questions(self):
+        """
+        Wczytuje pytania paczki.
+
+        Returns:
+            list: Lista obiektów Question.
+        """
+        data = json.loads(self.read(self.manifest.get("questions", QUESTIONS)))
+        return [Question.from_dict(item) for item in data]
+
+    def close(self):
+        """Zamyka paczkę (wypakowane zasoby pozostają na dysku)."""
+        for name in ("_zip", "_map", "_file"):
+            resource = getattr(self, name, None)
+            if resource is not None:
+                try:
+                    resource.close()
+                except BufferError:
+                    # Ktoś wciąż trzyma widok mapy - zwolni ją odśmiecanie
+                    logging.debug("Mapa paczki %s jest jeszcze używana", self.path)
+
+
+def build_pack(output, questions, intro_image=None, assets=(), title=None):
+    """
+    Zapisuje paczkę pytań (atomowo, przez plik tymczasowy).
+
+    Pytania i manifest są kompresowane, a obrazy i dźwięki zapisywane bez
+    kompresji (i tak są już skompresowane), dzięki czemu paczka może
+    udostępniać je bezpośrednio z mapy pliku.
+
+    Args:
+        output (str): Ścieżka do pliku paczki.
+        questions (iterable): Obiekty Question.
+        intro_image (str): Ścieżka do logo intro (opcjonalnie).
+        assets (iterable): Ścieżki do plików zastępujących zasoby z folderu assets.
+        title (str): Nazwa paczki.
+    """
+    manifest = {"format": PACK_FORMAT, "title": title or "", "questions": QUESTIONS}
+    files = {}  # nazwa w paczce -> ścieżka źródłowa
+    if intro_image:
+        manifest["intro_image"] = "intro" + os.path.splitext(intro_image)[1].lower()
+        files[manifest["intro_image"]] = intro_image
+    for asset in assets:
+        files[ASSETS_DIR + os.path.basename(asset)] = asset
+    tmp_path = _temp_path_for(output)
+    try:
+        with zipfile.ZipFile(tmp_path, 'w') as archive:
+            archive.writestr(MANIFEST, json.dumps(manifest, ensure_ascii=False, indent=4),
+                             compress_type=zipfile.ZIP_DEFLATED)
+            archive.writestr(QUESTIONS, json.dumps([q.to_dict() for q in questions], ensure_ascii=False),
+                             compress_type=zipfile.ZIP_DEFLATED)
+            for name, source in files.items():
+                archive.write(source, name, compress_type=zipfile.ZIP_STORED)
+        os.replace(tmp_path, output)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def main(argv=None):
+    """Buduje paczkę pytań z wiersza poleceń."""
+    parser = argparse.ArgumentParser(description="Tworzy paczkę pytań Familiady")
+    parser.add_argument("output", help=f"plik paczki (zwykle z rozszerzeniem {PACK_EXTENSION})")
+    parser.add_argument("--questions", required=True, help="bank pytań (.db) lub plik JSON")
+    parser.add_argument("--intro", help="logo wyświetlane w intro")
+    parser.add_argument("--asset", action="append", default=[],
+                        help="plik zastępujący zasób z folderu assets (np. intro.mp3); można powtarzać")
+    parser.add_argument("--title", help="nazwa paczki")
+    args = parser.parse_args(argv)
+
+    bank = open_bank(args.questions)
+    try:
+        build_pack(args.output, bank, args.intro, args.asset, args.title)
+        count = len(bank)
+    finally:
+        bank.close()
+    print(f"Zapisano paczkę: {args.output} ({count} pytań, {os.path.getsize(args.output)} B)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
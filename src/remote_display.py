@@ -0,0 +1,447 @@
+"""
+Zdalny panel TV: wyświetlacz działający jako osobny proces na innym komputerze.
+
+Komputer operatora uruchamia aplikację z opcją --remote-tv, a zamiast okna
+TVPanel powstaje RemoteTVServer, który wysyła stan gry przez TCP.
+Komputer podłączony do telewizora uruchamia:
+
+    python remote_display.py ADRES[:PORT]
+
+Wiadomości to linie JSON zawierające tylko zmienione pola stanu:
+    q  - bieżące pytanie [indeks, tekst, [[odpowiedź, punkty], ...]] lub null,
+    m  - maska bitowa odkrytych odpowiedzi,
+    e  - liczby błędów [lewa, prawa],
+    s  - wyniki [lewa, prawa],
+    n  - nazwy drużyn [lewa, prawa],
+    b  - drużyna, która pierwsza nacisnęła przycisk, lub null,
+    ev - lista zdarzeń bez stanu, np. [["x", "left"]] (duże X) albo [["intro"]].
+Po połączeniu klient dostaje pełny stan (snap), więc po zerwaniu połączenia
+ekran wraca do aktualnego stanu zaraz po ponownym połączeniu.
+"""
+import sys
+import json
+import queue
+import socket
+import asyncio
+import logging
+import argparse
+import threading
+from models import Question
+from batched_view import BatchedSubscriber
+from events import QuestionSelected, ConsultationMistake, IntroStarted, GameReset
+
+DEFAULT_PORT = 8765
+# Odstęp wiadomości podtrzymujących połączenie i czas, po którym klient uznaje je za zerwane
+PING_INTERVAL = 1.0
+PING_TIMEOUT = 3.0
+# Kolejne opóźnienia ponownego łączenia w sekundach
+RECONNECT_DELAYS = (0.1, 0.25, 0.5, 1.0, 2.0)
+# Klient, który nie odbiera danych i ma w buforze więcej bajtów, jest rozłączany
+MAX_CLIENT_BUFFER = 256 * 1024
+
+
+def game_state(game):
+    """
+    Zwraca stan gry potrzebny do wyświetlenia panelu TV.
+
+    Args:
+        game (Game): Silnik gry.
+
+    Returns:
+        dict: Stan w formacie wiadomości (klucze q, m, e, s, n).
+    """
+    question = game.current_question
+    if question is None:
+        q = None
+    else:
+        q = [game.current_question_index, question.text, [[ans.text, ans.points] for ans in question.answers]]
+    return {
+        'q': q,
+        'm': game.revealed_mask,
+        'e': [game.team1_mistakes, game.team2_mistakes],
+        's': [game.team1_score, game.team2_score],
+        'n': [game.team1_name, game.team2_name],
+        'b': game.buzz_winner,
+    }
+
+
+def state_delta(old, new):
+    """
+    Zwraca pola stanu, które zmieniły się między old a new.
+
+    Args:
+        old (dict): Poprzedni stan.
+        new (dict): Nowy stan.
+
+    Returns:
+        dict: Zmienione pola.
+    """
+    return {key: value for key, value in new.items() if old.get(key) != value}
+
+
+def encode(message):
+    """Koduje wiadomość jako zwartą linię JSON."""
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def parse_address(address, default_host="0.0.0.0", default_port=DEFAULT_PORT):
+    """
+    Rozdziela adres "host:port", "host" albo "port".
+
+    Returns:
+        tuple: (host, port).
+    """
+    host, _, port = address.rpartition(":")
+    if not host and not port.isdigit():
+        return port, default_port
+    if not port.isdigit():
+        return address, default_port
+    return host or default_host, int(port)
+
+
+def _set_nodelay(writer):
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class RemoteTVServer:
+    """
+    Wysyła zmiany stanu gry do zdalnych ekranów TV.
+
+    Serwer jest widokiem gry jak TVPanel: subskrybuje zdarzenia Game.events
+    i po każdej paczce zdarzeń porównuje stan gry z ostatnio wysłanym,
+    rozsyłając tylko różnicę. Serwer asyncio działa w wątku tła.
+
+    Args:
+        game (Game): Silnik gry.
+        widget (tk.Misc): Widżet, którego pętla zdarzeń zbiera zdarzenia gry.
+        host (str): Adres nasłuchiwania.
+        port (int): Port nasłuchiwania.
+    """
+    def __init__(self, game, widget, host="0.0.0.0", port=DEFAULT_PORT):
+        self.game = game
+        self.host = host
+        self.port = port
+        self._subscription = BatchedSubscriber(game.events, widget, self.handle_events)
+        self._state = game_state(game)  # ostatnio rozesłany stan
+        self._state_lock = threading.Lock()
+        self._clients = set()
+        self._loop = None
+        self._server = None
+        self._ping_task = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="remote-tv", daemon=True)
+
+    def start(self):
+        """Uruchamia serwer i czeka, aż zacznie nasłuchiwać."""
+        self._thread.start()
+        self._ready.wait()
+        if self._server is None:
+            # Bez działającej pętli zmiany stanu nie mają dokąd trafić
+            self._subscription.close()
+            raise OSError(f"Nie udało się uruchomić serwera zdalnego TV na {self.host}:{self.port}")
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle_client, self.host, self.port))
+            self.port = self._server.sockets[0].getsockname()[1]
+            logging.info("Serwer zdalnego TV nasłuchuje na %s:%d", self.host, self.port)
+        except OSError as e:
+            logging.error("Błąd serwera zdalnego TV: %s", e)
+            self._loop.close()
+            self._loop = None
+            return
+        finally:
+            self._ready.set()
+        self._ping_task = self._loop.create_task(self._ping())
+        self._loop.run_forever()
+
+    async def _handle_client(self, reader, writer):
+        _set_nodelay(writer)
+        peer = writer.get_extra_info("peername")
+        logging.info("Połączono zdalny ekran TV: %s", peer)
+        with self._state_lock:
+            snapshot = dict(self._state, snap=1)
+        writer.write(encode(snapshot))
+        self._clients.add(writer)
+        try:
+            # Klient nic nie wysyła; czekamy na zamknięcie połączenia
+            while await reader.read(1024):
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+            logging.info("Rozłączono zdalny ekran TV: %s", peer)
+
+    async def _ping(self):
+        data = encode({'p': 1})
+        while True:
+            await asyncio.sleep(PING_INTERVAL)
+            self._broadcast(data)
+
+    def _broadcast(self, data):
+        # Wykonywane w pętli asyncio
+        for writer in list(self._clients):
+            if writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                # Klient nie nadąża - po ponownym połączeniu dostanie pełny stan
+                logging.warning("Zdalny ekran TV nie odbiera danych, rozłączanie.")
+                self._clients.discard(writer)
+                writer.transport.abort()
+                continue
+            writer.write(data)
+
+    def sync(self, events=None, traces=None):
+        """
+        Rozsyła zmiany stanu gry od ostatniego wywołania.
+
+        Args:
+            events (list): Zdarzenia bez stanu do wysłania razem ze zmianami.
+            traces (list): Ślady akcji operatora; wysłanie zapisuje etap "tv_sent".
+        """
+        new_state = game_state(self.game)
+        with self._state_lock:
+            delta = state_delta(self._state, new_state)
+            self._state = new_state
+        if events:
+            delta['ev'] = events
+        if delta and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._broadcast, encode(delta))
+        for trace in traces or ():
+            trace.stage("tv_sent")
+
+    def handle_events(self, events):
+        """
+        Rozsyła jedną wiadomość dla paczki zdarzeń gry.
+
+        Args:
+            events (list): Zdarzenia GameEvent w kolejności publikacji.
+        """
+        remote_events = []
+        for event in events:
+            if isinstance(event, QuestionSelected) and event.index is not None:
+                remote_events.append(["answers"])
+            elif isinstance(event, IntroStarted):
+                remote_events.append(["intro"])
+            elif isinstance(event, GameReset):
+                remote_events.append(["reset"])
+            elif isinstance(event, ConsultationMistake):
+                remote_events.append(["x", event.team])
+        self.sync(remote_events, [event.trace for event in events if event.trace])
+
+    def stop(self):
+        """Zatrzymuje serwer i rozłącza klientów."""
+        if self._loop is None or self._server is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=2)
+        except Exception as e:
+            logging.warning("Błąd przy zatrzymywaniu serwera zdalnego TV: %s", e)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=2)
+
+    async def _shutdown(self):
+        self._server.close()
+        self._ping_task.cancel()
+        # Zamknięcie połączeń kończy też obsługujące je zadania _handle_client
+        for writer in list(self._clients):
+            writer.close()
+            await writer.wait_closed()
+        await asyncio.sleep(0)
+
+
+class StateReceiver:
+    """
+    Odbiera wiadomości serwera zdalnego TV w wątku tła i łączy się ponownie po zerwaniu.
+
+    Args:
+        host (str): Adres serwera.
+        port (int): Port serwera.
+        on_message (callable): Funkcja wywoływana w wątku tła z każdą wiadomością
+            (poza wiadomościami podtrzymującymi połączenie).
+        on_status (callable): Funkcja wywoływana z True/False przy połączeniu i rozłączeniu.
+    """
+    def __init__(self, host, port, on_message, on_status=None):
+        self.host = host
+        self.port = port
+        self.on_message = on_message
+        self.on_status = on_status
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._run()),
+                                        name="remote-tv-client", daemon=True)
+
+    def start(self):
+        """Uruchamia wątek odbierający."""
+        self._thread.start()
+
+    def stop(self):
+        """Kończy odbieranie po najbliższym zerwaniu lub upływie czasu oczekiwania."""
+        self._stop.set()
+
+    async def _run(self):
+        attempt = 0
+        while not self._stop.is_set():
+            try:
+                reader, writer = await asyncio.open_connection(self.host, self.port)
+            except OSError:
+                await asyncio.sleep(RECONNECT_DELAYS[min(attempt, len(RECONNECT_DELAYS) - 1)])
+                attempt += 1
+                continue
+            attempt = 0
+            _set_nodelay(writer)
+            if self.on_status:
+                self.on_status(True)
+            try:
+                await self._receive(reader)
+            except (OSError, asyncio.TimeoutError, ValueError) as e:
+                logging.warning("Zerwane połączenie z serwerem TV: %s", e)
+            finally:
+                writer.close()
+                if self.on_status:
+                    self.on_status(False)
+
+    async def _receive(self, reader):
+        while not self._stop.is_set():
+            line = await asyncio.wait_for(reader.readline(), PING_TIMEOUT)
+            if not line:
+                return
+            message = json.loads(line)
+            if 'p' not in message:
+                self.on_message(message)
+
+
+def apply_message(game, message):
+    """
+    Nakłada wiadomość na lokalną kopię stanu gry.
+
+    Args:
+        game (Game): Lokalna kopia gry (bez banku pytań).
+        message (dict): Wiadomość serwera.
+
+    Returns:
+        tuple: (czy zmieniło się pytanie, poprzednia maska odkrytych odpowiedzi).
+    """
+    old_mask = game.revealed_mask
+    question_changed = 'q' in message
+    if question_changed:
+        q = message['q']
+        if q is None:
+            game.current_question = None
+            game.current_question_index = None
+        else:
+            game.current_question_index = q[0]
+            game.current_question = Question(q[1], q[2])
+    if 'm' in message:
+        game.revealed_mask = message['m']
+    if 'e' in message:
+        game.team1_mistakes, game.team2_mistakes = message['e']
+    if 's' in message:
+        game.team1_score, game.team2_score = message['s']
+    if 'n' in message:
+        game.team1_name, game.team2_name = message['n']
+    if 'b' in message:
+        game.buzz_winner = message['b']
+    return question_changed, old_mask
+
+
+class RemoteTVDisplay:
+    """
+    Panel TV sterowany wiadomościami z serwera zdalnego TV.
+
+    Wiadomości są odbierane w wątku tła i nakładane w wątku Tk na lokalną
+    kopię Game, po czym wywoływane są te same metody TVPanel co lokalnie.
+
+    Args:
+        root (tk.Tk): Główne okno (ukryte).
+        host (str): Adres serwera.
+        port (int): Port serwera.
+        dot_matrix (bool): Czy panel ma rysować tablicę jak wyświetlacz punktowy.
+    """
+    POLL_MS = 5
+
+    def __init__(self, root, host, port, dot_matrix=False):
+        from game import Game
+        from tv_panel import TVPanel
+        self.root = root
+        self.game = Game()
+        # Kopia gry jest aktualizowana bez zdarzeń, więc panel sterujemy bezpośrednio
+        self.tv_panel = TVPanel(root, self.game, subscribe=False, dot_matrix=dot_matrix)
+        self.tv_panel.protocol("WM_DELETE_WINDOW", root.destroy)
+        self._messages = queue.Queue()
+        self.receiver = StateReceiver(host, port, self._messages.put,
+                                      lambda connected: self._messages.put({'connected': connected}))
+        self.receiver.start()
+        self._poll()
+
+    def _poll(self):
+        while True:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            self.apply(message)
+        self.root.after(self.POLL_MS, self._poll)
+
+    def apply(self, message):
+        """
+        Aktualizuje ekran na podstawie wiadomości serwera.
+
+        Args:
+            message (dict): Wiadomość serwera.
+        """
+        if 'connected' in message:
+            self.tv_panel.title("TV Panel - Familiada" if message['connected']
+                                else "TV Panel - Familiada (brak połączenia)")
+            return
+        question_changed, old_mask = apply_message(self.game, message)
+        events = message.get('ev', [])
+        tv = self.tv_panel
+        for event in events:
+            if event[0] == "intro":
+                tv.start_intro()
+            elif event[0] == "reset":
+                tv.reset_screen()
+            elif event[0] == "x":
+                tv.show_big_x(event[1])
+        if message.get('snap') or question_changed or ["answers"] in events:
+            if self.game.current_question is None:
+                tv.reset_screen()
+            else:
+                tv.animate_answers()
+            old_mask = 0
+        new_mask = self.game.revealed_mask
+        if self.game.current_question is not None and new_mask & ~old_mask:
+            for idx in range(len(self.game.current_question.answers)):
+                if new_mask >> idx & 1 and not old_mask >> idx & 1:
+                    tv.animate_reveal_answer(idx)
+        if 'e' in message or 's' in message:
+            tv.update_error_panels()
+        if 'n' in message:
+            tv.update_score_labels()
+        if message.get('b') and not message.get('snap'):
+            tv.show_buzz_winner(message['b'])
+
+
+def main(argv=None):
+    """Uruchamia zdalny panel TV."""
+    parser = argparse.ArgumentParser(description="Zdalny panel TV Familiada")
+    parser.add_argument("server", help="adres komputera operatora: HOST[:PORT]")
+    parser.add_argument("--dot-matrix", action="store_true",
+                        help="tablica odpowiedzi w stylu wyświetlacza punktowego")
+    args = parser.parse_args(argv)
+    host, port = parse_address(args.server, default_host="localhost")
+
+    import tkinter as tk
+    root = tk.Tk()
+    root.withdraw()
+    RemoteTVDisplay(root, host, port, args.dot_matrix)
+    root.mainloop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
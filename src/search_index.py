@@ -0,0 +1,100 @@
+from array import array
+from utils import fold_text
+
+
+def trigrams(text):
+    """
+    Zwraca zbiór trigramów znormalizowanego tekstu.
+
+    Args:
+        text (str): Tekst po fold_text.
+
+    Returns:
+        set: Zbiór trzyznakowych fragmentów tekstu.
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """
+    Trigramowy indeks odwrócony do wyszukiwania pytań.
+
+    Indeksowany jest tekst pytania razem z odpowiedziami, po usunięciu
+    polskich znaków diakrytycznych. Wyniki to indeksy pytań w banku,
+    w kolejności rosnącej.
+    """
+    def __init__(self):
+        self._postings = {}  # trigram -> array indeksów pytań
+        self._documents = []  # znormalizowany tekst każdego pytania
+
+    def __len__(self):
+        return len(self._documents)
+
+    def add(self, question_text, answers=()):
+        """
+        Dopisuje pytanie na końcu indeksu.
+
+        Args:
+            question_text (str): Tekst pytania.
+            answers (iterable): Teksty odpowiedzi.
+        """
+        doc_id = len(self._documents)
+        document = fold_text(" ".join([question_text, *answers]))
+        self._documents.append(document)
+        for gram in trigrams(document):
+            postings = self._postings.get(gram)
+            if postings is None:
+                postings = self._postings[gram] = array('I')
+            postings.append(doc_id)
+
+    def build(self, questions):
+        """
+        Buduje indeks od nowa.
+
+        Args:
+            questions (iterable): Pary (tekst pytania, lista tekstów odpowiedzi).
+        """
+        self._postings = {}
+        self._documents = []
+        for question_text, answers in questions:
+            self.add(question_text, answers)
+
+    def search(self, query, limit=None):
+        """
+        Wyszukuje pytania zawierające wszystkie słowa zapytania.
+
+        Args:
+            query (str): Zapytanie wpisane przez operatora.
+            limit (int): Maksymalna liczba wyników (domyślnie bez limitu).
+
+        Returns:
+            list: Indeksy pasujących pytań.
+        """
+        words = fold_text(query).split()
+        if not words:
+            return list(range(len(self._documents)))[:limit]
+        grams = set().union(*(trigrams(word) for word in words))
+        postings_lists = []
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings is None:
+                return []
+            postings_lists.append(postings)
+        # Przecięcie zaczynamy od najkrótszej listy, aby zbiór kandydatów był jak najmniejszy
+        postings_lists.sort(key=len)
+        candidates = None
+        for postings in postings_lists:
+            candidates = set(postings) if candidates is None else candidates.intersection(postings)
+            if not candidates:
+                return []
+        if candidates is None:
+            # Same krótkie słowa - brak trigramów, przeszukujemy wszystkie dokumenty
+            candidates = range(len(self._documents))
+        results = []
+        for doc_id in sorted(candidates):
+            document = self._documents[doc_id]
+            if all(word in document for word in words):
+                results.append(doc_id)
+                if limit is not None and len(results) >= limit:
+                    break
+        return results
@@ -0,0 +1,304 @@
+"""
+Symulator meczów Familiady do sprawdzania balansu punktacji zestawu pytań.
+
+Przykład:
+    python simulator.py pytania.json --matches 10000 --model popularity --accuracy 0.7
+"""
+import os
+import sys
+import random
+import argparse
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from game import Game
+from question_bank import open_bank
+
+MAX_MISTAKES = 3
+
+
+class UniformAccuracy:
+    """
+    Model zawodnika, który trafia z prawdopodobieństwem accuracy,
+    wybierając równomiernie jedną z nieodkrytych odpowiedzi.
+
+    Args:
+        accuracy (float): Prawdopodobieństwo trafienia (0.0-1.0).
+    """
+    def __init__(self, accuracy):
+        self.accuracy = accuracy
+
+    def guess(self, question, revealed_mask, rng):
+        """
+        Zwraca indeks trafionej odpowiedzi albo None przy pomyłce.
+
+        Args:
+            question (Question): Aktualne pytanie.
+            revealed_mask (int): Maska bitowa odkrytych odpowiedzi.
+            rng (random.Random): Generator liczb losowych.
+
+        Returns:
+            int: Indeks odpowiedzi lub None.
+        """
+        hidden = [i for i in range(len(question.answers)) if not revealed_mask >> i & 1]
+        if not hidden or rng.random() >= self.accuracy:
+            return None
+        return rng.choice(hidden)
+
+
+class PopularityAccuracy(UniformAccuracy):
+    """
+    Model zawodnika, który częściej podaje popularne odpowiedzi: szansa
+    wskazania odpowiedzi jest proporcjonalna do punkty ** skew.
+
+    Args:
+        accuracy (float): Prawdopodobieństwo trafienia (0.0-1.0).
+        skew (float): Siła preferencji popularnych odpowiedzi (0 = równomiernie).
+    """
+    def __init__(self, accuracy, skew=1.0):
+        super().__init__(accuracy)
+        self.skew = skew
+
+    def guess(self, question, revealed_mask, rng):
+        hidden = [i for i in range(len(question.answers)) if not revealed_mask >> i & 1]
+        if not hidden or rng.random() >= self.accuracy:
+            return None
+        weights = [max(question.answers[i].points, 1) ** self.skew for i in hidden]
+        return rng.choices(hidden, weights=weights)[0]
+
+
+class DecayingAccuracy(PopularityAccuracy):
+    """
+    Model, w którym każda kolejna odkryta odpowiedź jest trudniejsza
+    do odgadnięcia (trafność mnożona przez decay po każdym trafieniu).
+
+    Args:
+        accuracy (float): Prawdopodobieństwo trafienia pierwszej odpowiedzi.
+        decay (float): Mnożnik trafności po każdej odkrytej odpowiedzi.
+        skew (float): Siła preferencji popularnych odpowiedzi.
+    """
+    def __init__(self, accuracy, decay=0.85, skew=1.0):
+        super().__init__(accuracy, skew)
+        self.decay = decay
+
+    def guess(self, question, revealed_mask, rng):
+        base = self.accuracy
+        self.accuracy = base * self.decay ** bin(revealed_mask).count("1")
+        try:
+            return super().guess(question, revealed_mask, rng)
+        finally:
+            self.accuracy = base
+
+
+MODELS = {
+    'uniform': UniformAccuracy,
+    'popularity': PopularityAccuracy,
+    'decaying': DecayingAccuracy,
+}
+
+
+def play_round(game, index, control, models, rng, stats):
+    """
+    Rozgrywa jedną rundę na silniku Game.
+
+    Drużyna z kontrolą zgaduje do wyczerpania odpowiedzi lub trzech błędów,
+    potem przeciwnicy mają jedną próbę przejęcia.
+
+    Args:
+        game (Game): Silnik gry.
+        index (int): Indeks pytania w banku.
+        control (str): 'left' lub 'right' - drużyna rozpoczynająca.
+        models (dict): Modele trafności drużyn ('left'/'right').
+        rng (random.Random): Generator liczb losowych.
+        stats (dict): Statystyki pytania do uzupełnienia.
+    """
+    game.set_current_question(index)
+    question = game.current_question
+    full_mask = (1 << len(question.answers)) - 1
+    mistakes = 0
+    while game.revealed_mask != full_mask and mistakes < MAX_MISTAKES:
+        hit = models[control].guess(question, game.revealed_mask, rng)
+        if hit is None:
+            game.add_mistake(control)
+            mistakes += 1
+        else:
+            game.reveal_answer(hit, control)
+    if game.revealed_mask != full_mask:
+        other = 'right' if control == 'left' else 'left'
+        hit = models[other].guess(question, game.revealed_mask, rng)
+        if hit is not None:
+            game.reveal_answer(hit, other)
+            stats['steals'] += 1
+    if game.revealed_mask == full_mask:
+        stats['cleared'] += 1
+    for i in range(len(question.answers)):
+        if game.is_revealed(i):
+            stats['reveals'][i] += 1
+    stats['played'] += 1
+
+
+def _new_question_stats(question):
+    return {'played': 0, 'cleared': 0, 'steals': 0, 'reveals': [0] * len(question.answers)}
+
+
+def simulate_chunk(questions, matches, rounds, model_name, model_args, seed):
+    """
+    Rozgrywa serię meczów w jednym procesie.
+
+    Args:
+        questions (list): Lista obiektów Question.
+        matches (int): Liczba meczów.
+        rounds (int): Liczba rund (pytań) w meczu.
+        model_name (str): Nazwa modelu trafności z MODELS.
+        model_args (tuple): Argumenty modelu dla drużyny lewej i prawej.
+        seed (int): Ziarno generatora losowego.
+
+    Returns:
+        dict: Zagregowane wyniki serii.
+    """
+    rng = random.Random(seed)
+    game = Game()
+    game.questions.extend(questions)
+    models = {
+        'left': MODELS[model_name](*model_args[0]),
+        'right': MODELS[model_name](*model_args[1]),
+    }
+    results = {
+        'matches': 0, 'left_wins': 0, 'right_wins': 0, 'draws': 0,
+        'margins': [], 'scores': [],
+        'questions': [_new_question_stats(q) for q in questions],
+    }
+    rounds = min(rounds, len(questions))
+    for _ in range(matches):
+        game.reset_game()
+        for round_no, index in enumerate(rng.sample(range(len(questions)), rounds)):
+            # Drużyny rozpoczynają na zmianę, pierwszą wybiera rzut monetą
+            control = 'left' if (round_no + rng.randint(0, 1)) % 2 == 0 else 'right'
+            play_round(game, index, control, models, rng, results['questions'][index])
+        left, right = game.team1_score, game.team2_score
+        results['matches'] += 1
+        results['scores'].extend((left, right))
+        results['margins'].append(abs(left - right))
+        if left > right:
+            results['left_wins'] += 1
+        elif right > left:
+            results['right_wins'] += 1
+        else:
+            results['draws'] += 1
+    return results
+
+
+def _merge(total, part):
+    if total is None:
+        return part
+    for key in ('matches', 'left_wins', 'right_wins', 'draws'):
+        total[key] += part[key]
+    total['margins'].extend(part['margins'])
+    total['scores'].extend(part['scores'])
+    for qt, qp in zip(total['questions'], part['questions']):
+        for key in ('played', 'cleared', 'steals'):
+            qt[key] += qp[key]
+        qt['reveals'] = [a + b for a, b in zip(qt['reveals'], qp['reveals'])]
+    return total
+
+
+def simulate(questions, matches=1000, rounds=4, model_name='popularity',
+             left_args=(0.6,), right_args=(0.6,), workers=None, seed=0):
+    """
+    Rozgrywa wiele meczów równolegle w puli procesów.
+
+    Args:
+        questions (list): Lista obiektów Question.
+        matches (int): Łączna liczba meczów.
+        rounds (int): Liczba rund w meczu.
+        model_name (str): Nazwa modelu trafności z MODELS.
+        left_args (tuple): Argumenty modelu drużyny lewej.
+        right_args (tuple): Argumenty modelu drużyny prawej.
+        workers (int): Liczba procesów (domyślnie liczba rdzeni).
+        seed (int): Ziarno generatora losowego.
+
+    Returns:
+        dict: Zagregowane wyniki wszystkich meczów.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = min(matches, workers * 4)
+    sizes = [matches // chunks + (1 if i < matches % chunks else 0) for i in range(chunks)]
+    total = None
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(simulate_chunk, questions, size, rounds, model_name,
+                        (left_args, right_args), seed * 1000003 + i)
+            for i, size in enumerate(sizes)
+        ]
+        for future in futures:
+            total = _merge(total, future.result())
+    return total
+
+
+def format_report(questions, results):
+    """
+    Przygotowuje czytelny raport z wyników symulacji.
+
+    Args:
+        questions (list): Lista obiektów Question.
+        results (dict): Wynik funkcji simulate.
+
+    Returns:
+        str: Raport tekstowy.
+    """
+    n = results['matches']
+    if not n:
+        return "Mecze: 0 - brak wyników do podsumowania."
+    margins = sorted(results['margins'])
+    scores = results['scores']
+    lines = [
+        f"Mecze: {n}",
+        f"Wygrane lewej: {results['left_wins'] / n:.1%}, prawej: {results['right_wins'] / n:.1%}, "
+        f"remisy: {results['draws'] / n:.1%}",
+        f"Średni wynik drużyny: {sum(scores) / len(scores):.1f} pkt, "
+        f"mediana różnicy: {margins[len(margins) // 2]} pkt",
+        "",
+        "Pytania (rozegrane, wyczyszczone, przejęcia, odkrycia odpowiedzi):",
+    ]
+    for question, stats in zip(questions, results['questions']):
+        played = stats['played']
+        if not played:
+            continue
+        reveal_rates = " ".join(f"{r / played:.0%}" for r in stats['reveals'])
+        lines.append(
+            f"  {question.text[:50]:<50} {played:6d} {stats['cleared'] / played:6.1%} "
+            f"{stats['steals'] / played:6.1%}  [{reveal_rates}]"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Uruchamia symulator z wiersza poleceń."""
+    parser = argparse.ArgumentParser(description="Symulator meczów Familiady")
+    parser.add_argument("questions", help="plik z pytaniami (bank SQLite lub JSON)")
+    parser.add_argument("--matches", type=int, default=1000, help="liczba meczów (co najmniej 1)")
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--model", choices=sorted(MODELS), default="popularity")
+    parser.add_argument("--accuracy", type=float, default=0.6, help="trafność drużyny lewej")
+    parser.add_argument("--right-accuracy", type=float, help="trafność drużyny prawej (domyślnie jak lewej)")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if args.matches < 1:
+        parser.error("--matches musi być co najmniej 1")
+
+    logging.getLogger().setLevel(logging.WARNING)
+    bank = open_bank(args.questions)
+    questions = list(bank)
+    bank.close()
+    if not questions:
+        print("Brak pytań do symulacji.", file=sys.stderr)
+        return 1
+    right = args.right_accuracy if args.right_accuracy is not None else args.accuracy
+    results = simulate(questions, args.matches, args.rounds, args.model,
+                       (args.accuracy,), (right,), args.workers, args.seed)
+    print(format_report(questions, results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
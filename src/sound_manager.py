@@ -1,45 +1,438 @@
+import os
+import queue
+import hashlib
+import logging
+import threading
+import time
+from collections import deque
 import pygame
 from utils import resource_path
+from tracing import tracer
+
+# Kategorie dźwięków: krótkie efekty są dekodowane do pamięci,
+# a dłuższe podkłady muzyczne odtwarzane strumieniowo z pliku
+EFFECT = "effect"
+MUSIC = "music"
+
+# Dźwięki aplikacji: nazwa -> (plik w folderze assets, kategoria)
+SOUND_FILES = {
+    'start': ("intro1.mp3", MUSIC),
+    'question_intro': ("intro.mp3", MUSIC),
+    'reveal': ("ok.mp3", EFFECT),
+    'error': ("error.mp3", EFFECT),
+}
+
+# Domyślny katalog pamięci podręcznej zdekodowanych dźwięków (PCM)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "familiada", "sounds")
+
+# Akcja, pod którą szacunki opóźnienia efektów trafiają do tracera (nakładka F12, --trace-file)
+LATENCY_ESTIMATE_ACTION = "sound_estimate"
+
+# Zarezerwowane kanały miksera dla efektów, które muszą zabrzmieć natychmiast:
+# nazwa -> (numer kanału, polityka wywłaszczania). Polityki:
+#   PREEMPT_RESTART - zatrzymaj to, co gra na kanale, i zagraj od początku,
+#   PREEMPT_SKIP - jeśli kanał jest zajęty, pomiń nowe odtworzenie.
+PREEMPT_RESTART = "restart"
+PREEMPT_SKIP = "skip"
+RESERVED_CHANNELS = {
+    'reveal': (0, PREEMPT_RESTART),
+    'error': (1, PREEMPT_RESTART),
+}
+
+# Rozmiar bufora miksera (w próbkach) w trybie zwykłym i niskich opóźnień
+DEFAULT_BUFFER_SIZE = 512
+LOW_LATENCY_BUFFER_SIZE = 256
+MIXER_FREQUENCY = 44100
+
+# Priorytety kolejki ładowania - mniejsza liczba oznacza wcześniejsze ładowanie
+PRIORITY_URGENT = 0
+PRIORITY_PREFETCH = 10
 
 class SoundManager:
     """
     Klasa do zarządzania dźwiękami w aplikacji.
+
+    Dźwięki są rejestrowane po nazwie. Krótkie efekty są dekodowane w tle
+    przez pulę wątków, więc utworzenie menedżera nie opóźnia startu
+    aplikacji, a podkłady muzyczne odtwarzane są strumieniowo z pliku.
+    Zdekodowane próbki mogą być zapisywane na dysku, dzięki czemu kolejne
+    uruchomienia pomijają dekodowanie MP3.
+
+    W trybie niskich opóźnień mikser pracuje z mniejszym buforem, a efekty
+    z RESERVED_CHANNELS grają na zarezerwowanych kanałach, więc nie czekają
+    na wolny kanał ani nie są gubione, gdy gra intro.
+
+    Args:
+        cache_dir (str): Katalog pamięci podręcznej PCM lub None, aby ją wyłączyć.
+        workers (int): Liczba wątków dekodujących.
+        low_latency (bool): Włącza tryb niskich opóźnień.
+        buffer_size (int): Rozmiar bufora miksera w próbkach (domyślnie zależny od trybu).
+        estimate_latency (bool): Włącza zbieranie szacunków opóźnienia efektów
+            (zob. latency_estimate_stats); trafiają też do histogramów tracera
+            jako "sound_estimate.<nazwa>".
     """
-    def __init__(self):
-        pygame.mixer.init()
-        self.sounds = {}
+    # Dźwięk, którego play() wywołano przed załadowaniem, zostanie odtworzony
+    # po załadowaniu tylko wtedy, gdy od wywołania minęło mniej niż tyle sekund
+    MAX_PLAY_DELAY = 1.0
+    MUSIC_FADE_IN_MS = 300
+    MUSIC_FADE_OUT_MS = 500
+    MUSIC_VOLUME = 1.0
+    # Głośność podkładu muzycznego na czas odtwarzania efektu
+    DUCK_VOLUME = 0.3
+
+    # Liczba ostatnich szacunków opóźnienia przechowywanych dla każdego dźwięku
+    LATENCY_SAMPLES = 200
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, workers=2, low_latency=False,
+                 buffer_size=None, estimate_latency=False):
+        self.cache_dir = cache_dir
+        self.low_latency = low_latency
+        if buffer_size is None:
+            buffer_size = LOW_LATENCY_BUFFER_SIZE if low_latency else DEFAULT_BUFFER_SIZE
+        self.buffer_size = buffer_size
+        self.estimate_latency = estimate_latency
+        self.latency_estimates = {}  # nazwa -> deque szacowanych opóźnień w sekundach
+        self._channels = {}  # nazwa -> (pygame.mixer.Channel, polityka)
+        self.sounds = {}  # nazwa -> załadowany pygame.mixer.Sound (lub None po błędzie)
+        self._files = {}  # nazwa -> ścieżka do pliku
+        self._assets = {}  # nazwa -> plik zasobów, którego ścieżka nie jest jeszcze ustalona
+        self._categories = {}
+        self._duck_until = 0.0
+        self._duck_timer = None
+        self._lock = threading.Lock()
+        self._queue = queue.PriorityQueue()
+        self._queued = {}  # nazwa -> najlepszy priorytet w kolejce
+        self._pending_play = {}  # nazwa -> (czas wywołania play() przed załadowaniem, ślad akcji)
+        self._loading = set()
+        self._sequence = 0
+        self._mixer_ready = threading.Event()
+        self.register_defaults()
+        threading.Thread(target=self._init_mixer, name="sound-init", daemon=True).start()
+        for i in range(workers):
+            threading.Thread(target=self._worker, name=f"sound-loader-{i}", daemon=True).start()
         self.load_sounds()
 
-    def load_sounds(self):
-        """Ładuje dźwięki z plików znajdujących się w folderze assets."""
+    def _init_mixer(self):
         try:
-            self.sounds['start'] = pygame.mixer.Sound(resource_path("intro1.mp3"))
+            pygame.mixer.init(frequency=MIXER_FREQUENCY, buffer=self.buffer_size)
+            if self.low_latency:
+                pygame.mixer.set_reserved(len(RESERVED_CHANNELS))
+                self._channels = {
+                    name: (pygame.mixer.Channel(channel_id), policy)
+                    for name, (channel_id, policy) in RESERVED_CHANNELS.items()
+                }
         except Exception as e:
-            print("Błąd przy ładowaniu start_sound:", e)
-            self.sounds['start'] = None
+            logging.error("Błąd przy inicjalizacji miksera: %s", e)
+            return
+        self._mixer_ready.set()
+
+    def register(self, name, file_path, category=EFFECT):
+        """
+        Rejestruje dźwięk pod podaną nazwą bez jego ładowania.
+
+        Args:
+            name (str): Nazwa dźwięku.
+            file_path (str): Ścieżka do pliku dźwiękowego.
+            category (str): EFFECT dla krótkich efektów lub MUSIC dla podkładów
+                odtwarzanych strumieniowo.
+        """
+        with self._lock:
+            self._files[name] = file_path
+            self._assets.pop(name, None)
+            self._categories[name] = category
+            self.sounds.pop(name, None)
+
+    def register_asset(self, name, filename, category=EFFECT):
+        """
+        Rejestruje dźwięk z zasobów programu (resource_path) bez ustalania ścieżki.
+
+        Ścieżka jest ustalana dopiero w wątku tła, przy ładowaniu - zasób
+        z paczki pytań jest wtedy kopiowany na dysk, co nie może blokować Tk.
+
+        Args:
+            name (str): Nazwa dźwięku.
+            filename (str): Nazwa pliku w folderze assets (lub w paczce).
+            category (str): EFFECT lub MUSIC.
+        """
+        with self._lock:
+            self._assets[name] = filename
+            self._files.pop(name, None)
+            self._categories[name] = category
+            self.sounds.pop(name, None)
+
+    def register_defaults(self):
+        """
+        Rejestruje dźwięki aplikacji (SOUND_FILES) z bieżących zasobów.
+
+        Po otwarciu paczki pytań ponowne wywołanie podmienia dźwięki na te
+        z paczki; wywołaj potem load_sounds(), aby załadować efekty.
+        Nie wykonuje operacji na plikach, więc można ją wywołać w wątku Tk.
+        """
+        for name, (filename, category) in SOUND_FILES.items():
+            self.register_asset(name, filename, category)
+
+    def _file_path(self, name):
+        """Zwraca ścieżkę pliku dźwięku, ustalając ją dla zasobu (tylko w wątkach tła)."""
+        with self._lock:
+            file_path = self._files.get(name)
+            filename = self._assets.get(name)
+        if file_path is not None or filename is None:
+            return file_path
         try:
-            self.sounds['question_intro'] = pygame.mixer.Sound(resource_path("intro.mp3"))
+            file_path = resource_path(filename)
         except Exception as e:
-            print("Błąd przy ładowaniu question_intro_sound:", e)
-            self.sounds['question_intro'] = None
+            logging.error("Nie udało się przygotować dźwięku %s: %s", filename, e)
+            return None
+        with self._lock:
+            if self._assets.get(name) == filename:  # w międzyczasie nie zarejestrowano innego pliku
+                del self._assets[name]
+                self._files[name] = file_path
+        return file_path
+
+    def load_sounds(self):
+        """
+        Zleca załadowanie w tle wszystkich zarejestrowanych efektów
+        (i ustalenie ścieżek podkładów muzycznych z zasobów).
+        """
+        music = []
+        for name, category in list(self._categories.items()):
+            if category == EFFECT:
+                self._enqueue(name, PRIORITY_PREFETCH)
+            elif name in self._assets:
+                music.append(name)
+        if music:
+            threading.Thread(target=self._resolve_paths, args=(music,),
+                             name="sound-assets", daemon=True).start()
+
+    def _resolve_paths(self, names):
+        for name in names:
+            self._file_path(name)
+
+    def _enqueue(self, name, priority):
+        with self._lock:
+            if name in self.sounds or name in self._loading \
+                    or self._queued.get(name, priority + 1) <= priority:
+                return
+            self._queued[name] = priority
+            self._sequence += 1
+            self._queue.put((priority, self._sequence, name))
+
+    def is_ready(self, name):
+        """
+        Sprawdza, czy dźwięk jest załadowany.
+
+        Args:
+            name (str): Nazwa dźwięku.
+
+        Returns:
+            bool: True, jeśli dźwięk można odtworzyć od razu.
+        """
+        return self.sounds.get(name) is not None
+
+    def _worker(self):
+        while True:
+            priority, _, name = self._queue.get()
+            with self._lock:
+                if name in self.sounds or self._queued.get(name) != priority:
+                    continue  # już załadowany albo przesunięty wyżej w kolejce
+                del self._queued[name]
+                self._loading.add(name)
+            file_path = self._file_path(name)
+            self._mixer_ready.wait()
+            sound = self._load(name, file_path)
+            with self._lock:
+                self.sounds[name] = sound
+                self._loading.discard(name)
+                requested_at, trace = self._pending_play.pop(name, (None, None))
+            if sound is not None and requested_at is not None \
+                    and time.monotonic() - requested_at < self.MAX_PLAY_DELAY:
+                self._play_effect(name, sound, requested_at, trace)
+
+    def _cache_path(self, file_path):
+        stat = os.stat(file_path)
+        key = f"{os.path.abspath(file_path)}|{stat.st_mtime_ns}|{stat.st_size}|{pygame.mixer.get_init()}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".pcm")
+
+    def _load(self, name, file_path):
+        """Ładuje dźwięk z pamięci podręcznej PCM albo dekoduje plik źródłowy."""
         try:
-            self.sounds['reveal'] = pygame.mixer.Sound(resource_path("ok.mp3"))
+            cache_path = self._cache_path(file_path) if self.cache_dir else None
+            if cache_path and os.path.exists(cache_path):
+                with open(cache_path, 'rb') as f:
+                    return pygame.mixer.Sound(buffer=f.read())
+            sound = pygame.mixer.Sound(file_path)
+            if cache_path:
+                self._write_cache(cache_path, sound)
+            return sound
         except Exception as e:
-            print("Błąd przy ładowaniu reveal_sound:", e)
-            self.sounds['reveal'] = None
+            print(f"Błąd przy ładowaniu {name}_sound:", e)
+            return None
+
+    @staticmethod
+    def _write_cache(cache_path, sound):
         try:
-            self.sounds['error'] = pygame.mixer.Sound(resource_path("error.mp3"))
-        except Exception as e:
-            print("Błąd przy ładowaniu error_sound:", e)
-            self.sounds['error'] = None
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(sound.get_raw())
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logging.warning("Nie udało się zapisać pamięci podręcznej dźwięku: %s", e)
 
-    def play(self, sound_name):
+    def play(self, sound_name, trace=None):
         """
         Odtwarza dźwięk o podanej nazwie.
 
+        Podkłady muzyczne są odtwarzane strumieniowo z płynnym wejściem.
+        Jeśli efekt nie jest jeszcze załadowany, jego ładowanie zostaje
+        przesunięte na początek kolejki, a dźwięk zostanie odtworzony zaraz
+        po załadowaniu (o ile nie minęło zbyt wiele czasu).
+
         Args:
             sound_name (str): Nazwa dźwięku.
+            trace (Trace): Ślad akcji operatora; start efektu zapisuje etap "sound".
         """
+        if self._categories.get(sound_name) == MUSIC:
+            self.play_music(sound_name)
+            return
         sound = self.sounds.get(sound_name)
         if sound:
-            sound.play()
+            self._play_effect(sound_name, sound, trace=trace)
+            return
+        with self._lock:
+            if (sound_name not in self._files and sound_name not in self._assets) \
+                    or sound_name in self.sounds:
+                return  # nieznany dźwięk albo błąd ładowania
+            self._pending_play[sound_name] = (time.monotonic(), trace)
+        self._enqueue(sound_name, PRIORITY_URGENT)
+
+    def _play_effect(self, name, sound, requested_at=None, trace=None):
+        """
+        Odtwarza efekt, ściszając na jego czas grający podkład muzyczny.
+
+        Args:
+            name (str): Nazwa efektu.
+            sound (pygame.mixer.Sound): Załadowany efekt.
+            requested_at (float): Czas time.monotonic() wywołania play(), jeśli
+                efekt czekał na załadowanie.
+            trace (Trace): Ślad akcji operatora.
+        """
+        called_at = time.perf_counter()
+        reserved = self._channels.get(name)
+        if reserved is not None:
+            channel, policy = reserved
+            if channel.get_busy():
+                if policy == PREEMPT_SKIP:
+                    return
+                channel.stop()
+            channel.play(sound)
+        else:
+            channel = sound.play()
+        if trace and channel is not None:
+            trace.stage("sound")
+        if self.estimate_latency and channel is not None:
+            waited = time.monotonic() - requested_at if requested_at is not None else 0.0
+            self._record_latency_estimate(name, waited + time.perf_counter() - called_at)
+        if self._mixer_ready.is_set() and pygame.mixer.music.get_busy():
+            self._duck(sound.get_length())
+
+    def _record_latency_estimate(self, name, call_time):
+        """
+        Zapisuje szacowane opóźnienie efektu.
+
+        pygame nie udostępnia chwili, w której próbki trafiają do urządzenia
+        (Channel.get_busy() jest ustawiane już w play()), więc szacunek to
+        czas oczekiwania na załadowanie i wywołania play() plus jeden okres
+        bufora miksera (buffer_size / częstotliwość). Nie obejmuje opóźnień
+        sterownika i urządzenia audio.
+
+        Args:
+            name (str): Nazwa efektu.
+            call_time (float): Czas od play() do przekazania efektu mikserowi w sekundach.
+        """
+        frequency = (pygame.mixer.get_init() or (MIXER_FREQUENCY,))[0]
+        estimate = call_time + self.buffer_size / frequency
+        with self._lock:
+            samples = self.latency_estimates.get(name)
+            if samples is None:
+                samples = self.latency_estimates[name] = deque(maxlen=self.LATENCY_SAMPLES)
+            samples.append(estimate)
+        tracer.record(LATENCY_ESTIMATE_ACTION, name, estimate * 1000)
+
+    def latency_estimate_stats(self):
+        """
+        Zwraca statystyki szacowanych opóźnień efektów (zob. _record_latency_estimate).
+
+        Returns:
+            dict: nazwa -> słownik z liczbą szacunków oraz opóźnieniem
+                  minimalnym, średnim, p95 i maksymalnym w ms.
+        """
+        stats = {}
+        with self._lock:
+            items = [(name, sorted(samples)) for name, samples in self.latency_estimates.items()]
+        for name, samples in items:
+            if not samples:
+                continue
+            stats[name] = {
+                'count': len(samples),
+                'min_ms': samples[0] * 1000,
+                'avg_ms': sum(samples) / len(samples) * 1000,
+                'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+                'max_ms': samples[-1] * 1000,
+            }
+        return stats
+
+    def _duck(self, duration):
+        """Ścisza podkład muzyczny na duration sekund."""
+        with self._lock:
+            self._duck_until = max(self._duck_until, time.monotonic() + duration)
+            if self._duck_timer is not None:
+                self._duck_timer.cancel()
+            self._duck_timer = threading.Timer(self._duck_until - time.monotonic(), self._unduck)
+            self._duck_timer.daemon = True
+            self._duck_timer.start()
+        pygame.mixer.music.set_volume(self.DUCK_VOLUME)
+
+    def _unduck(self):
+        with self._lock:
+            if time.monotonic() < self._duck_until:
+                return
+            self._duck_timer = None
+        pygame.mixer.music.set_volume(self.MUSIC_VOLUME)
+
+    def play_music(self, name, loops=0):
+        """
+        Odtwarza podkład muzyczny strumieniowo, bez dekodowania całego pliku.
+
+        Args:
+            name (str): Nazwa zarejestrowanego podkładu.
+            loops (int): Liczba powtórzeń (-1 oznacza odtwarzanie w pętli).
+        """
+        file_path = self._files.get(name)
+        if file_path is None and name not in self._assets:
+            return
+        if file_path is None or not self._mixer_ready.is_set():
+            # Mikser jeszcze się inicjalizuje albo ścieżka zasobu nie jest
+            # jeszcze ustalona - start muzyki w tle, gdy będzie gotowa
+            requested_at = time.monotonic()
+            def start_later():
+                path = self._file_path(name)
+                if path is not None and self._mixer_ready.wait(self.MAX_PLAY_DELAY) \
+                        and time.monotonic() - requested_at < self.MAX_PLAY_DELAY:
+                    self._start_music(name, path, loops)
+            threading.Thread(target=start_later, name="music-start", daemon=True).start()
+            return
+        self._start_music(name, file_path, loops)
+
+    def _start_music(self, name, file_path, loops):
+        try:
+            pygame.mixer.music.load(file_path)
+            pygame.mixer.music.set_volume(self.MUSIC_VOLUME)
+            pygame.mixer.music.play(loops=loops, fade_ms=self.MUSIC_FADE_IN_MS)
+        except Exception as e:
+            print(f"Błąd przy odtwarzaniu {name}_sound:", e)
+
+    def stop_music(self):
+        """Wycisza i zatrzymuje grający podkład muzyczny."""
+        if self._mixer_ready.is_set():
+            pygame.mixer.music.fadeout(self.MUSIC_FADE_OUT_MS)
@@ -0,0 +1,70 @@
+import sys
+import time
+import threading
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """
+    Mierzy czas poszczególnych faz uruchamiania aplikacji.
+
+    Fazy mogą być mierzone zarówno w wątku głównym, jak i w wątkach tła.
+    Gdy profiler jest wyłączony, phase() i mark() nic nie robią.
+
+    Args:
+        enabled (bool): Czy zbierać pomiary.
+        start (float): Czas time.perf_counter() uznawany za początek startu.
+    """
+    def __init__(self, enabled=False, start=None):
+        self.enabled = enabled
+        self.start = time.perf_counter() if start is None else start
+        self.records = []  # (nazwa, wątek, początek, czas trwania) w sekundach
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Mierzy czas bloku kodu.
+
+        Args:
+            name (str): Nazwa fazy.
+        """
+        if not self.enabled:
+            yield
+            return
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, began, time.perf_counter() - began)
+
+    def mark(self, name):
+        """
+        Zapisuje chwilę, w której nastąpiło zdarzenie (faza o zerowym czasie).
+
+        Args:
+            name (str): Nazwa zdarzenia.
+        """
+        if self.enabled:
+            self._record(name, time.perf_counter(), 0.0)
+
+    def _record(self, name, began, duration):
+        with self._lock:
+            self.records.append((name, threading.current_thread().name, began - self.start, duration))
+
+    def report(self, stream=None):
+        """
+        Wypisuje raport z czasami faz.
+
+        Args:
+            stream: Strumień wyjściowy (domyślnie sys.stderr).
+        """
+        if not self.enabled:
+            return
+        stream = stream or sys.stderr
+        with self._lock:
+            records = sorted(self.records, key=lambda r: r[2])
+        print("Profil uruchamiania (ms):", file=stream)
+        print(f"{'start':>9} {'czas':>9}  {'wątek':<14} faza", file=stream)
+        for name, thread, offset, duration in records:
+            print(f"{offset * 1000:9.1f} {duration * 1000:9.1f}  {thread:<14} {name}", file=stream)
@@ -0,0 +1,480 @@
+"""
+Agregator ankiet: buduje pytania z surowych odpowiedzi respondentów.
+
+Plik odpowiedzi (CSV z nagłówkiem albo JSONL) zawiera po jednej odpowiedzi
+w wierszu, z kolumnami pytania i odpowiedzi. Plik jest dzielony na zakresy
+bajtów ograniczonej wielkości, zliczane dokładnie przez osobne procesy.
+Liczniki zakresu trafiają na dysk w podziale na grupy pytań (według skrótu
+treści pytania), a każdą grupę łączy osobny proces - zużycie pamięci
+zależy więc od wielkości zakresu i grupy, a nie od wielkości pliku.
+Odpowiedzi są normalizowane (wielkość liter, polskie znaki, interpunkcja),
+bliskie warianty łączone w grupy, a najczęstsze grupy przeliczane na punkty.
+
+Przykład:
+    python survey.py odpowiedzi.csv --top 6 --output pytania.json
+"""
+import os
+import csv
+import sys
+import json
+import time
+import zlib
+import pickle
+import shutil
+import argparse
+import logging
+import tempfile
+from collections import Counter
+from difflib import SequenceMatcher
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from game import Game
+from utils import fold_words
+
+DEFAULT_TOP = 6
+# Największy zakres pliku zliczany przez jeden proces - ogranicza pamięć procesu roboczego
+MAX_RANGE_BYTES = 64 << 20
+# Po połączeniu liczników całego pliku zostawiamy tyle najczęstszych różnych
+# odpowiedzi na pytanie; rzadsze są pomijane (i raportowane)
+MAX_DISTINCT = 200_000
+# Liczba grup, do których porównywane są kolejne odpowiedzi przy łączeniu wariantów
+MAX_CLUSTERS = 60
+MIN_SIMILARITY = 0.85
+# Odpowiedzi rzadsze niż ten ułamek wszystkich nie są łączone w grupy (poniżej 0.1 pkt)
+MIN_SHARE = 0.001
+BATCH_ROWS = 50_000
+
+
+@lru_cache(maxsize=1 << 16)
+def answer_key(text):
+    """
+    Zwraca klucz odpowiedzi do zliczania: tekst bez wielkości liter,
+    polskich znaków i interpunkcji.
+
+    Args:
+        text (str): Surowa odpowiedź respondenta.
+
+    Returns:
+        str: Klucz odpowiedzi (pusty dla odpowiedzi bez treści).
+    """
+    return fold_words(text)
+
+
+def _file_format(file_path):
+    return 'jsonl' if file_path.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+def split_ranges(file_path, parts):
+    """
+    Dzieli plik na zakresy bajtów zaczynające się na początku wiersza.
+
+    Args:
+        file_path (str): Ścieżka do pliku.
+        parts (int): Docelowa liczba zakresów.
+
+    Returns:
+        list: Lista krotek (początek, koniec).
+    """
+    size = os.path.getsize(file_path)
+    bounds = [0]
+    with open(file_path, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(bounds[-1], size * i // parts))
+            f.readline()
+            position = f.tell()
+            if position >= size:
+                break
+            if position > bounds[-1]:
+                bounds.append(position)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _read_lines(file_path, start, end):
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            if position == 0 and line.startswith(b"\xef\xbb\xbf"):
+                position += 3
+                line = line[3:]  # BOM z eksportu arkusza kalkulacyjnego
+            position += len(line)
+            yield line.decode('utf-8', errors='replace')
+
+
+def read_rows(file_path, start, end, question_column, answer_column):
+    """
+    Czyta pary (pytanie, odpowiedź) z zakresu bajtów pliku CSV lub JSONL.
+
+    Wiersze CSV muszą mieścić się w jednej linii pliku (bez znaków nowej
+    linii w cudzysłowach), by zakresy dało się czytać niezależnie.
+
+    Args:
+        file_path (str): Ścieżka do pliku.
+        start (int): Początek zakresu (początek wiersza).
+        end (int): Koniec zakresu.
+        question_column (str): Nazwa kolumny z treścią pytania.
+        answer_column (str): Nazwa kolumny z odpowiedzią.
+
+    Yields:
+        tuple: (pytanie, odpowiedź).
+    """
+    lines = _read_lines(file_path, start, end)
+    if _file_format(file_path) == 'jsonl':
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield str(record[question_column]), str(record[answer_column])
+            except (ValueError, KeyError, TypeError):
+                logging.warning("Pominięto błędny wiersz JSONL: %.80s", line)
+        return
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+        header = next(csv.reader(f), [])
+    try:
+        q_index, a_index = header.index(question_column), header.index(answer_column)
+    except ValueError:
+        raise ValueError(f"Brak kolumn '{question_column}' i '{answer_column}' w pliku {file_path}") from None
+    if start == 0:
+        next(lines, None)  # nagłówek
+    width = max(q_index, a_index)
+    for row in csv.reader(lines):
+        if len(row) > width:
+            yield row[q_index], row[a_index]
+
+
+def count_range(file_path, start, end, question_column, answer_column):
+    """
+    Zlicza surowe odpowiedzi w zakresie pliku (uruchamiane w procesie roboczym).
+
+    Wiersze są grupowane w paczki według pytania i zliczane przez
+    Counter.update, które liczy całą paczkę w kodzie C. Zliczanie jest
+    dokładne - pamięć ogranicza wielkość zakresu (MAX_RANGE_BYTES).
+
+    Returns:
+        tuple: (pytanie -> Counter odpowiedzi, pytanie -> liczba odpowiedzi).
+    """
+    counters = {}
+    totals = Counter()
+    batch = {}
+    rows = 0
+
+    def flush():
+        for question, answers in batch.items():
+            counter = counters.get(question)
+            if counter is None:
+                counter = counters[question] = Counter()
+            counter.update(answers)
+            totals[question] += len(answers)
+        batch.clear()
+
+    for question, answer in read_rows(file_path, start, end, question_column, answer_column):
+        answer = answer.strip()
+        if not answer:
+            continue
+        question = question.strip()
+        answers = batch.get(question)
+        if answers is None:
+            answers = batch[question] = []
+        answers.append(answer)
+        rows += 1
+        if rows % BATCH_ROWS == 0:
+            flush()
+    flush()
+    return counters, totals
+
+
+def question_shard(question, shards):
+    """
+    Zwraca numer grupy pytania (stały między procesami, w przeciwieństwie do hash()).
+
+    Args:
+        question (str): Treść pytania.
+        shards (int): Liczba grup.
+
+    Returns:
+        int: Numer grupy od 0 do shards - 1.
+    """
+    return zlib.crc32(question.encode('utf-8')) % shards
+
+
+def _count_and_spill(file_path, start, end, question_column, answer_column, spill_dir, shards):
+    # Proces roboczy: liczniki zakresu trafiają na dysk, do procesu głównego
+    # wracają tylko liczby odpowiedzi i ścieżki plików grup
+    counters, totals = count_range(file_path, start, end, question_column, answer_column)
+    parts = {}
+    for question, counter in counters.items():
+        parts.setdefault(question_shard(question, shards), {})[question] = counter
+    paths = {}
+    for shard, part in parts.items():
+        fd, paths[shard] = tempfile.mkstemp(prefix=f"{shard}-", suffix=".pickle", dir=spill_dir)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(part, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return totals, paths
+
+
+def cap_distinct(counter, limit=MAX_DISTINCT):
+    """
+    Zostawia w liczniku limit najczęstszych odpowiedzi.
+
+    Args:
+        counter (Counter): Połączony licznik odpowiedzi pytania (zmieniany w miejscu).
+        limit (int): Maksymalna liczba różnych odpowiedzi.
+
+    Returns:
+        tuple: (liczba pominiętych różnych odpowiedzi, liczba ich wystąpień).
+    """
+    if len(counter) <= limit:
+        return 0, 0
+    kept = counter.most_common(limit)
+    dropped = len(counter) - limit
+    occurrences = sum(counter.values()) - sum(count for _, count in kept)
+    counter.clear()
+    counter.update(dict(kept))
+    return dropped, occurrences
+
+
+def _merge_shard(paths, top, min_similarity, normalize, max_distinct):
+    # Proces roboczy: łączy liczniki jednej grupy pytań ze wszystkich zakresów,
+    # dopiero potem przycina je i buduje odpowiedzi
+    counters = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            part = pickle.load(f)
+        for question, counter in part.items():
+            if question in counters:
+                counters[question].update(counter)
+            else:
+                counters[question] = counter
+    results = []
+    for question, counter in counters.items():
+        total = sum(counter.values())
+        pruned = cap_distinct(counter, max_distinct)
+        _, answers = build_answers(question, counter, total, top, min_similarity, normalize)
+        results.append((question, answers, pruned))
+    return results
+
+
+def _similar(a, b, min_similarity):
+    if a == b:
+        return True
+    if min(len(a), len(b)) < 4 or min(len(a), len(b)) / max(len(a), len(b)) < min_similarity:
+        return False
+    matcher = SequenceMatcher(None, a, b)
+    return matcher.quick_ratio() >= min_similarity and matcher.ratio() >= min_similarity
+
+
+def cluster_answers(raw_counts, min_similarity=MIN_SIMILARITY, max_clusters=MAX_CLUSTERS):
+    """
+    Łączy warianty tej samej odpowiedzi w grupy.
+
+    Najpierw surowe odpowiedzi o tym samym kluczu (answer_key) są sumowane,
+    potem klucze, od najczęstszego, dołączane do najczęstszej grupy o
+    podobnym zapisie (literówki, inna kolejność słów). Klucze niepasujące
+    do żadnej z max_clusters grup tworzą nową grupę albo, gdy limit jest
+    osiągnięty, są pomijane - są rzadsze od wszystkich istniejących grup.
+    Klucze rzadsze niż MIN_SHARE wszystkich odpowiedzi są pomijane od razu,
+    bo nie zmieniają punktacji, a zwykle stanowią większość różnych kluczy.
+
+    Args:
+        raw_counts (Counter): Surowa odpowiedź -> liczba wystąpień.
+        min_similarity (float): Minimalne podobieństwo zapisu (0.0-1.0).
+        max_clusters (int): Maksymalna liczba grup.
+
+    Returns:
+        list: Lista krotek (tekst odpowiedzi, liczba), malejąco po liczbie;
+            tekstem jest najczęstszy zapis w grupie.
+    """
+    keys = Counter()
+    spellings = {}
+    for raw, count in raw_counts.items():
+        key = answer_key(raw)
+        if not key:
+            continue
+        keys[key] += count
+        variants = spellings.get(key)
+        if variants is None:
+            variants = spellings[key] = Counter()
+        variants[raw] += count
+
+    clusters = []  # [klucz, posortowane słowa klucza, liczba, Counter zapisów]
+    min_count = sum(keys.values()) * MIN_SHARE
+    for key, count in keys.most_common():
+        if count < min_count:
+            break
+        tokens = " ".join(sorted(key.split()))
+        for cluster in clusters:
+            if _similar(key, cluster[0], min_similarity) or _similar(tokens, cluster[1], min_similarity):
+                cluster[2] += count
+                cluster[3].update(spellings[key])
+                break
+        else:
+            if len(clusters) < max_clusters:
+                clusters.append([key, tokens, count, Counter(spellings[key])])
+    clusters.sort(key=lambda cluster: -cluster[2])
+    return [(_display_text(cluster[3]), cluster[2]) for cluster in clusters]
+
+
+def _display_text(variants):
+    text = variants.most_common(1)[0][0]
+    return text[:1].upper() + text[1:]
+
+
+def scale_points(counts, total, normalize=False):
+    """
+    Przelicza liczby odpowiedzi na punkty.
+
+    Args:
+        counts (list): Liczby odpowiedzi (malejąco).
+        total (int): Liczba wszystkich odpowiedzi na pytanie.
+        normalize (bool): Czy skalować tak, by punkty wybranych odpowiedzi
+            sumowały się do 100 (zamiast procentu wszystkich respondentów).
+
+    Returns:
+        list: Punkty (co najmniej 1) odpowiadające kolejnym liczbom.
+    """
+    base = sum(counts) if normalize else total
+    if not base:
+        return [0] * len(counts)
+    exact = [100 * count / base for count in counts]
+    if not normalize:
+        return [max(1, round(value)) for value in exact]
+    # Minimum 1 punktu przed rozdziałem reszt, by nie zepsuć sumy 100
+    points = [max(1, int(value)) for value in exact]
+    # Metoda największych reszt, by suma wynosiła dokładnie 100
+    for i in sorted(range(len(exact)), key=lambda i: points[i] - exact[i])[:max(0, 100 - sum(points))]:
+        points[i] += 1
+    # Nadmiar z podniesienia do 1 oddają odpowiedzi z największą liczbą punktów
+    while sum(points) > 100 and max(points) > 1:
+        points[points.index(max(points))] -= 1
+    return points
+
+
+def build_answers(question, raw_counts, total, top=DEFAULT_TOP, min_similarity=MIN_SIMILARITY,
+                  normalize=False):
+    """
+    Buduje listę odpowiedzi pytania w formacie Game.add_question.
+
+    Args:
+        question (str): Treść pytania.
+        raw_counts (Counter): Surowa odpowiedź -> liczba wystąpień.
+        total (int): Liczba wszystkich odpowiedzi na pytanie.
+        top (int): Liczba najczęstszych odpowiedzi.
+        min_similarity (float): Minimalne podobieństwo wariantów odpowiedzi.
+        normalize (bool): Czy punkty mają sumować się do 100.
+
+    Returns:
+        tuple: (pytanie, lista krotek (odpowiedź, punkty)).
+    """
+    clusters = cluster_answers(raw_counts, min_similarity, max(MAX_CLUSTERS, top))[:top]
+    points = scale_points([count for _, count in clusters], total, normalize)
+    return question, [(text, p) for (text, _), p in zip(clusters, points)]
+
+
+def aggregate(file_paths, top=DEFAULT_TOP, question_column="question", answer_column="answer",
+              min_similarity=MIN_SIMILARITY, normalize=False, workers=None, max_distinct=MAX_DISTINCT):
+    """
+    Agreguje odpowiedzi z plików ankiet równolegle w puli procesów.
+
+    Zliczanie jest równoległe po zakresach plików, a łączenie liczników,
+    wariantów i punktacja - po grupach pytań. Liczniki pytania są przycinane
+    do max_distinct różnych odpowiedzi dopiero po połączeniu całego pliku,
+    więc odpowiedź częsta w sumie, a rzadka w każdym zakresie, nie ginie.
+
+    Args:
+        file_paths (list): Ścieżki do plików CSV/JSONL.
+        top (int): Liczba odpowiedzi na pytanie.
+        question_column (str): Nazwa kolumny z treścią pytania.
+        answer_column (str): Nazwa kolumny z odpowiedzią.
+        min_similarity (float): Minimalne podobieństwo wariantów odpowiedzi.
+        normalize (bool): Czy punkty mają sumować się do 100.
+        workers (int): Liczba procesów (domyślnie liczba rdzeni).
+        max_distinct (int): Liczba najczęstszych różnych odpowiedzi pytania
+            zachowywanych po połączeniu liczników.
+
+    Returns:
+        tuple: (lista krotek (pytanie, odpowiedzi) w kolejności pierwszego
+            wystąpienia pytania, pytanie -> liczba odpowiedzi,
+            pytanie -> (liczba pominiętych różnych odpowiedzi, liczba ich
+            wystąpień) dla pytań, których liczniki przycięto).
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = workers * 2
+    totals = Counter()
+    shard_paths = {}
+    spill_dir = tempfile.mkdtemp(prefix="familiada-survey-")
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            for path in file_paths:
+                parts = max(workers * 4, -(-os.path.getsize(path) // MAX_RANGE_BYTES))
+                for start, end in split_ranges(path, parts):
+                    futures.append(pool.submit(_count_and_spill, path, start, end, question_column,
+                                               answer_column, spill_dir, shards))
+            # Kolejność zakresów zachowuje kolejność pierwszego wystąpienia pytań w totals
+            for future in futures:
+                part_totals, paths = future.result()
+                totals.update(part_totals)
+                for shard, shard_path in paths.items():
+                    shard_paths.setdefault(shard, []).append(shard_path)
+            merged = [pool.submit(_merge_shard, paths, top, min_similarity, normalize, max_distinct)
+                      for paths in shard_paths.values()]
+            built = {}
+            pruned = {}
+            for future in merged:
+                for question, answers, (dropped, occurrences) in future.result():
+                    built[question] = answers
+                    if dropped:
+                        pruned[question] = (dropped, occurrences)
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
+    questions = [(question, built[question]) for question in totals if built.get(question)]
+    return questions, totals, pruned
+
+
+def main(argv=None):
+    """Uruchamia agregację ankiet z wiersza poleceń."""
+    parser = argparse.ArgumentParser(description="Agregator ankiet Familiady")
+    parser.add_argument("files", nargs="+", help="pliki z odpowiedziami (CSV z nagłówkiem lub JSONL)")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="liczba odpowiedzi na pytanie")
+    parser.add_argument("--question-column", default="question")
+    parser.add_argument("--answer-column", default="answer")
+    parser.add_argument("--min-similarity", type=float, default=MIN_SIMILARITY,
+                        help="podobieństwo zapisu, od którego warianty odpowiedzi są łączone")
+    parser.add_argument("--normalize", action="store_true",
+                        help="punkty odpowiedzi pytania sumują się do 100")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--output", help="bank pytań lub plik JSON, do którego dopisać pytania")
+    args = parser.parse_args(argv)
+
+    logging.getLogger().setLevel(logging.WARNING)
+    start = time.perf_counter()
+    questions, totals, pruned = aggregate(args.files, args.top, args.question_column, args.answer_column,
+                                          args.min_similarity, args.normalize, args.workers)
+    elapsed = time.perf_counter() - start
+    for question, answers in questions:
+        print(f"{question} ({totals[question]} odpowiedzi)")
+        if question in pruned:
+            dropped, occurrences = pruned[question]
+            print(f"    (pominięto {dropped} najrzadszych różnych odpowiedzi, {occurrences} wystąpień)")
+        for text, points in answers:
+            print(f"    {points:>3}  {text}")
+    print(f"Pytania: {len(questions)}, odpowiedzi: {sum(totals.values())}, czas: {elapsed:.2f} s")
+
+    if args.output:
+        game = Game()
+        if os.path.exists(args.output):
+            game.load_questions(args.output)
+        for question, answers in questions:
+            game.add_question(question, answers)
+        game.save_questions(args.output)
+        print(f"Zapisano pytania: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+import json
+import time
+import threading
+from bisect import bisect_left
+from collections import deque
+
+# Górne granice przedziałów histogramu opóźnień w ms (ostatni przedział jest otwarty)
+BUCKET_BOUNDS_MS = (0.5, 1, 2, 4, 8, 12, 16, 20, 25, 33, 50, 75, 100, 150, 250, 500, 1000, 2500)
+
+
+class LatencyHistogram:
+    """
+    Histogram opóźnień o stałych przedziałach.
+
+    Zapis pomiaru to wyszukanie przedziału i kilka dodawań, więc histogram
+    może zbierać pomiary przez cały program bez wzrostu zużycia pamięci.
+    Percentyle są przybliżane górną granicą przedziału.
+    """
+    __slots__ = ('counts', 'count', 'total_ms', 'max_ms')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms):
+        """
+        Dodaje pomiar.
+
+        Args:
+            latency_ms (float): Opóźnienie w milisekundach.
+        """
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+
+    def percentile(self, p):
+        """
+        Zwraca przybliżony percentyl.
+
+        Args:
+            p (float): Percentyl (0-100).
+
+        Returns:
+            float: Górna granica przedziału zawierającego percentyl w ms.
+        """
+        if not self.count:
+            return 0.0
+        target = self.count * p / 100
+        seen = 0
+        for bound, bucket in zip(BUCKET_BOUNDS_MS, self.counts):
+            seen += bucket
+            if seen >= target:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self):
+        """
+        Zwraca histogram jako słownik (do zapisu w JSON).
+
+        Returns:
+            dict: Liczba pomiarów, średnia, p50/p95/p99, maksimum i liczności przedziałów.
+        """
+        labels = [f"<={bound}" for bound in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]}"]
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max_ms,
+            'buckets': {label: n for label, n in zip(labels, self.counts) if n},
+        }
+
+
+class Trace:
+    """
+    Ślad jednej akcji operatora (np. kliknięcia "Odkryj").
+
+    Kolejne etapy obsługi akcji (panel TV, dźwięk) wywołują stage(), co
+    zapisuje czas od początku akcji w histogramie "akcja.etap".
+
+    Args:
+        tracer (Tracer): Tracer zbierający pomiary.
+        action (str): Rodzaj akcji.
+    """
+    __slots__ = ('tracer', 'action', 'start')
+
+    def __init__(self, tracer, action):
+        self.tracer = tracer
+        self.action = action
+        self.start = time.perf_counter()
+
+    def stage(self, name):
+        """
+        Zapisuje osiągnięcie etapu obsługi akcji.
+
+        Args:
+            name (str): Nazwa etapu, np. "tv_visible" albo "sound".
+        """
+        self.tracer.record(self.action, name, (time.perf_counter() - self.start) * 1000)
+
+
+class Tracer:
+    """
+    Lekkie śledzenie opóźnień od akcji operatora do aktualizacji TV i dźwięku.
+
+    Pomiary trafiają do histogramów o stałym rozmiarze oraz do krótkiego
+    bufora ostatnich zdarzeń, więc tracer może być włączony w trakcie
+    nagrania. Metody są bezpieczne dla wątków (dźwięk startuje w wątku tła).
+
+    Args:
+        enabled (bool): Czy zbierać pomiary.
+        recent (int): Liczba ostatnich zdarzeń przechowywanych do zrzutu.
+    """
+    def __init__(self, enabled=True, recent=500):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self._histograms = {}  # (akcja, etap) -> LatencyHistogram
+        self._recent = deque(maxlen=recent)  # (czas od startu, akcja, etap, opóźnienie ms)
+        self._lock = threading.Lock()
+
+    def begin(self, action):
+        """
+        Rozpoczyna ślad akcji operatora.
+
+        Args:
+            action (str): Rodzaj akcji, np. "reveal", "mistake", "question".
+
+        Returns:
+            Trace: Ślad do przekazania panelom i dźwiękom lub None, gdy tracer jest wyłączony.
+        """
+        if not self.enabled:
+            return None
+        return Trace(self, action)
+
+    def record(self, action, stage, latency_ms):
+        """
+        Zapisuje opóźnienie etapu akcji.
+
+        Args:
+            action (str): Rodzaj akcji.
+            stage (str): Nazwa etapu.
+            latency_ms (float): Czas od początku akcji w ms.
+        """
+        key = (action, stage)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(latency_ms)
+            self._recent.append((time.perf_counter() - self.started, action, stage, latency_ms))
+
+    def summary(self):
+        """
+        Zwraca podsumowanie histogramów.
+
+        Returns:
+            dict: "akcja.etap" -> słownik z LatencyHistogram.to_dict().
+        """
+        with self._lock:
+            items = sorted(self._histograms.items())
+            return {f"{action}.{stage}": histogram.to_dict() for (action, stage), histogram in items}
+
+    def format_summary(self):
+        """
+        Zwraca podsumowanie w postaci tekstu (dla nakładki debugowania).
+
+        Returns:
+            str: Tabela z liczbą pomiarów i percentylami każdego etapu.
+        """
+        lines = [f"{'akcja.etap':<22}{'n':>6}{'p50':>7}{'p95':>7}{'p99':>7}{'max':>8}"]
+        for name, stats in self.summary().items():
+            lines.append(f"{name:<22}{stats['count']:>6}{stats['p50_ms']:>7.1f}{stats['p95_ms']:>7.1f}"
+                         f"{stats['p99_ms']:>7.1f}{stats['max_ms']:>8.1f}")
+        return "\n".join(lines)
+
+    def dump(self, file_path):
+        """
+        Zapisuje histogramy i ostatnie zdarzenia do pliku JSON.
+
+        Args:
+            file_path (str): Ścieżka do pliku.
+        """
+        with self._lock:
+            recent = [
+                {'t': round(t, 4), 'action': action, 'stage': stage, 'latency_ms': round(latency, 3)}
+                for t, action, stage, latency in self._recent
+            ]
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({'histograms': self.summary(), 'recent': recent}, f, ensure_ascii=False, indent=2)
+
+    def reset(self):
+        """Usuwa zebrane pomiary."""
+        with self._lock:
+            self._histograms.clear()
+            self._recent.clear()
+
+
+# Wspólny tracer aplikacji
+tracer = Tracer()
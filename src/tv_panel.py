@@ -1,27 +1,358 @@
 import tkinter as tk
 import os
+import time
+import logging
 from tkinter import messagebox
-try:
-    from PIL import Image, ImageTk
-except ImportError:
-    Image = None
-    ImageTk = None
+from image_cache import ImageCache
+from batched_view import BatchedSubscriber
+from events import (QuestionSelected, AnswerRevealed, MistakeAdded, ConsultationMistake,
+                    BuzzerWon, TeamNamesChanged, IntroStarted, GameReset)
+from tracing import tracer
+from fonts import fonts
 from utils import resource_path
 
+# Pionowe położenia trzech "X" w panelu błędów jako ułamek wysokości okna
+ERROR_X_POSITIONS = (200 / 700, 350 / 700, 500 / 700)
+# Rozmiar "X" w panelu błędów przy wysokości okna 700 px
+ERROR_X_FONT_SIZE = 90
+BIG_X_FONT_SIZE = 220
+REFERENCE_HEIGHT = 700
+# Klasyczna tablica ma od 6 do 8 wierszy odpowiedzi
+BOARD_MIN_ROWS = 6
+BOARD_MAX_ROWS = 8
+# Wysokość wiersza tablicy jako wielokrotność wysokości linii czcionki
+BOARD_ROW_SPACING = 1.6
+PLACEHOLDER = "--------------------"
+# Czcionka tablicy odpowiedzi
+BOARD_FONT = "familiada"
+
+class Animator:
+    """
+    Wspólny zegar animacji panelu TV.
+
+    Zamiast osobnych łańcuchów after() dla każdej animacji wszystkie aktywne
+    animacje (tweeny) są przesuwane w jednym wywołaniu na klatkę. Postęp
+    tweena zależy od czasu, więc gdy zegar nie nadąża, klatki są pomijane,
+    a animacja kończy się o czasie.
+
+    Args:
+        widget (tk.Misc): Widżet, którego pętla zdarzeń napędza zegar.
+        fps (int): Docelowa liczba klatek na sekundę.
+    """
+    def __init__(self, widget, fps=60):
+        self.widget = widget
+        self.frame_interval = 1.0 / fps
+        self._tweens = {}  # uchwyt -> [start, czas trwania, update, on_done, tag]
+        self._next_handle = 0
+        self._after_id = None
+        self._last_tick = None
+        self.frames = 0
+        self.dropped_frames = 0
+        self.total_frame_time = 0.0
+        self.max_frame_time = 0.0
+
+    def add(self, duration, update, on_done=None, delay=0.0, tag=None):
+        """
+        Dodaje animację.
+
+        Args:
+            duration (float): Czas trwania w sekundach.
+            update (callable): Funkcja wywoływana co klatkę z postępem 0.0-1.0.
+            on_done (callable): Funkcja wywoływana po zakończeniu animacji.
+            delay (float): Opóźnienie startu w sekundach.
+            tag (str): Etykieta grupy animacji, używana przy anulowaniu.
+
+        Returns:
+            int: Uchwyt animacji.
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        self._tweens[handle] = [time.perf_counter() + delay, max(duration, 1e-6), update, on_done, tag]
+        if self._after_id is None:
+            self._last_tick = None
+            self._after_id = self.widget.after(0, self._tick)
+        return handle
+
+    def cancel(self, handle):
+        """
+        Anuluje animację bez wywoływania on_done.
+
+        Args:
+            handle (int): Uchwyt zwrócony przez add.
+        """
+        self._tweens.pop(handle, None)
+
+    def cancel_all(self):
+        """Anuluje wszystkie animacje bez wywoływania on_done."""
+        self._tweens.clear()
+
+    def cancel_tag(self, tag):
+        """
+        Anuluje wszystkie animacje z daną etykietą.
+
+        Args:
+            tag (str): Etykieta grupy animacji.
+        """
+        for handle in [h for h, tween in self._tweens.items() if tween[4] == tag]:
+            del self._tweens[handle]
+
+    def _tick(self):
+        self._after_id = None
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            missed = int((now - self._last_tick) / self.frame_interval) - 1
+            if missed > 0:
+                self.dropped_frames += missed
+        self._last_tick = now
+
+        for handle, tween in list(self._tweens.items()):
+            if handle not in self._tweens:
+                continue  # anulowana przez inną animację w tej samej klatce
+            start, duration, update, on_done, _ = tween
+            if now < start:
+                continue
+            progress = min(1.0, (now - start) / duration)
+            try:
+                update(progress)
+                if progress >= 1.0 and self._tweens.pop(handle, None) is not None and on_done:
+                    on_done()
+            except tk.TclError:
+                # Widżet animacji został zniszczony
+                self._tweens.pop(handle, None)
+            except Exception:
+                # Błąd jednej animacji nie może zatrzymać pozostałych
+                logging.exception("Błąd animacji panelu TV")
+                self._tweens.pop(handle, None)
+
+        elapsed = time.perf_counter() - now
+        self.frames += 1
+        self.total_frame_time += elapsed
+        self.max_frame_time = max(self.max_frame_time, elapsed)
+        if self._tweens:
+            delay_ms = max(1, int((self.frame_interval - elapsed) * 1000))
+            self._after_id = self.widget.after(delay_ms, self._tick)
+
+    def stats(self):
+        """
+        Zwraca statystyki czasu klatek.
+
+        Returns:
+            dict: Liczba klatek, pominięte klatki, średni i maksymalny czas klatki w ms
+                  oraz liczba aktywnych animacji.
+        """
+        return {
+            'frames': self.frames,
+            'dropped_frames': self.dropped_frames,
+            'avg_frame_ms': self.total_frame_time / self.frames * 1000 if self.frames else 0.0,
+            'max_frame_ms': self.max_frame_time * 1000,
+            'active': len(self._tweens),
+        }
+
+
+def intro_font_size(w, h):
+    """Zwraca największy rozmiar czcionki, przy którym napis 'FAMILIADA' mieści się w obszarze w x h."""
+    return fonts.fit_size("FAMILIADA", BOARD_FONT, w * 0.9, 100, min_size=40, weight="bold",
+                          max_height=h / 4)
+
+
+def typing_tween(set_text, full_text, prefix=""):
+    """
+    Tworzy funkcję update wypisującą tekst znak po znaku.
+
+    Args:
+        set_text (callable): Funkcja ustawiająca wyświetlany tekst.
+        full_text (str): Docelowy tekst.
+        prefix (str): Stały początek tekstu wyświetlany od razu.
+
+    Returns:
+        callable: Funkcja update dla Animator.add.
+    """
+    shown = [-1]
+    def update(progress):
+        count = int(round(progress * len(full_text)))
+        if count != shown[0]:
+            set_text(prefix + full_text[:count])
+            shown[0] = count
+    return update
+
+
+def traced_tween(update, trace, widget):
+    """
+    Opakowuje funkcję update tak, aby pierwsza klatka zapisała etapy śladu.
+
+    Etap "tv_frame" oznacza pierwszą klatkę animacji, a "tv_visible" chwilę
+    po przerysowaniu widżetów przez Tk (after_idle po zmianie etykiety).
+
+    Args:
+        update (callable): Funkcja update dla Animator.add.
+        trace (Trace): Ślad akcji operatora.
+        widget (tk.Misc): Widżet, którego pętla zdarzeń przerysowuje ekran.
+
+    Returns:
+        callable: Funkcja update dla Animator.add.
+    """
+    first = [True]
+    def traced(progress):
+        update(progress)
+        if first[0]:
+            first[0] = False
+            trace.stage("tv_frame")
+            widget.after_idle(trace.stage, "tv_visible")
+    return traced
+
+
+class AnswerBoard(tk.Canvas):
+    """
+    Tablica odpowiedzi rysowana na jednym płótnie.
+
+    Wiersze są stałymi elementami tekstowymi płótna. Zmiana pytania i
+    odkrycie odpowiedzi zmieniają tylko tekst elementów (itemconfig), a
+    zmiana rozmiaru okna - ich położenie (coords) i czcionkę, więc nie
+    powstają ani nie są niszczone żadne widżety.
+
+    Każdy wiersz dostaje największą czcionkę (nie większą od bazowej), przy
+    której jego tekst mieści się w szerokości płótna. Czcionki i pomiary
+    pochodzą ze wspólnej pamięci podręcznej (fonts), więc ponowne
+    dopasowanie po zmianie rozmiaru okna to głównie odczyty ze słownika.
+
+    Args:
+        master (tk.Misc): Widżet nadrzędny.
+        font_size (int): Początkowy (bazowy) rozmiar czcionki.
+    """
+    def __init__(self, master, font_size=20):
+        super().__init__(master, bg="black", highlightthickness=0)
+        self.font_size = font_size
+        self.rows = []  # identyfikatory elementów tekstowych wierszy
+        self.fit_texts = []  # tekst, do którego dopasowano czcionkę wiersza
+        self.row_sizes = []  # bieżący rozmiar czcionki wiersza
+        self.row_count = 0
+        self._x = 20  # lewa krawędź bloku wierszy
+        self._geometry = None  # ostatnio zastosowany (szerokość, wysokość, wiersze, czcionka)
+        for _ in range(BOARD_MAX_ROWS):
+            self._add_row()
+        self.bind("<Configure>", lambda event: self.layout())
+
+    def _add_row(self):
+        self.rows.append(self.create_text(0, 0, text="", fill="yellow", anchor="w", state="hidden",
+                                          font=fonts.get(BOARD_FONT, self.font_size, "bold")))
+        self.fit_texts.append("")
+        self.row_sizes.append(self.font_size)
+
+    def show_rows(self, count):
+        """
+        Czyści tablicę i pokazuje count pustych wierszy.
+
+        Args:
+            count (int): Liczba odpowiedzi pytania.
+        """
+        while len(self.rows) < count:
+            self._add_row()
+        for i, item in enumerate(self.rows):
+            self.itemconfig(item, text="", state="normal" if i < count else "hidden")
+            self.fit_texts[i] = f"{i+1}. {PLACEHOLDER}"
+        self.row_count = count
+        self._geometry = None
+        self.layout()
+
+    def hide(self):
+        """Ukrywa tablicę (elementy płótna pozostają do ponownego użycia)."""
+        self.grid_remove()
+        self.row_count = 0
+
+    def set_text(self, row, text):
+        """
+        Ustawia tekst wiersza (bez zmiany czcionki - zob. fit_row).
+
+        Args:
+            row (int): Indeks wiersza.
+            text (str): Tekst.
+        """
+        self.itemconfig(self.rows[row], text=text)
+
+    def fit_row(self, row, text):
+        """
+        Dobiera czcionkę wiersza tak, by tekst zmieścił się w szerokości płótna.
+
+        Wywoływane z pełnym tekstem przed animacją wypisywania, dzięki czemu
+        rozmiar nie zmienia się w trakcie odkrywania odpowiedzi.
+
+        Args:
+            row (int): Indeks wiersza.
+            text (str): Docelowy tekst wiersza.
+        """
+        self.fit_texts[row] = text
+        w = self.winfo_width()
+        if w <= 1:
+            return
+        size = fonts.fit_size(text, BOARD_FONT, w - self._x - 20, self.font_size,
+                              min_size=10, weight="bold")
+        if size != self.row_sizes[row]:
+            self.row_sizes[row] = size
+            self.itemconfig(self.rows[row], font=fonts.get(BOARD_FONT, size, "bold"))
+
+    def set_font_size(self, size):
+        """
+        Zmienia bazowy rozmiar czcionki wierszy.
+
+        Args:
+            size (int): Rozmiar czcionki.
+        """
+        if self.font_size != size:
+            self.font_size = size
+            self.layout()
+
+    def layout(self):
+        """Rozmieszcza wiersze na środku płótna, jeśli zmienił się rozmiar lub liczba wierszy."""
+        w = self.winfo_width()
+        h = self.winfo_height()
+        geometry = (w, h, self.row_count, self.font_size)
+        if geometry == self._geometry or w <= 1 or h <= 1:
+            return
+        self._geometry = geometry
+        slots = max(BOARD_MIN_ROWS, self.row_count)
+        row_height = min(fonts.linespace(BOARD_FONT, self.font_size, "bold") * BOARD_ROW_SPACING, h / slots)
+        top = (h - row_height * slots) / 2
+        # Blok wierszy jest wyśrodkowany według szerokości placeholdera, więc
+        # wpisywanie i odkrywanie odpowiedzi nie przesuwa tablicy
+        placeholder_width = fonts.measure(f"{slots}. {PLACEHOLDER}", BOARD_FONT, self.font_size, "bold")
+        self._x = max(20, (w - placeholder_width) / 2)
+        for i, item in enumerate(self.rows):
+            self.coords(item, self._x, top + row_height * (i + 0.5))
+            if i < self.row_count:
+                self.fit_row(i, self.fit_texts[i])
+
+
 class TVPanel(tk.Toplevel):
     """
     Panel telewizyjny do wyświetlania informacji i animacji w grze Familiada.
+
+    Panel subskrybuje zdarzenia gry (Game.events) i przerysowuje się raz
+    na obieg pętli Tk, niezależnie od liczby zmian stanu. Dźwięki odtwarza
+    panel administratora, więc kilka widoków nie dubluje efektów.
+
+    Args:
+        master (tk.Misc): Okno nadrzędne.
+        game (Game): Silnik gry.
+        subscribe (bool): Czy subskrybować zdarzenia gry (zdalny panel steruje
+            panelem bezpośrednio).
+        dot_matrix (bool): Czy rysować tablicę odpowiedzi jak wyświetlacz
+            punktowy (wymaga PIL, nie wymaga czcionki "familiada").
     """
-    def __init__(self, master, game, sound_manager):
+    def __init__(self, master, game, subscribe=True, dot_matrix=False):
         super().__init__(master)
         self.game = game
-        self.sound_manager = sound_manager
         self.fullscreen = False
         self.title("TV Panel - Familiada")
         self.configure(bg="black")
         self.geometry("1200x700")
         self.bind("<Double-Button-1>", self.toggle_fullscreen)
         self.bind("<Configure>", self.on_resize)
+        self.bind("<F12>", self.toggle_trace_overlay)
+        self.animator = Animator(self)
+        self.image_cache = ImageCache(self)
+        self._intro_token = 0  # zmienia się przy każdym czyszczeniu panelu centralnego
+        self._layout = {}  # ostatnio zastosowane rozmiary i położenia elementów
+        self._layout_after_id = None
 
         # Układ grid: trzy kolumny
         self.grid_rowconfigure(0, weight=1)
@@ -34,39 +365,123 @@ class TVPanel(tk.Toplevel):
         self.right_error_canvas.grid(row=0, column=2, sticky="ns")
 
         # Etykiety punktacji
-        self.left_score_label = tk.Label(self.left_error_canvas, text="", font=("familiada", 20, "bold"), fg="yellow", bg="black")
-        self.right_score_label = tk.Label(self.right_error_canvas, text="", font=("familiada", 20, "bold"), fg="yellow", bg="black")
+        self.left_score_label = tk.Label(self.left_error_canvas, text="", font=fonts.get("familiada", 20, "bold"), fg="yellow", bg="black")
+        self.right_score_label = tk.Label(self.right_error_canvas, text="", font=fonts.get("familiada", 20, "bold"), fg="yellow", bg="black")
         self.left_score_label.place_forget()
         self.right_score_label.place_forget()
 
         self.initialize_error_panels()
 
         # Duże X dla narady
-        self.left_big_x = tk.Label(self.left_error_canvas, text="X", font=("familiada", 220, "bold"), fg="red", bg="black")
-        self.right_big_x = tk.Label(self.right_error_canvas, text="X", font=("familiada", 220, "bold"), fg="red", bg="black")
+        self.left_big_x = tk.Label(self.left_error_canvas, text="X", font=fonts.get("familiada", BIG_X_FONT_SIZE, "bold"), fg="red", bg="black")
+        self.right_big_x = tk.Label(self.right_error_canvas, text="X", font=fonts.get("familiada", BIG_X_FONT_SIZE, "bold"), fg="red", bg="black")
         self.left_big_x.place_forget()
         self.right_big_x.place_forget()
+        self._layout['big_x_font'] = BIG_X_FONT_SIZE
 
         # Panel centralny
         self.center_frame = tk.Frame(self, bg="black")
         self.center_frame.grid(row=0, column=1, sticky="nsew")
         self.center_frame.grid_rowconfigure(0, weight=1)
         self.center_frame.grid_columnconfigure(0, weight=1)
-        self.answer_labels = []
+        if dot_matrix:
+            from dot_matrix import DotMatrixBoard
+            self.answer_board = DotMatrixBoard(self.center_frame)
+        else:
+            self.answer_board = AnswerBoard(self.center_frame, self.compute_layout()['answer_font'])
+        self._buzz_after_id = None
+
+        # Nakładka debugowania z histogramami opóźnień (F12)
+        self.trace_overlay = tk.Label(self, text="", font=fonts.get("Courier", 11), fg="lime", bg="black",
+                                      justify="left", anchor="nw")
+        self._trace_overlay_after_id = None
+
+        self._subscription = BatchedSubscriber(game.events, self, self.handle_events) if subscribe else None
+
+    def handle_events(self, events):
+        """
+        Aktualizuje panel po paczce zdarzeń gry z jednego obiegu pętli Tk.
+
+        Nowe pytanie unieważnia wcześniejsze odkrycia z tej samej paczki,
+        a panele błędów i wyniki są odświeżane jednokrotnie na końcu.
+
+        Args:
+            events (list): Zdarzenia GameEvent w kolejności publikacji.
+        """
+        question = None
+        reveals = []
+        refresh_errors = False
+        error_trace = None
+        for event in events:
+            if isinstance(event, AnswerRevealed):
+                reveals.append(event)
+                refresh_errors = True
+            elif isinstance(event, MistakeAdded):
+                refresh_errors = True
+                error_trace = event.trace or error_trace
+            elif isinstance(event, QuestionSelected):
+                question = event
+                reveals = []
+                refresh_errors = True
+            elif isinstance(event, GameReset):
+                question = None
+                reveals = []
+                refresh_errors = True
+                self.reset_screen()
+            elif isinstance(event, IntroStarted):
+                self.start_intro()
+            elif isinstance(event, ConsultationMistake):
+                self.show_big_x(event.team)
+            elif isinstance(event, BuzzerWon):
+                self.show_buzz_winner(event.team)
+            elif isinstance(event, TeamNamesChanged):
+                self.update_score_labels()
+        if question is not None:
+            if question.index is None:
+                self.reset_screen()
+            else:
+                self.animate_answers(question.trace)
+        for event in reveals:
+            self.animate_reveal_answer(event.index, event.trace)
+        if refresh_errors:
+            self.update_error_panels(error_trace)
+
+    def toggle_trace_overlay(self, event=None):
+        """Pokazuje lub ukrywa nakładkę z opóźnieniami akcji operatora."""
+        if self._trace_overlay_after_id is not None:
+            self.after_cancel(self._trace_overlay_after_id)
+            self._trace_overlay_after_id = None
+            self.trace_overlay.place_forget()
+        else:
+            self.trace_overlay.place(x=10, y=10)
+            self.trace_overlay.lift()
+            self._refresh_trace_overlay()
+
+    def _refresh_trace_overlay(self):
+        self.trace_overlay.config(text=tracer.format_summary())
+        self._trace_overlay_after_id = self.after(500, self._refresh_trace_overlay)
 
     def initialize_error_panels(self):
         """Inicjalizuje panele błędów z pustymi 'X'."""
         self.left_error_items = []
         self.right_error_items = []
-        positions = [200, 350, 500]
-        for pos in positions:
-            item = self.left_error_canvas.create_text(150, pos, text="X", font=("familiada", 90, "bold"), fill="black")
+        layout = self.compute_layout()
+        for pos in layout['error_y']:
+            item = self.left_error_canvas.create_text(layout['error_x'], pos, text="X",
+                                                      font=fonts.get("familiada", layout['error_font'], "bold"), fill="black")
             self.left_error_items.append(item)
-            item2 = self.right_error_canvas.create_text(150, pos, text="X", font=("familiada", 90, "bold"), fill="black")
+            item2 = self.right_error_canvas.create_text(layout['error_x'], pos, text="X",
+                                                        font=fonts.get("familiada", layout['error_font'], "bold"), fill="black")
             self.right_error_items.append(item2)
+        self._layout.update(error_x=layout['error_x'], error_y=layout['error_y'], error_font=layout['error_font'])
 
-    def update_error_panels(self):
-        """Aktualizuje widok paneli błędów na podstawie liczby błędów drużyn."""
+    def update_error_panels(self, trace=None):
+        """
+        Aktualizuje widok paneli błędów na podstawie liczby błędów drużyn.
+
+        Args:
+            trace (Trace): Ślad akcji operatora, która wywołała aktualizację.
+        """
         for i, item in enumerate(self.left_error_items):
             if i < self.game.team1_mistakes:
                 self.left_error_canvas.itemconfig(item, fill="yellow")
@@ -78,6 +493,9 @@ class TVPanel(tk.Toplevel):
             else:
                 self.right_error_canvas.itemconfig(item, fill="black")
         self.update_score_labels()
+        if trace:
+            trace.stage("tv_update")
+            self.after_idle(trace.stage, "tv_visible")
 
     def update_score_labels(self):
         """Aktualizuje etykiety punktacji."""
@@ -91,43 +509,135 @@ class TVPanel(tk.Toplevel):
         self.update_score_labels()
 
     def on_resize(self, event):
-        """Obsługuje zmianę rozmiaru okna."""
-        self.update_error_panels()
+        """
+        Obsługuje zmianę rozmiaru okna.
+
+        Zdarzenia <Configure> są zbierane i obsługiwane jednym przeliczeniem
+        układu na klatkę, zamiast przy każdym zdarzeniu okna i jego dzieci.
+        """
+        if event.widget is not self:
+            return
+        if self._layout_after_id is None:
+            self._layout_after_id = self.after(16, self.apply_layout)
+
+    def compute_layout(self):
+        """
+        Wylicza responsywne rozmiary czcionek i położenia elementów.
+
+        Returns:
+            dict: Rozmiary czcionek i położenia dla bieżącego rozmiaru okna.
+        """
+        h = self.winfo_height()
+        if h <= 1:
+            h = REFERENCE_HEIGHT
+        w = self.center_frame.winfo_width() if hasattr(self, "center_frame") else 0
+        if w <= 1:
+            w = 1200
+        scale = h / REFERENCE_HEIGHT
+        return {
+            'error_x': int(self.left_error_canvas.cget("width")) // 2,
+            'error_y': tuple(int(h * f) for f in ERROR_X_POSITIONS),
+            'error_font': max(30, int(ERROR_X_FONT_SIZE * scale)),
+            'big_x_font': max(60, int(BIG_X_FONT_SIZE * scale)),
+            # Największa czcionka, przy której 8 wierszy z placeholderem mieści się w oknie (także w 4K)
+            'answer_font': fonts.fit_size(f"{BOARD_MAX_ROWS}. {PLACEHOLDER}", BOARD_FONT, w - 40, 96,
+                                          min_size=12, weight="bold",
+                                          max_height=h / (BOARD_MAX_ROWS * BOARD_ROW_SPACING)),
+        }
+
+    def apply_layout(self):
+        """Przelicza układ i stosuje tylko te zmiany, które faktycznie zaszły."""
+        self._layout_after_id = None
+        layout = self.compute_layout()
+        old = self._layout
+        canvases = ((self.left_error_canvas, self.left_error_items),
+                    (self.right_error_canvas, self.right_error_items))
+        if layout['error_y'] != old.get('error_y') or layout['error_x'] != old.get('error_x'):
+            for canvas, items in canvases:
+                for item, y in zip(items, layout['error_y']):
+                    canvas.coords(item, layout['error_x'], y)
+        if layout['error_font'] != old.get('error_font'):
+            for canvas, items in canvases:
+                for item in items:
+                    canvas.itemconfig(item, font=fonts.get("familiada", layout['error_font'], "bold"))
+        if layout['big_x_font'] != old.get('big_x_font'):
+            for label in (self.left_big_x, self.right_big_x):
+                label.config(font=fonts.get("familiada", layout['big_x_font'], "bold"))
+        if layout['answer_font'] != old.get('answer_font'):
+            self.answer_board.set_font_size(layout['answer_font'])
+        if hasattr(self, "intro_text_item") and hasattr(self, "intro_canvas") and self.intro_canvas.winfo_exists():
+            w = self.intro_canvas.winfo_width()
+            h = self.intro_canvas.winfo_height()
+            if (w, h) != old.get('intro_size'):
+                self.intro_canvas.coords(self.intro_text_item, w / 2, h / 2)
+                self.intro_canvas.itemconfig(self.intro_text_item, width=w * 0.9,
+                                             font=fonts.get(BOARD_FONT, intro_font_size(w, h), "bold"))
+            layout['intro_size'] = (w, h)
+        self._layout = layout
 
     def toggle_fullscreen(self, event=None):
         """Przełącza tryb pełnoekranowy."""
         self.fullscreen = not self.fullscreen
         self.attributes("-fullscreen", self.fullscreen)
         self.update_idletasks()
-        self._start_intro_text()  # Ponowne wywołanie metody, aby dostosować napis
+        self._show_intro()  # Ponowne wyświetlenie intro, aby dostosować je do nowego rozmiaru
 
-    def start_intro(self):
-        """Rozpoczyna intro, wyświetlając logo lub napis 'FAMILIADA'."""
+    def _clear_center_frame(self):
+        """Przerywa animacje, ukrywa tablicę odpowiedzi i usuwa pozostałe widżety panelu centralnego."""
+        self.animator.cancel_all()
+        self._intro_token += 1
+        self.answer_board.hide()
         for widget in self.center_frame.winfo_children():
-            widget.destroy()
-        if self.game.intro_image_path and os.path.exists(self.game.intro_image_path) and Image and ImageTk:
-            try:
-                self.center_frame.update_idletasks()
-                w = self.center_frame.winfo_width() or 800
-                h = self.center_frame.winfo_height() or 600
-                pil_img = Image.open(self.game.intro_image_path)
-                pil_img = pil_img.resize((w, h), Image.ANTIALIAS)
-                self.intro_image = ImageTk.PhotoImage(pil_img)
-                lbl = tk.Label(self.center_frame, image=self.intro_image, bg="black")
-                lbl.place(relx=0.65, rely=0.5, anchor="center")
-            except Exception as e:
-                print("Błąd przy ładowaniu obrazu intro:", e)
+            if widget is not self.answer_board:
+                widget.destroy()
+
+    def _intro_image_available(self):
+        path = self.game.intro_image_path
+        return bool(path) and os.path.exists(path) and self.image_cache.available()
+
+    def _show_intro(self):
+        """Wyświetla logo z pamięci podręcznej (dekodując je w tle) albo napis 'FAMILIADA'."""
+        self._clear_center_frame()
+        if not self._intro_image_available():
+            self._start_intro_text()
+            return
+        self.center_frame.update_idletasks()
+        w = self.center_frame.winfo_width() or 800
+        h = self.center_frame.winfo_height() or 600
+        token = self._intro_token
+
+        def on_ready(photo):
+            if token != self._intro_token:
+                return  # w międzyczasie panel pokazał coś innego
+            self.intro_image = photo
+            lbl = tk.Label(self.center_frame, image=self.intro_image, bg="black")
+            lbl.place(relx=0.65, rely=0.5, anchor="center")
+            self._prefetch_other_mode_intro()
+
+        def on_error(error):
+            print("Błąd przy ładowaniu obrazu intro:", error)
+            if token == self._intro_token:
                 self._start_intro_text()
+
+        self.image_cache.request(self.game.intro_image_path, (w, h), on_ready, on_error)
+
+    def _prefetch_other_mode_intro(self):
+        """Przygotowuje w tle logo w rozmiarze drugiego trybu (okno/pełny ekran)."""
+        if self.fullscreen:
+            size = (1200, 700)
         else:
-            self._start_intro_text()
-        if self.sound_manager and self.sound_manager.sounds.get("start"):
-            self.sound_manager.play("start")
+            size = (self.winfo_screenwidth(), self.winfo_screenheight())
+        side = self.left_error_canvas.winfo_reqwidth() + self.right_error_canvas.winfo_reqwidth()
+        self.image_cache.prefetch(self.game.intro_image_path, (max(1, size[0] - side), size[1]))
+
+    def start_intro(self):
+        """Rozpoczyna intro, wyświetlając logo lub napis 'FAMILIADA'."""
+        self._show_intro()
         self.show_team_names()
 
     def _start_intro_text(self):
         """Wyświetla napis 'FAMILIADA' wraz z animowanymi paskami."""
-        for widget in self.center_frame.winfo_children():
-            widget.destroy()
+        self._clear_center_frame()
         if hasattr(self, "intro_canvas") and self.intro_canvas.winfo_exists():
             self.intro_canvas.destroy()
         self.intro_canvas = tk.Canvas(self.center_frame, bg="black", highlightthickness=0)
@@ -137,14 +647,15 @@ class TVPanel(tk.Toplevel):
         w = self.intro_canvas.winfo_width() or 1200
         h = self.intro_canvas.winfo_height() or 700
 
-        font_size = max(40, min(100, int(w / 10), int(h / 8)))
+        font_size = intro_font_size(w, h)
+        self._layout['intro_size'] = (w, h)
 
         if hasattr(self, "intro_text_item"):
             self.intro_canvas.delete(self.intro_text_item)
 
         self.intro_text_item = self.intro_canvas.create_text(
             w / 2, h / 2, text="FAMILIADA",
-            font=("familiada", font_size, "bold"),
+            font=fonts.get(BOARD_FONT, font_size, "bold"),
             fill="yellow", width=w * 0.9, anchor="center"
         )
         self.intro_canvas.update()
@@ -162,114 +673,121 @@ class TVPanel(tk.Toplevel):
                 fill="black", outline="black"
             )
             self.stripe_ids.append(rect)
-        self._animate_stripes(0, num_stripes, x1, x2, stripe_height)
+        self._animate_stripes(x1, x2)
 
-    def _animate_stripes(self, i, num_stripes, x1, x2, stripe_height, step=80):
-        if i < num_stripes:
-            self._animate_stripe(self.stripe_ids[i], x1, x2, step,
-                                 lambda: self._animate_stripes(i+1, num_stripes, x1, x2, stripe_height, step))
+    def _animate_stripes(self, x1, x2, step=80, step_delay=0.03):
+        """Kolejno zsuwa paski zasłaniające napis, każdy o step pikseli co step_delay sekund."""
+        self.animator.cancel_tag("intro")
+        duration = max(1, -(-(x2 - x1) // step)) * step_delay
+        for i, stripe_id in enumerate(self.stripe_ids):
+            self.animator.add(duration, self._stripe_update(stripe_id, x1, x2),
+                              on_done=lambda sid=stripe_id: self.intro_canvas.delete(sid),
+                              delay=i * duration, tag="intro")
 
-    def _animate_stripe(self, stripe_id, current_x, target_x, step, callback=None):
-        if not self.intro_canvas.winfo_exists():
-            return
-        try:
-            coords = self.intro_canvas.coords(stripe_id)
-        except tk.TclError:
-            return
-        if current_x < target_x:
-            new_x = min(current_x + step, target_x)
-            _, y1, x2, y2 = coords
-            self.intro_canvas.coords(stripe_id, new_x, y1, x2, y2)
-            self.after(30, self._animate_stripe, stripe_id, new_x, target_x, step, callback)
-        else:
-            self.intro_canvas.delete(stripe_id)
-            if callback:
-                callback()
+    def _stripe_update(self, stripe_id, x1, x2):
+        canvas = self.intro_canvas
+        def update(progress):
+            coords = canvas.coords(stripe_id)
+            if coords:
+                _, y1, right, y2 = coords
+                canvas.coords(stripe_id, x1 + (x2 - x1) * progress, y1, right, y2)
+        return update
 
-    def animate_answers(self):
-        """Animacja wyświetlania pytań i odpowiedzi na panelu."""
+    def animate_answers(self, trace=None):
+        """
+        Animacja wyświetlania pytań i odpowiedzi na panelu.
+
+        Args:
+            trace (Trace): Ślad akcji operatora, która wywołała animację.
+        """
         if self.game.current_question is None:
             return
-        for widget in self.center_frame.winfo_children():
-            widget.destroy()
-        self.answers_frame = tk.Frame(self.center_frame, bg="black")
-        self.answers_frame.pack(expand=True)
-        self.answers_container = tk.Frame(self.answers_frame, bg="black")
-        self.answers_container.pack(expand=True)
-        top_spacer = tk.Frame(self.answers_container, bg="black")
-        top_spacer.pack(expand=True)
-        self.answer_labels = []
-
-        w = self.center_frame.winfo_width() or 1200
-        base_font_size = 36
-        responsive_font_size = min(base_font_size, max(20, int(w / 40)))
-
-        answers = self.game.current_question['answers']
-        placeholders = [f"{i+1}. --------------------" for i in range(len(answers))]
-        for idx in range(len(answers)):
-            row_frame = tk.Frame(self.answers_container, bg="black")
-            row_frame.pack(anchor="center", pady=5, fill="x")
-            lbl = tk.Label(row_frame, text="", font=("familiada", responsive_font_size, "bold"),
-                           bg="black", fg="yellow", anchor="w", justify="left")
-            lbl.pack(side="left", padx=(20, 0), fill="x", expand=True)
-            self.answer_labels.append(lbl)
-        bottom_spacer = tk.Frame(self.answers_container, bg="black")
-        bottom_spacer.pack(expand=True)
-        self._animate_placeholders_seq(0, placeholders, delay=20)
-        self.update_error_panels()
-
-    def _animate_placeholders_seq(self, idx, placeholders, delay=20):
-        if idx < len(placeholders):
-            self._animate_label_text_seq(self.answer_labels[idx], 0, placeholders[idx], delay,
-                                          lambda: self._animate_placeholders_seq(idx+1, placeholders, delay))
-
-    def _animate_label_text_seq(self, label, index, full_text, delay, callback=None):
-        if index <= len(full_text):
-            label.config(text=full_text[:index])
-            self.after(delay, self._animate_label_text_seq, label, index+1, full_text, delay, callback)
-        else:
-            if callback:
-                callback()
+        self._clear_center_frame()
+        responsive_font_size = self.compute_layout()['answer_font']
+        self._layout['answer_font'] = responsive_font_size
+        self.answer_board.set_font_size(responsive_font_size)
+
+        answers = self.game.current_question.answers
+        self.answer_board.show_rows(len(answers))
+        self.answer_board.grid(row=0, column=0, sticky="nsew")
+        placeholders = [f"{i+1}. {PLACEHOLDER}" for i in range(len(answers))]
+        self._animate_placeholders_seq(placeholders, delay=0.02, trace=trace)
+
+    def _animate_placeholders_seq(self, placeholders, delay=0.02, trace=None):
+        """Wypisuje kolejno placeholdery odpowiedzi, po delay sekund na znak."""
+        start = 0.0
+        last = len(placeholders) - 1
+        board = self.answer_board
+        for idx, text in enumerate(placeholders):
+            duration = (len(text) + 1) * delay
+            update = typing_tween(lambda value, row=idx: board.set_text(row, value), text)
+            on_done = None
+            if trace:
+                if idx == 0:
+                    update = traced_tween(update, trace, self)
+                if idx == last:
+                    on_done = lambda: trace.stage("tv_done")
+            self.animator.add(duration, update, on_done=on_done, delay=start, tag=f"answer-{idx}")
+            start += duration
+
+    def animate_reveal_answer(self, idx, trace=None):
+        """
+        Animacja odkrywania odpowiedzi dla danego indeksu.
 
-    def animate_reveal_answer(self, idx):
-        """Animacja odkrywania odpowiedzi dla danego indeksu."""
-        if self.game.current_question is None or idx >= len(self.game.current_question['answers']):
+        Args:
+            idx (int): Indeks odpowiedzi.
+            trace (Trace): Ślad akcji operatora, która wywołała animację.
+        """
+        if self.game.current_question is None or idx >= len(self.game.current_question.answers):
             return
-        ans_data = self.game.current_question['answers'][idx]
+        ans_data = self.game.current_question.answers[idx]
         prefix = f"{idx+1}. "
-        final_text = f"{ans_data['answer']} - {ans_data['points']} pkt"
-        label = self.answer_labels[idx]
-        label.config(text=prefix)
-        self._animate_reveal_portion(label, prefix, 0, final_text, delay=10)
-        self.update_error_panels()
-
-    def _animate_reveal_portion(self, label, prefix, index, final_text, delay=10):
-        if index <= len(final_text):
-            animated = final_text[:index]
-            label.config(text=prefix + animated)
-            self.after(delay, self._animate_reveal_portion, label, prefix, index+1, final_text, delay)
-        else:
-            label.config(text=prefix + final_text)
+        final_text = f"{ans_data.text} - {ans_data.points} pkt"
+        if idx >= self.answer_board.row_count:
+            return  # tablica pokazuje inny ekran (np. intro)
+        self.answer_board.fit_row(idx, prefix + final_text)
+        self.answer_board.set_text(idx, prefix)
+        # Odkrycie przerywa trwającą animację placeholdera w tym wierszu
+        tag = f"answer-{idx}"
+        self.animator.cancel_tag(tag)
+        update = typing_tween(lambda value: self.answer_board.set_text(idx, value), final_text, prefix)
+        on_done = None
+        if trace:
+            update = traced_tween(update, trace, self)
+            on_done = lambda: trace.stage("tv_done")
+        self.animator.add((len(final_text) + 1) * 0.01, update, on_done=on_done, tag=tag)
 
     def show_big_x(self, team):
         """
-        Wyświetla duże czerwone "X" dla danej drużyny, odtwarza dźwięk błędu,
-        a samo "X" znika po upływie 2 sekund.
+        Wyświetla duże czerwone "X" dla danej drużyny, które znika po upływie 2 sekund.
         """
         display_time = 2000
         if team == 'left':
             self.left_big_x.place(relx=0.5, rely=0.5, anchor="center")
-            if self.sound_manager:
-                self.sound_manager.play("error")
             self.after(display_time, lambda: self.left_big_x.place_forget())
         elif team == 'right':
             self.right_big_x.place(relx=0.5, rely=0.5, anchor="center")
-            if self.sound_manager:
-                self.sound_manager.play("error")
             self.after(display_time, lambda: self.right_big_x.place_forget())
 
+    def show_buzz_winner(self, team, display_time=1500):
+        """
+        Podświetla wynik drużyny, która pierwsza nacisnęła przycisk.
+
+        Args:
+            team (str): 'left' lub 'right'.
+            display_time (int): Czas podświetlenia w ms.
+        """
+        label = self.left_score_label if team == 'left' else self.right_score_label
+        other = self.right_score_label if team == 'left' else self.left_score_label
+        other.config(fg="yellow", bg="black")
+        label.config(fg="black", bg="yellow")
+        if not label.winfo_manager():
+            self.show_team_names()
+        if self._buzz_after_id is not None:
+            self.after_cancel(self._buzz_after_id)
+        self._buzz_after_id = self.after(display_time, lambda: label.config(fg="yellow", bg="black"))
+
     def reset_screen(self):
         """Resetuje ekran centralny i wyświetla nazwy drużyn."""
-        for widget in self.center_frame.winfo_children():
-            widget.destroy()
+        self._clear_center_frame()
         self.show_team_names()
@@ -1,9 +1,29 @@
 import os
+import re
 import sys
+import unicodedata
+
+# Aktywna paczka pytań (QuestionPack), której zasoby zastępują pliki z folderu assets
+_resource_pack = None
+
+def set_resource_pack(pack):
+    """
+    Ustawia paczkę pytań, z której resource_path pobiera zasoby.
+
+    Args:
+        pack (QuestionPack): Paczka lub None, aby używać tylko folderu assets.
+    """
+    global _resource_pack
+    _resource_pack = pack
 
 def resource_path(filename):
     """
-    Zwraca poprawną ścieżkę do plików zasobów w folderze assets.
+    Zwraca poprawną ścieżkę do plików zasobów.
+
+    Zasób z aktywnej paczki pytań ma pierwszeństwo; gdy paczka go nie
+    zawiera, używany jest plik z dołączonego folderu assets. Pierwsze użycie
+    zasobu z paczki kopiuje go na dysk, więc w wątku Tk wywołuj tę funkcję
+    tylko przed pokazaniem okien.
 
     Args:
         filename (str): Nazwa pliku zasobów.
@@ -11,8 +31,46 @@ def resource_path(filename):
     Returns:
         str: Pełna ścieżka do pliku.
     """
+    pack = _resource_pack
+    if pack is not None:
+        path = pack.resource_path(filename)
+        if path is not None:
+            return path
     if getattr(sys, 'frozen', False):  # aplikacja spakowana przez PyInstaller
         base_path = sys._MEIPASS
     else:
         base_path = os.path.abspath(".")
     return os.path.join(base_path, "assets", filename)
+
+# Litery, których unicodedata nie rozkłada na literę bazową i znak diakrytyczny
+_FOLD_TABLE = str.maketrans({"ł": "l", "Ł": "l"})
+
+def fold_text(text):
+    """
+    Normalizuje tekst do porównań: małe litery, bez polskich znaków
+    diakrytycznych i bez nadmiarowych spacji.
+
+    Args:
+        text (str): Tekst do znormalizowania.
+
+    Returns:
+        str: Znormalizowany tekst.
+    """
+    text = unicodedata.normalize("NFKD", text.translate(_FOLD_TABLE).casefold())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.split())
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+def fold_words(text):
+    """
+    Normalizuje tekst jak fold_text, dodatkowo zamieniając interpunkcję
+    na spacje (np. "Plaża!" i "plaza" dają ten sam wynik).
+
+    Args:
+        text (str): Tekst do znormalizowania.
+
+    Returns:
+        str: Znormalizowany tekst (słowa rozdzielone pojedynczą spacją).
+    """
+    return fold_text(_PUNCTUATION.sub(" ", text))
@@ -0,0 +1,89 @@
+import tkinter as tk
+from batched_view import BatchedSubscriber
+from fonts import fonts
+
+
+class HostMonitor(tk.Toplevel):
+    """
+    Monitor prowadzącego: pełna lista odpowiedzi bieżącego pytania,
+    z zaznaczeniem odkrytych, oraz wyniki i błędy drużyn.
+
+    Args:
+        master (tk.Misc): Okno nadrzędne.
+        game (Game): Silnik gry.
+    """
+    def __init__(self, master, game):
+        super().__init__(master)
+        self.game = game
+        self.title("Monitor prowadzącego - Familiada")
+        self.geometry("700x500")
+        self.configure(bg="#202020")
+        self.question_label = tk.Label(self, text="", font=fonts.get("Arial", 20, "bold"), fg="white", bg="#202020",
+                                       wraplength=660, justify="left")
+        self.question_label.pack(anchor="w", padx=20, pady=(20, 10))
+        self.answers_frame = tk.Frame(self, bg="#202020")
+        self.answers_frame.pack(fill="both", expand=True, padx=20)
+        self.answer_labels = []  # pula etykiet odpowiedzi
+        self.status_label = tk.Label(self, text="", font=fonts.get("Arial", 16), fg="yellow", bg="#202020")
+        self.status_label.pack(pady=10)
+        self._subscription = BatchedSubscriber(game.events, self, self.handle_events)
+        self.refresh()
+
+    def handle_events(self, events):
+        """Przerysowuje monitor raz dla paczki zdarzeń gry."""
+        self.refresh()
+
+    def refresh(self):
+        """Aktualizuje monitor na podstawie stanu gry."""
+        game = self.game
+        question = game.current_question
+        answers = question.answers if question is not None else ()
+        self.question_label.config(text=question.text if question is not None else "Brak wybranego pytania")
+        while len(self.answer_labels) < len(answers):
+            label = tk.Label(self.answers_frame, font=fonts.get("Arial", 16), bg="#202020", anchor="w")
+            self.answer_labels.append(label)
+        for idx, label in enumerate(self.answer_labels):
+            if idx >= len(answers):
+                label.pack_forget()
+                continue
+            ans = answers[idx]
+            revealed = game.is_revealed(idx)
+            label.config(text=f"{idx+1}. {ans.text} - {ans.points} pkt" + ("  ✓" if revealed else ""),
+                         fg="#808080" if revealed else "white")
+            if not label.winfo_manager():
+                label.pack(anchor="w", fill="x")
+        self.status_label.config(
+            text=f"{game.team1_name}: {game.team1_score} ({game.team1_mistakes} X)    "
+                 f"{game.team2_name}: {game.team2_score} ({game.team2_mistakes} X)")
+
+
+class ScoreboardStrip(tk.Toplevel):
+    """
+    Pasek wyników: nazwy drużyn, punkty i błędy w jednym wierszu.
+
+    Args:
+        master (tk.Misc): Okno nadrzędne.
+        game (Game): Silnik gry.
+    """
+    def __init__(self, master, game):
+        super().__init__(master)
+        self.game = game
+        self.title("Wyniki - Familiada")
+        self.geometry("1200x80")
+        self.configure(bg="black")
+        self.left_label = tk.Label(self, text="", font=fonts.get("familiada", 28, "bold"), fg="yellow", bg="black")
+        self.left_label.pack(side="left", padx=20)
+        self.right_label = tk.Label(self, text="", font=fonts.get("familiada", 28, "bold"), fg="yellow", bg="black")
+        self.right_label.pack(side="right", padx=20)
+        self._subscription = BatchedSubscriber(game.events, self, self.handle_events)
+        self.refresh()
+
+    def handle_events(self, events):
+        """Przerysowuje pasek raz dla paczki zdarzeń gry."""
+        self.refresh()
+
+    def refresh(self):
+        """Aktualizuje pasek na podstawie stanu gry."""
+        game = self.game
+        self.left_label.config(text=f"{game.team1_name} {game.team1_score}  " + "X" * game.team1_mistakes)
+        self.right_label.config(text="X" * game.team2_mistakes + f"  {game.team2_score} {game.team2_name}")
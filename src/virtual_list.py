@@ -0,0 +1,200 @@
+import tkinter as tk
+from fonts import fonts
+
+
+class VirtualList(tk.Frame):
+    """
+    Wirtualizowana lista tekstów rysowana na Canvasie.
+
+    Lista rysuje tylko wiersze widoczne na ekranie, a ich teksty pobiera na
+    żądanie przez funkcję fetch_rows. Dzięki temu działa płynnie także dla
+    banków z dziesiątkami tysięcy pytań. Zaznaczenie zgłaszane jest
+    zdarzeniem <<ListboxSelect>>, tak jak w tk.Listbox.
+
+    Args:
+        master (tk.Widget): Widżet nadrzędny.
+        row_count (callable): Funkcja zwracająca liczbę wierszy.
+        fetch_rows (callable): Funkcja (start, stop) zwracająca etykiety wierszy.
+        width (int): Szerokość listy w znakach.
+        height (int): Wysokość listy w wierszach.
+        font (tuple): Czcionka wierszy.
+    """
+    CACHE_LIMIT = 2000
+
+    def __init__(self, master, row_count, fetch_rows, width=60, height=10, font=("Arial", 14)):
+        super().__init__(master)
+        self.row_count = row_count
+        self.fetch_rows = fetch_rows
+        self.font = fonts.get(*font)
+        self.row_height = self.font.metrics("linespace") + 4
+        self.first_row = 0
+        self.selected = None
+        self._count = 0
+        self._cache = {}
+        self._items = []
+
+        self.canvas = tk.Canvas(self, width=self.font.measure("0") * width,
+                                height=self.row_height * height, bg="white",
+                                highlightthickness=1, highlightbackground="#a0a0a0")
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.canvas.bind("<Configure>", lambda e: self._rebuild_pool())
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda e: self.yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.yview("scroll", 1, "units"))
+        self.reload()
+
+    @property
+    def visible_rows(self):
+        """int: Liczba wierszy mieszczących się na Canvasie."""
+        height = self.canvas.winfo_height()
+        if height <= 1:
+            height = int(self.canvas.cget("height"))
+        return max(1, height // self.row_height)
+
+    def _rebuild_pool(self):
+        """Tworzy pulę elementów Canvasa dla widocznych wierszy."""
+        needed = self.visible_rows + 1
+        while len(self._items) < needed:
+            y = len(self._items) * self.row_height
+            rect = self.canvas.create_rectangle(0, y, 0, y + self.row_height, width=0, fill="")
+            text = self.canvas.create_text(4, y + self.row_height / 2, anchor="w",
+                                           font=self.font, text="")
+            self._items.append((rect, text))
+        while len(self._items) > needed:
+            rect, text = self._items.pop()
+            self.canvas.delete(rect)
+            self.canvas.delete(text)
+        self._scroll_to(self.first_row)
+
+    def _fetch(self, start, stop):
+        """Zwraca teksty wierszy z zakresu, pobierając brakujące jednym zapytaniem."""
+        missing = [i for i in range(start, stop) if i not in self._cache]
+        if missing:
+            if len(self._cache) > self.CACHE_LIMIT:
+                self._cache.clear()
+            for offset, title in enumerate(self.fetch_rows(missing[0], missing[-1] + 1)):
+                self._cache[missing[0] + offset] = title
+        return [self._cache.get(i, "") for i in range(start, stop)]
+
+    def _redraw(self):
+        """Odświeża teksty i zaznaczenie w puli widocznych wierszy."""
+        stop = min(self._count, self.first_row + len(self._items))
+        titles = self._fetch(self.first_row, stop)
+        width = self.canvas.winfo_width()
+        for offset, (rect, text) in enumerate(self._items):
+            index = self.first_row + offset
+            y = offset * self.row_height
+            if index < stop:
+                label = titles[offset]
+                fill = "#c3c3c3" if index == self.selected else ""
+            else:
+                label = ""
+                fill = ""
+            self.canvas.coords(rect, 0, y, width, y + self.row_height)
+            self.canvas.itemconfig(rect, fill=fill)
+            self.canvas.itemconfig(text, text=label)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        if self._count == 0:
+            self.scrollbar.set(0, 1)
+            return
+        first = self.first_row / self._count
+        last = min(1.0, (self.first_row + self.visible_rows) / self._count)
+        self.scrollbar.set(first, last)
+
+    def _scroll_to(self, row):
+        max_first = max(0, self._count - self.visible_rows)
+        self.first_row = max(0, min(int(row), max_first))
+        self._redraw()
+
+    def yview(self, *args):
+        """Obsługuje przewijanie w protokole tk.Scrollbar."""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._scroll_to(float(args[1]) * self._count)
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self.visible_rows
+            self._scroll_to(self.first_row + amount)
+
+    def _on_mousewheel(self, event):
+        self.yview("scroll", -1 if event.delta > 0 else 1, "units")
+
+    def _on_click(self, event):
+        index = self.first_row + int(event.y // self.row_height)
+        if index < self._count:
+            self.selected = index
+            self._redraw()
+            self.event_generate("<<ListboxSelect>>")
+
+    def curselection(self):
+        """
+        Zwraca zaznaczony wiersz w formacie zgodnym z tk.Listbox.
+
+        Returns:
+            tuple: Krotka z indeksem zaznaczonego wiersza lub pusta krotka.
+        """
+        return () if self.selected is None else (self.selected,)
+
+    def selection_clear(self):
+        """Usuwa zaznaczenie."""
+        self.selected = None
+        self._redraw()
+
+    def reload(self):
+        """Odczytuje liczbę wierszy od nowa i czyści pamięć podręczną tekstów."""
+        self._count = self.row_count()
+        self._cache.clear()
+        if self.selected is not None and self.selected >= self._count:
+            self.selected = None
+        self._scroll_to(self.first_row)
+
+    def row_inserted(self, index):
+        """
+        Informuje listę o wstawieniu wiersza.
+
+        Args:
+            index (int): Indeks wstawionego wiersza.
+        """
+        self._count += 1
+        # Etykiety mogą zawierać numer wiersza, więc dalsze wiersze pobieramy od nowa
+        self._cache = {i: t for i, t in self._cache.items() if i < index}
+        if self.selected is not None and self.selected >= index:
+            self.selected += 1
+        if index < self.first_row + len(self._items):
+            self._redraw()
+        else:
+            self._update_scrollbar()
+
+    def row_removed(self, index):
+        """
+        Informuje listę o usunięciu wiersza.
+
+        Args:
+            index (int): Indeks usuniętego wiersza.
+        """
+        self._count -= 1
+        self._cache = {i: t for i, t in self._cache.items() if i < index}
+        if self.selected == index:
+            self.selected = None
+        elif self.selected is not None and self.selected > index:
+            self.selected -= 1
+        self._scroll_to(self.first_row)
+
+    def row_changed(self, index):
+        """
+        Informuje listę o zmianie tekstu wiersza.
+
+        Args:
+            index (int): Indeks zmienionego wiersza.
+        """
+        self._cache.pop(index, None)
+        if self.first_row <= index < self.first_row + len(self._items):
+            self._redraw()
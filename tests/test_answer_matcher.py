@@ -0,0 +1,83 @@
+"""
+Testy dopasowania wypowiedzi do odpowiedzi (answer_matcher).
+
+Sugestia jest odkrywana na antenie jednym naciśnięciem Enter, więc testy
+pilnują przede wszystkim, by różne słowa o wspólnym początku nie były
+uznawane za odmiany.
+
+Uruchomienie:
+    python -m pytest tests
+"""
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import pytest  # noqa: E402
+from answer_matcher import AnswerMatcher, MIN_SCORE, _bigrams, _word_similarity  # noqa: E402
+from models import Question  # noqa: E402
+from utils import fold_words  # noqa: E402
+
+
+def similarity(a, b):
+    a, b = fold_words(a), fold_words(b)
+    return _word_similarity(a, _bigrams(a), b, _bigrams(b))
+
+
+@pytest.fixture
+def matcher():
+    question = Question("Co można zobaczyć w mieście?", [
+        ("Samochód", 30), ("Kościół", 25), ("Morze", 20), ("Sałatka jarzynowa", 10),
+    ])
+    matcher = AnswerMatcher()
+    matcher.prepare(question)
+    return matcher
+
+
+@pytest.mark.parametrize("a, b", [
+    ("samolot", "samochód"),
+    ("kość", "kościół"),
+    ("kościół", "kość"),
+    ("morski", "morze"),
+])
+def test_different_words_with_common_prefix_are_not_inflections(a, b):
+    assert similarity(a, b) < MIN_SCORE
+
+
+@pytest.mark.parametrize("a, b", [
+    ("morze", "morzem"),
+    ("samochód", "samochodem"),
+    ("plaża", "plaży"),
+    ("rower", "rowerami"),
+    ("sałatka", "sałatki"),
+])
+def test_inflections_match(a, b):
+    assert similarity(a, b) >= 0.8
+
+
+@pytest.mark.parametrize("text", ["samolot", "kość", "morski"])
+def test_rank_does_not_suggest_different_word(matcher, text):
+    assert matcher.rank(text) == []
+
+
+@pytest.mark.parametrize("text, index", [
+    ("samochodem", 0),
+    ("samochud", 0),
+    ("koscioł", 1),
+    ("chyba nad morzem", 2),
+    ("sałatkę jarzynową", 3),
+])
+def test_rank_suggests_matching_answer(matcher, text, index):
+    assert matcher.rank(text, limit=1)[0][0] == index
+
+
+def test_rank_skips_revealed_answers(matcher):
+    assert matcher.rank("samochód", exclude_mask=0b1) == []
+
+
+def test_synonyms_set_after_prepare_apply_to_current_question(matcher):
+    assert matcher.rank("auto") == []
+    matcher.set_synonyms([["auto", "samochód"]])
+    assert matcher.rank("auto", limit=1) == [(0, 1.0)]
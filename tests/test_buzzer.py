@@ -0,0 +1,155 @@
+"""
+Testy serwera przycisków (buzzer) na lokalnym porcie.
+
+Sprawdzają szacowanie zegara, rozstrzyganie naciśnięć klientów z
+przestawionym zegarem oraz to, że klient odsyłający stare lub spóźnione
+odpowiedzi na ping nie może cofnąć swojego naciśnięcia.
+
+Uruchomienie:
+    python -m pytest tests
+"""
+import os
+import sys
+import time
+import queue
+import asyncio
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import pytest  # noqa: E402
+from buzzer import (BuzzerClient, BuzzerServer, ClockEstimator, DECISION_MARGIN, PING_TIMEOUT,  # noqa: E402
+                    SYNC_BURST, SYNC_BURST_INTERVAL)
+
+HOST = "127.0.0.1"
+# Czas na pierwsze pomiary zegara po połączeniu
+SYNC_WAIT = SYNC_BURST * SYNC_BURST_INTERVAL + 0.2
+# Odstęp między naciśnięciami w testach - dużo większy niż opóźnienia na localhost
+PRESS_GAP = 0.03
+
+
+class SkewedClock:
+    """Zegar klienta przesunięty o stałą liczbę sekund względem zegara serwera."""
+    def __init__(self, skew):
+        self.skew = skew
+
+    def __call__(self):
+        return time.monotonic() + self.skew
+
+
+class StalePongClient(BuzzerClient):
+    """Klient, który na każdy ping poza pierwszym odsyła numer i stary czas pierwszego pingu."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._first_ping = None
+
+    def handle(self, message):
+        if message.get('t') == 'ping':
+            if self._first_ping is None:
+                self._first_ping = message['id']
+                self.send({'t': 'pong', 'id': message['id'], 'c': self.clock()})
+            else:
+                self.send({'t': 'pong', 'id': self._first_ping, 's': 0.0, 'c': self.clock()})
+            return
+        super().handle(message)
+
+
+class LatePongClient(BuzzerClient):
+    """Klient, który wstrzymuje odpowiedzi na ping, by zawyżyć zmierzone RTT."""
+    def handle(self, message):
+        if message.get('t') == 'ping':
+            loop = asyncio.get_event_loop()
+            loop.call_later(PING_TIMEOUT + 0.05, self.send,
+                            {'t': 'pong', 'id': message['id'], 'c': self.clock()})
+            return
+        super().handle(message)
+
+
+@pytest.fixture
+def server():
+    results = queue.Queue()
+    server = BuzzerServer(HOST, 0, on_result=results.put)
+    server.start()
+    server.results = results
+    yield server
+    server.stop()
+
+
+async def connect(server, team, name, client_cls=BuzzerClient, clock=None):
+    kwargs = {} if clock is None else {'clock': clock}
+    client = client_cls(HOST, server.port, team, name, **kwargs)
+    reader = await client.connect()
+    client.task = asyncio.ensure_future(client.run(reader))
+    return client
+
+
+async def play_round(server, first, second, second_press_time=None):
+    """Uzbraja przyciski, naciska first, a po PRESS_GAP second; zwraca listę naciśnięć."""
+    server.arm()
+    await asyncio.wait_for(asyncio.gather(first.armed.wait(), second.armed.wait()), timeout=2)
+    first.buzz()
+    await asyncio.sleep(PRESS_GAP)
+    second.buzz(second_press_time)
+    presses = await asyncio.get_running_loop().run_in_executor(None, server.results.get, True, 2)
+    # Naciśnięcie spóźnione po decyzji trafia do następnej rundy - odrzucamy je
+    await asyncio.sleep(PRESS_GAP)
+    return presses
+
+
+async def close(*clients):
+    for client in clients:
+        client.close()
+    await asyncio.gather(*(client.task for client in clients), return_exceptions=True)
+
+
+def test_clock_estimator_uses_sample_with_lowest_rtt():
+    clock = ClockEstimator()
+    clock.add(sent=10.0, client_time=110.5, received=10.2)  # zator: RTT 0.2
+    clock.add(sent=11.0, client_time=111.01, received=11.02)  # RTT 0.02
+    assert clock.offset == pytest.approx(100.0)
+    assert clock.max_one_way == pytest.approx(0.1)
+
+
+def test_clock_estimator_clamps_press_to_measured_delay():
+    clock = ClockEstimator()
+    clock.add(sent=10.0, client_time=110.01, received=10.02)
+    # Naciśnięcie "z przyszłości" jest przycinane do chwili odbioru
+    assert clock.to_server_time(125.0, received=20.0) == 20.0
+    # Naciśnięcie cofnięte o sekundę - najwyżej o zmierzone RTT i margines
+    assert clock.to_server_time(119.0, received=20.0) == pytest.approx(20.0 - 0.02 - DECISION_MARGIN)
+    assert clock.to_server_time(119.995, received=20.0) == pytest.approx(19.995)
+
+
+@pytest.mark.parametrize("skew", [-3600.0, 250.0])
+def test_skewed_clock_client_is_ordered_by_server_time(server, skew):
+    async def scenario():
+        honest = await connect(server, 'left', "Anna")
+        skewed = await connect(server, 'right', "Bartek", clock=SkewedClock(skew))
+        await asyncio.sleep(SYNC_WAIT)
+        try:
+            first = await play_round(server, skewed, honest)
+            second = await play_round(server, honest, skewed)
+        finally:
+            await close(honest, skewed)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first[0].team == 'right'
+    assert second[0].team == 'left'
+
+
+@pytest.mark.parametrize("client_cls", [StalePongClient, LatePongClient])
+def test_client_with_stale_pongs_cannot_backdate_press(server, client_cls):
+    async def scenario():
+        honest = await connect(server, 'left', "Anna")
+        cheater = await connect(server, 'right', "Cezary", client_cls=client_cls)
+        await asyncio.sleep(SYNC_WAIT + PING_TIMEOUT)
+        try:
+            # Oszust naciska po uczciwym zawodniku, ale podaje czas sprzed sekundy
+            return await play_round(server, honest, cheater, second_press_time=cheater.clock() - 1.0)
+        finally:
+            await close(honest, cheater)
+
+    presses = asyncio.run(scenario())
+    assert presses[0].team == 'left'
@@ -0,0 +1,172 @@
+"""
+Testy protokołu zdalnego panelu TV (remote_display) na lokalnym porcie.
+
+Sprawdzają, że ekran, który nałoży na pustą kopię gry pełny stan (snap),
+a po nim kolejne różnice, ma ten sam stan co gra operatora - także po
+ponownym połączeniu w trakcie rundy.
+
+Uruchomienie:
+    python -m pytest tests
+"""
+import os
+import sys
+import json
+import socket
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import pytest  # noqa: E402
+from game import Game  # noqa: E402
+from remote_display import RemoteTVServer, apply_message, game_state, state_delta  # noqa: E402
+
+HOST = "127.0.0.1"
+TIMEOUT = 2.0
+
+
+class IdleWidget:
+    """Zastępuje pętlę Tk: wywołania after_idle czekają na run_idle()."""
+    def __init__(self):
+        self._idle = {}
+        self._next_id = 0
+
+    def bind(self, sequence, callback, add=None):
+        pass
+
+    def after_idle(self, callback):
+        self._next_id += 1
+        self._idle[self._next_id] = callback
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self._idle.pop(after_id, None)
+
+    def run_idle(self):
+        callbacks, self._idle = list(self._idle.values()), {}
+        for callback in callbacks:
+            callback()
+
+
+class Screen:
+    """Zdalny ekran: czyta linie JSON z gniazda i nakłada je na własną kopię gry."""
+    def __init__(self, port):
+        self.sock = socket.create_connection((HOST, port), timeout=TIMEOUT)
+        self.file = self.sock.makefile('rb')
+        self.game = Game()
+        self.messages = []
+
+    def receive(self):
+        """Odbiera i nakłada jedną wiadomość (pomija wiadomości podtrzymujące)."""
+        while True:
+            line = self.file.readline()
+            assert line.endswith(b"\n")
+            message = json.loads(line)
+            if 'p' not in message:
+                break
+        self.messages.append(message)
+        apply_message(self.game, message)
+        return message
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+
+@pytest.fixture
+def game():
+    game = Game()
+    game.add_question("Co można zobaczyć w mieście?", [("Samochód", 30), ("Kościół", 25), ("Morze", 20)])
+    game.add_question("Wymień przysmaki na weselu", [("Sałatka jarzynowa", 40), ("Rolada", 30)])
+    return game
+
+
+@pytest.fixture
+def server(game):
+    widget = IdleWidget()
+    server = RemoteTVServer(game, widget, HOST, 0)
+    server.start()
+    server.widget = widget
+    yield server
+    server.stop()
+
+
+def test_state_delta_contains_only_changed_fields(game):
+    old = game_state(game)
+    game.set_current_question(0)
+    game.reveal_answer(1, 'left')
+    delta = state_delta(old, game_state(game))
+    assert set(delta) == {'q', 'm', 's'}
+    assert delta['m'] == 0b10
+    assert delta['s'] == [25, 0]
+
+
+def test_apply_message_replays_snapshot_and_deltas(game):
+    replica = Game()
+    state = game_state(game)
+    apply_message(replica, dict(state, snap=1))
+    for change in (lambda: game.set_current_question(1),
+                   lambda: game.reveal_answer(0, 'right'),
+                   lambda: game.add_mistake('left'),
+                   lambda: game.set_team_names("Kowalscy", "Nowakowie"),
+                   lambda: game.set_buzz_winner('left', "Anna")):
+        change()
+        new_state = game_state(game)
+        apply_message(replica, state_delta(state, new_state))
+        state = new_state
+    assert game_state(replica) == game_state(game)
+    assert replica.current_question.answers[0].text == "Sałatka jarzynowa"
+
+
+def test_server_sends_snapshot_then_one_delta_per_batch(game, server):
+    game.set_current_question(0)
+    server.widget.run_idle()
+    screen = Screen(server.port)
+    try:
+        snapshot = screen.receive()
+        assert snapshot['snap'] == 1
+        assert game_state(screen.game) == game_state(game)
+
+        # Kilka zmian w jednej akcji operatora - jedna wiadomość z różnicą
+        game.reveal_answer(0, 'left')
+        game.add_mistake('right')
+        server.widget.run_idle()
+        delta = screen.receive()
+        assert 'snap' not in delta
+        assert set(delta) == {'m', 's', 'e'}
+        assert game_state(screen.game) == game_state(game)
+
+        game.consultation_mistake('left')
+        server.widget.run_idle()
+        assert screen.receive() == {'ev': [["x", "left"]]}
+    finally:
+        screen.close()
+
+
+def test_reconnected_screen_gets_current_state(game, server):
+    first = Screen(server.port)
+    try:
+        first.receive()
+        game.set_current_question(1)
+        game.reveal_answer(1, 'right')
+        server.widget.run_idle()
+        first.receive()
+    finally:
+        first.close()
+
+    second = Screen(server.port)
+    try:
+        snapshot = second.receive()
+        assert snapshot['snap'] == 1
+        assert game_state(second.game) == game_state(game) == game_state(first.game)
+    finally:
+        second.close()
+
+
+def test_start_failure_raises_and_unsubscribes(game, server):
+    other = RemoteTVServer(game, IdleWidget(), HOST, server.port)
+    with pytest.raises(OSError):
+        other.start()
+    # Nieudany serwer nie zbiera już zdarzeń gry
+    game.set_current_question(0)
+    assert other._subscription._pending == []
@@ -0,0 +1,57 @@
+"""
+Testy agregatora ankiet (survey).
+
+Uruchomienie:
+    python -m pytest tests
+"""
+import os
+import sys
+import random
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import pytest  # noqa: E402
+import survey  # noqa: E402
+from survey import aggregate, cap_distinct, scale_points  # noqa: E402
+from collections import Counter  # noqa: E402
+
+
+@pytest.mark.parametrize("counts", [
+    [9960, 10, 10, 10, 10],
+    [500, 3, 2, 1, 1, 1],
+    [34, 33, 33],
+])
+def test_normalized_points_sum_to_100_with_minimum_of_one(counts):
+    points = scale_points(counts, sum(counts), normalize=True)
+    assert sum(points) == 100
+    assert min(points) >= 1
+
+
+def test_points_are_percent_of_respondents():
+    assert scale_points([50, 25, 1], 200) == [25, 12, 1]
+
+
+def test_cap_distinct_keeps_most_common_and_reports_rest():
+    counter = Counter({"a": 5, "b": 3, "c": 1, "d": 1})
+    assert cap_distinct(counter, limit=2) == (2, 2)
+    assert counter == Counter({"a": 5, "b": 3})
+
+
+def test_answer_rare_in_each_range_but_frequent_overall_is_kept(tmp_path, monkeypatch):
+    # "Rower" jest rzadki w każdym małym zakresie pliku, ale w sumie drugi po "Morze"
+    rows = []
+    for i in range(40):
+        rows += [("Gdzie na wakacje?", "Morze")] * 3 + [("Gdzie na wakacje?", f"Inne {i}")]
+        rows.append(("Gdzie na wakacje?", "Rower"))
+    random.Random(1).shuffle(rows)
+    path = tmp_path / "odpowiedzi.csv"
+    path.write_text("question,answer\n" + "".join(f"{q},{a}\n" for q, a in rows), encoding="utf-8")
+    monkeypatch.setattr(survey, "MAX_RANGE_BYTES", 256)
+
+    questions, totals, pruned = aggregate([str(path)], top=2, workers=2, max_distinct=2)
+
+    assert totals["Gdzie na wakacje?"] == 200
+    assert questions == [("Gdzie na wakacje?", [("Morze", 60), ("Rower", 20)])]
+    assert pruned["Gdzie na wakacje?"] == (40, 40)